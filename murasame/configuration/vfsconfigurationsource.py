@@ -21,6 +21,9 @@
 Contains the implementation of the VFSConfigurationSource class.
 """
 
+# Runtime Imports
+from concurrent.futures import ThreadPoolExecutor
+
 # Murasame Imports
 from murasame.exceptions import InvalidInputError
 from murasame.utils import SystemLocator
@@ -30,6 +33,9 @@ from murasame.configuration.configurationgroup import ConfigurationGroup
 from murasame.configuration.configurationlist import ConfigurationList
 from murasame.configuration.configurationattribute import ConfigurationAttribute
 
+# The maximum amount of threads to use when loading configuration files.
+MAX_LOADER_THREADS = 32
+
 class VFSConfigurationSource(ConfigurationSource):
 
     """Configuration source that uses a VFS directory as the source.
@@ -76,7 +82,7 @@ class VFSConfigurationSource(ConfigurationSource):
 
         # Pylint doesn't recognize the instance() member of Singleton.
         # pylint: disable=no-member
-        vfs = SystemLocator.instance().get_provicer(VFSAPI)
+        vfs = SystemLocator.instance().get_provider(VFSAPI)
 
         if not vfs:
             raise RuntimeError(f'VFS provider cannot be retrieved, cannot '
@@ -88,14 +94,24 @@ class VFSConfigurationSource(ConfigurationSource):
             raise InvalidInputError(f'VFS path {self._path} does not exist.')
 
         # Get all configuration files from the VFS node
-        config_files = node.get_all_files(recursive=True, filter='.conf')
+        config_files = node.get_all_files(recursive=True, suffix='.conf')
+
+        if not config_files:
+            self.debug('No configuration files were found.')
+            return
+
+        # Load the content of the configuration files in parallel, since
+        # retrieving the resources is I/O bound. Parsing is done on the
+        # calling thread.
+        max_workers = min(MAX_LOADER_THREADS, len(config_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            resources = list(executor.map(
+                VFSConfigurationSource._load_resource, config_files))
 
-        # Load all configuration files individually
-        for config_file in config_files:
-            self.debug(f'Loading configuration from {config_file.Name} '
-                       f'(v{config_file.get_resource().Version})...')
-            resource = config_file.get_resource().Resource
-            self._parse(content=resource)
+        for config_file, (version, content) in zip(config_files, resources):
+            self.debug(f'Parsing configuration from {config_file.Name} '
+                       f'(v{version})...')
+            self._parse(content=content)
 
         self.debug('Configuration has been loaded.')
 
@@ -110,6 +126,24 @@ class VFSConfigurationSource(ConfigurationSource):
         raise NotImplementedError(f'ConfigurationSource.save() has to be '
                                   f'implemented in {self.__class__.__name__}.')
 
+    @staticmethod
+    def _load_resource(config_file: 'VFSNode') -> tuple:
+
+        """Loads the latest resource of a configuration file.
+
+        Args:
+            config_file (VFSNode): The VFS node of the configuration file.
+
+        Returns:
+            tuple: The version and the content of the resource.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        resource = config_file.get_resource()
+        return resource.Version, resource.Resource
+
     def _parse(self, content: dict) -> None:
 
         """Parses the content of the provided dictionary.
@@ -121,13 +155,15 @@ class VFSConfigurationSource(ConfigurationSource):
             Attila Kovacs
         """
 
+        # Dispatch on the exact type of the value, everything that is not a
+        # configuration group or list is parsed as an attribute
+        get_parser = _CONTENT_PARSERS.get
+
         for key, value in content.items():
-            if isinstance(value, dict):
-                self._parse_dictionary(key, value)
-            elif isinstance(value, list):
-                self._parse_list(key, value)
-            else:
-                self._parse_attribute(key, value)
+            parser = get_parser(type(value))
+            if parser is None:
+                parser = _find_content_parser(value)
+            parser(self, key, value)
 
     def _parse_dictionary(self, key: str , value: dict) -> None:
 
@@ -189,3 +225,32 @@ class VFSConfigurationSource(ConfigurationSource):
         dummy = ConfigurationAttribute(name=key,
                                        value=value,
                                        data_type=data_type)
+
+# Parser functions to use for the container types that can appear in a
+# configuration file.
+_CONTENT_PARSERS = \
+{
+    dict: VFSConfigurationSource._parse_dictionary,
+    list: VFSConfigurationSource._parse_list
+}
+
+def _find_content_parser(value: object) -> 'Callable':
+
+    """Returns the parser function to use for a value whose exact type has no
+    parser, e.g. subclasses of dict and list such as OrderedDict.
+
+    Args:
+        value (object): The value to parse.
+
+    Returns:
+        Callable: The parser function of the value.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    for content_type, parser in _CONTENT_PARSERS.items():
+        if isinstance(value, content_type):
+            return parser
+
+    return VFSConfigurationSource._parse_attribute
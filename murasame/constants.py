@@ -23,6 +23,7 @@ Contains constants used by the entire framework.
 
 # Runtime Imports
 import os
+import sys
 
 ## ============================================================================
 ##  DEFAULT DIRECTORIES
@@ -35,25 +36,32 @@ MURASAME_DEFAULT_LOCALIZATION_PATH = '/localization'
 ##  LOG CHANNELS
 ## ============================================================================
 
-# List of log channels used by the framework
+# List of log channels used by the framework. The channel names are interned,
+# so looking them up in the channel registry of the log system can be resolved
+# by identity.
 
-MURASAME_APPLICATION_LOG_CHANNEL = 'murasame.application'
+MURASAME_APPLICATION_LOG_CHANNEL = sys.intern('murasame.application')
 
-MURASAME_CONFIGURATION_LOG_CHANNEL = 'murasame.configuration'
+MURASAME_CONFIGURATION_LOG_CHANNEL = sys.intern('murasame.configuration')
 
-MURASAME_DEBUG_LOG_CHANNEL = 'murasame.debug'
+MURASAME_DEBUG_LOG_CHANNEL = sys.intern('murasame.debug')
 
-MURASAME_EVENT_LOG_CHANNEL = 'murasame.event'
+MURASAME_EVENT_LOG_CHANNEL = sys.intern('murasame.event')
 
-MURASAME_EXCEPTIONS_LOG_CHANNEL = 'murasame.exceptions'
+MURASAME_EXCEPTIONS_LOG_CHANNEL = sys.intern('murasame.exceptions')
 
-MURASAME_LOCALIZER_LOG_CHANNEL = 'murasame.localizer'
+MURASAME_LOCALIZER_LOG_CHANNEL = sys.intern('murasame.localizer')
 
-MURASAME_PAL_LOG_CHANNEL = 'murasame.pal'
+MURASAME_PAL_LOG_CHANNEL = sys.intern('murasame.pal')
 
-MURASAME_SOCKET_LOG_CHANNEL = 'murasame.pal.networking.socket'
+MURASAME_SOCKET_LOG_CHANNEL = sys.intern('murasame.pal.networking.socket')
 
-MURASAME_VFS_LOG_CHANNEL = 'murasame.pal.vfs'
+MURASAME_VFS_LOG_CHANNEL = sys.intern('murasame.pal.vfs')
+
+# Name of the environment variable that sets the lowest log level log writers
+# can write, e.g. 'INFO'. The log methods of the levels below it are replaced
+# with empty functions when the log writer module is imported.
+MURASAME_MIN_LOG_LEVEL_VARIABLE = 'MURASAME_MIN_LOG_LEVEL'
 
 ## ============================================================================
 ##  COMMON CONSTANTS
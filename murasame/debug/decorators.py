@@ -22,12 +22,13 @@ Contains the implementation of debug decorators.
 """
 
 # Runtime Imports
+from functools import wraps
 from typing import Any, Callable
 from time import perf_counter
 
 # Murasame Imports
 from murasame.constants import MURASAME_DEBUG_LOG_CHANNEL
-from murasame.log import LogWriter
+from murasame.log import LogLevels, get_log_writer
 
 def debug(function: Callable) -> Any:
 
@@ -43,14 +44,21 @@ def debug(function: Callable) -> Any:
         Attila Kovacs
     """
 
+    logger = get_log_writer(channel_name=MURASAME_DEBUG_LOG_CHANNEL,
+                            cache_entries=True)
+    log_debug = logger.debug
+    call_message = f'Calling {function.__name__}'
+
+    @wraps(function)
     def wrapper(*args, **kwargs) -> Any:
-        logger = LogWriter(channel_name=MURASAME_DEBUG_LOG_CHANNEL,
-                           cache_entries=True)
-        logger.debug(f'Calling {function.__name__}')
-        logger.debug(f'    - Args: {args}')
-        logger.debug(f'    - Kwargs: {kwargs}')
+        if not logger.is_enabled_for(LogLevels.DEBUG):
+            return function(*args, **kwargs)
+
+        log_debug(call_message)
+        log_debug(f'    - Args: {args!r}')
+        log_debug(f'    - Kwargs: {kwargs!r}')
         result = function(*args, **kwargs)
-        logger.debug(f'   > Result: {result}')
+        log_debug(f'   > Result: {result!r}')
         return result
     return wrapper
 
@@ -69,9 +77,14 @@ def measure(function: Callable) -> Any:
         Attila Kovacs
     """
 
+    logger = get_log_writer(channel_name=MURASAME_DEBUG_LOG_CHANNEL,
+                            cache_entries=True)
+
+    @wraps(function)
     def wrapper(*args, **kwargs) -> Any:
-        logger = LogWriter(channel_name=MURASAME_DEBUG_LOG_CHANNEL,
-                           cache_entries=True)
+        if not logger.is_enabled_for(LogLevels.DEBUG):
+            return function(*args, **kwargs)
+
         start_time = perf_counter()
         result = function(*args, **kwargs)
         end_time = perf_counter()
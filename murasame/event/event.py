@@ -26,6 +26,7 @@ from typing import Callable
 
 # Murasame Imports
 from murasame.constants import MURASAME_EVENT_LOG_CHANNEL
+from murasame.log.loglevels import LogLevels
 from murasame.log.logwriter import LogWriter
 
 class EventSystem(LogWriter):
@@ -34,11 +35,16 @@ class EventSystem(LogWriter):
 
     Attributes:
         _events (dict): The events currently registered in the event system.
+            Each event maps to a dictionary whose keys are the registered
+            handlers, which keeps subscription order while allowing handlers
+            to be removed in constant time.
 
     Authors:
         Attila Kovacs
     """
 
+    __slots__ = ('_events',)
+
     @property
     def NumEvents(self) -> int:
 
@@ -78,10 +84,7 @@ class EventSystem(LogWriter):
             Attila Kovacs
         """
 
-        if not self.has_event(event_name=event_name):
-            return 0
-
-        return len(self._events[event_name])
+        return len(self._events.get(event_name, ()))
 
     def has_event(self, event_name: str) -> bool:
 
@@ -98,10 +101,7 @@ class EventSystem(LogWriter):
             Attila Kovacs
         """
 
-        if event_name in self._events:
-            return True
-
-        return  False
+        return event_name in self._events
 
     def subscribe(
         self,
@@ -122,14 +122,16 @@ class EventSystem(LogWriter):
 
         self.debug(f'Subscribing to event {event_name}...')
 
-        # Create a new event handler list if the event is not yet subscribed to
-        if not self.has_event(event_name):
-            self._events[event_name] = []
+        # Create a new event handler registry if the event is not yet
+        # subscribed to
+        handlers = self._events.get(event_name)
+        if handlers is None:
+            handlers = self._events[event_name] = {}
             self.debug(f'Event {event_name} has no subscribers yet, creating '
                        f'event in the event system.')
 
-        # Add the handler to the handler list
-        self._events[event_name].append(cb_handler_function)
+        # Add the handler to the handler registry
+        handlers[cb_handler_function] = None
         self.debug(f'Subscribed to {event_name}.')
 
     def unsubscribe(
@@ -149,12 +151,12 @@ class EventSystem(LogWriter):
 
         self.debug(f'Unsubscribing from {event_name}...')
 
-        if not self.has_event(event_name):
+        handlers = self._events.get(event_name)
+        if handlers is None:
             self.debug(f'Event {event_name} doesn\'t exist, nothing to do.')
             return
 
-        handlers = self._events[event_name]
-        handlers.remove(cb_handler_function)
+        handlers.pop(cb_handler_function, None)
 
         if len(handlers) == 0:
             self.debug(f'No handlers left for event {event_name}, removing '
@@ -180,18 +182,24 @@ class EventSystem(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Sending event {event_name} with parameters: '
-                   f'{args} {kwargs}.')
+        # Only format the event parameters if they are going to be logged
+        if self.is_enabled_for(LogLevels.DEBUG):
+            self.debug(f'Sending event {event_name} with parameters: '
+                       f'{args!r} {kwargs!r}.')
 
-        if not self.has_event(event_name):
+        handlers = self._events.get(event_name)
+        if not handlers:
             self.debug(f'Event {event_name} has no subscribers yet, nothing '
                        f'to do.')
             return
 
-        handlers = self._events[event_name]
         self.debug(f'Sending event {event_name} to {len(handlers)} '
                    f'handlers.')
-        for handler in handlers:
-            handler(args, kwargs)
+        if kwargs:
+            for handler in handlers:
+                handler(*args, **kwargs)
+        else:
+            for handler in handlers:
+                handler(*args)
 
         self.debug(f'Event {event_name} was sent.')
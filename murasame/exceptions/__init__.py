@@ -21,7 +21,7 @@
 Contains the various exceptions used by the framework.
 """
 
-from murasame.exceptions.errorcodes import ErrorCodes
+from murasame.exceptions.errorcodes import ErrorCode, ErrorCodes, ErrorCodesEnum
 from murasame.exceptions.exception import FrameworkError
 from murasame.exceptions.alreadyregisterederror import AlreadyRegisteredError
 from murasame.exceptions.alreadyexistserror import AlreadyExistsError
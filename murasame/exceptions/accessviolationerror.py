@@ -35,9 +35,11 @@ class AccessViolationError(FrameworkError):
         Attila Kovacs
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  message: str = '',
-                 errorcode: ErrorCodes = ErrorCodes.PERMISSION_ERROR,
+                 errorcode: int = ErrorCodes.PERMISSION_ERROR,
                  package: str = __package__,
                  file: str = '',
                  line: int = '',
@@ -50,7 +52,7 @@ class AccessViolationError(FrameworkError):
         Args:
             message (str): The user message that clarifies the exception.
 
-            errorcode (ErrorCodes): The platform error code that identifies the
+            errorcode (int): The platform error code that identifies the
                 actual error.
 
             package (str): Name of the Python package that raised the
@@ -68,17 +70,13 @@ class AccessViolationError(FrameworkError):
 
             inspect_caller (bool): Whether or not the caller should be
                 inspected to retrieve the raising location of the exception.
-                Should only be 'True' in the topmost exception in the
-                inheritance tree, otherwise should be passed down as 'False'.
+                The caller is not inspected if file, line and function are
+                all provided.
 
         Authors:
             Attila Kovacs
         """
 
-        # Inspect the caller if requested
-        if inspect_caller:
-            file, function, line = self.inspect_exception()
-
         super().__init__(message=message,
                          errorcode=errorcode,
                          package=package,
@@ -86,4 +84,4 @@ class AccessViolationError(FrameworkError):
                          line=line,
                          function=function,
                          wrapped_exception=wrapped_exception,
-                         inspect_caller=False)
+                         inspect_caller=inspect_caller)
@@ -34,6 +34,8 @@ class DatabaseOperationError(FrameworkError):
         Attila Kovacs
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  message: str = '',
                  errorcode: int = ErrorCodes.DATABASE_ERROR,
@@ -49,7 +51,7 @@ class DatabaseOperationError(FrameworkError):
         Args:
             message (str): The user message that clarifies the exception.
 
-            errorcode (ErrorCodes): The platform error code that identifies the
+            errorcode (int): The platform error code that identifies the
                 actual error.
 
             package (str): Name of the Python package that raised the
@@ -67,17 +69,13 @@ class DatabaseOperationError(FrameworkError):
 
             inspect_caller (bool): Whether or not the caller should be
                 inspected to retrieve the raising location of the exception.
-                Should only be 'True' in the topmost exception in the
-                inheritance tree, otherwise should be passed down as 'False'.
+                The caller is not inspected if file, line and function are
+                all provided.
 
         Authors:
             Attila Kovacs
         """
 
-        # Inspect the caller if requested
-        if inspect_caller:
-            file, function, line = self.inspect_exception()
-
         super().__init__(message=message,
                          errorcode=errorcode,
                          package=package,
@@ -85,4 +83,4 @@ class DatabaseOperationError(FrameworkError):
                          line=line,
                          function=function,
                          wrapped_exception=wrapped_exception,
-                         inspect_caller=False)
+                         inspect_caller=inspect_caller)
@@ -22,12 +22,151 @@ Contains the list of error codes supported by the framework.
 """
 
 # Runtime Imports
-from enum import IntEnum, auto
+from enum import IntEnum
+from typing import Iterator
 
-class ErrorCodes(IntEnum):
+class ErrorCode(int):
+
+    """A single error code of the framework.
+
+    Error codes are plain integers that also carry the name they were defined
+    with, so they can be compared and formatted as integers without going
+    through the enum machinery.
+
+    Attributes:
+        name (str): Name of the error code.
+
+        value (int): Integer value of the error code.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    def __new__(cls, value: int, name: str) -> 'ErrorCode':
+
+        """Creates a new ErrorCode instance.
+
+        Args:
+            value (int): Integer value of the error code.
+
+            name (str): Name of the error code.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        error_code = int.__new__(cls, value)
+        error_code.name = name
+        error_code.value = value
+        return error_code
+
+    def __getnewargs__(self) -> tuple:
+
+        """Provides the arguments to recreate the error code when unpickling.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        return int(self), self.name
+
+    def __repr__(self) -> str:
+
+        """Returns the representation of the error code.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        return f'<ErrorCodes.{self.name}: {int(self)}>'
+
+    # Error codes are converted to string as integers
+    __str__ = int.__repr__
+
+class ErrorCodesMeta(type):
+
+    """Metaclass that turns the integer attributes of ErrorCodes into
+    ErrorCode instances when the class is created.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    def __new__(mcs, name: str, bases: tuple, namespace: dict) -> type:
+
+        """Creates the error code class.
+
+        Args:
+            name (str): Name of the class.
+
+            bases (tuple): Base classes of the class.
+
+            namespace (dict): The attributes defined by the class.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        members = {}
+
+        for key, value in list(namespace.items()):
+            if key.isupper() and isinstance(value, int):
+                namespace[key] = members[value] = ErrorCode(value, key)
+
+        cls = super().__new__(mcs, name, bases, namespace)
+        cls._value2member_map_ = members
+
+        return cls
+
+    def __call__(cls, value: int) -> ErrorCode:
+
+        """Returns the error code with the given integer value.
+
+        Args:
+            value (int): The integer value of the error code.
+
+        Raises:
+            ValueError: Raised if there is no error code with the given value.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        try:
+            return cls._value2member_map_[value]
+        except KeyError:
+            raise ValueError(
+                f'{value} is not a valid {cls.__name__}') from None
+
+    def __iter__(cls) -> Iterator[ErrorCode]:
+
+        """Iterates over the error codes in the order of their definition.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        return iter(cls._value2member_map_.values())
+
+    def __len__(cls) -> int:
+
+        """Returns the amount of error codes.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        return len(cls._value2member_map_)
+
+class ErrorCodes(metaclass=ErrorCodesMeta):
 
     """Contains the list of error codes supported by the framework.
 
+    Every error code is an ErrorCode instance, which is a subclass of int, so
+    it can be passed around and compared as a plain integer. The class can be
+    iterated and called with an integer value to look up an error code like an
+    enum.
+
     Arguments:
         NOT_SET: Default value when an exact error code is not set.
 
@@ -60,15 +199,43 @@ class ErrorCodes(IntEnum):
         Attila Kovacs
     """
 
-    NOT_SET = auto()
-    INPUT_ERROR = auto()
-    PERMISSION_ERROR = auto()
-    RUNTIME_ERROR = auto()
-    ALREADY_REGISTERED = auto()
-    ALREADY_EXISTS = auto()
-    NOT_REGISTERED = auto()
-    UNCAUGHT_EXCEPTION = auto()
-    MISSING_REQUIREMENT = auto()
-    INSTALL_FAILED = auto()
-    LICENSE_ERROR = auto()
-    DATABASE_ERROR = auto()
+    NOT_SET = 1
+    INPUT_ERROR = 2
+    PERMISSION_ERROR = 3
+    RUNTIME_ERROR = 4
+    ALREADY_REGISTERED = 5
+    ALREADY_EXISTS = 6
+    NOT_REGISTERED = 7
+    UNCAUGHT_EXCEPTION = 8
+    MISSING_REQUIREMENT = 9
+    INSTALL_FAILED = 10
+    LICENSE_ERROR = 11
+    DATABASE_ERROR = 12
+
+# Every error code as a module level integer constant as well, so they can be
+# compared against without any attribute lookup.
+NOT_SET = int(ErrorCodes.NOT_SET)
+INPUT_ERROR = int(ErrorCodes.INPUT_ERROR)
+PERMISSION_ERROR = int(ErrorCodes.PERMISSION_ERROR)
+RUNTIME_ERROR = int(ErrorCodes.RUNTIME_ERROR)
+ALREADY_REGISTERED = int(ErrorCodes.ALREADY_REGISTERED)
+ALREADY_EXISTS = int(ErrorCodes.ALREADY_EXISTS)
+NOT_REGISTERED = int(ErrorCodes.NOT_REGISTERED)
+UNCAUGHT_EXCEPTION = int(ErrorCodes.UNCAUGHT_EXCEPTION)
+MISSING_REQUIREMENT = int(ErrorCodes.MISSING_REQUIREMENT)
+INSTALL_FAILED = int(ErrorCodes.INSTALL_FAILED)
+LICENSE_ERROR = int(ErrorCodes.LICENSE_ERROR)
+DATABASE_ERROR = int(ErrorCodes.DATABASE_ERROR)
+
+# String representation of the error codes to use when logging exceptions,
+# computed once when the module is loaded.
+ERROR_CODE_STRINGS = \
+{
+    error_code: f'ErrorCodes.{error_code.name}' for error_code in ErrorCodes
+}
+
+# Enum version of the error codes for code that needs a real IntEnum, e.g.
+# to use enum specific features or isinstance checks.
+ErrorCodesEnum = IntEnum(
+    'ErrorCodesEnum',
+    {error_code.name: int(error_code) for error_code in ErrorCodes})
@@ -23,18 +23,30 @@ Contains the implementation of the basic exception class.
 
 # Runtime Imports
 import logging
-import inspect
+import sys
 
 # Murasame Imports
 from murasame.constants import MURASAME_EXCEPTIONS_LOG_CHANNEL
-from murasame.exceptions.errorcodes import ErrorCodes
+from murasame.exceptions.errorcodes import ErrorCodes, ERROR_CODE_STRINGS
+
+# The logger used to log framework exceptions.
+LOGGER = logging.getLogger(MURASAME_EXCEPTIONS_LOG_CHANNEL)
+
+# Template of the log message written when a framework exception is raised.
+EXCEPTION_LOG_TEMPLATE = \
+    'Framework exception was raised. Type: %s\n' \
+    'Error Code: %s\n' \
+    'Package: %s\n' \
+    'Location: %s (line %s)\n' \
+    'Function: %s()\n' \
+    'Message: %s'
 
 class FrameworkError(Exception):
 
     """The base class for all Murasame framework errors.
 
     Attributes:
-        errorcode (ErrorCodes): The platform error code that identifies the
+        errorcode (int): The platform error code that identifies the
             exact issue.
 
         errormessage (str): Custom error message specified by the user when
@@ -55,9 +67,31 @@ class FrameworkError(Exception):
         Attila Kovacs
     """
 
+    __slots__ = ('errorcode',
+                 'package',
+                 'file',
+                 'line',
+                 'function',
+                 'wrapped_exception')
+
+    @property
+    def errormessage(self) -> str:
+
+        """Custom error message specified by the user when raising the
+        exception.
+
+        The message is stored by Exception as the first argument of the
+        exception.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        return self.args[0] if self.args else ''
+
     def __init__(self,
                  message: str = '',
-                 errorcode: ErrorCodes = ErrorCodes.NOT_SET,
+                 errorcode: int = ErrorCodes.NOT_SET,
                  package: str = __package__,
                  file: str = '',
                  line: str = '',
@@ -70,7 +104,7 @@ class FrameworkError(Exception):
         Args:
             message (str): The user message that clarifies the exception.
 
-            errorcode (ErrorCodes): The platform error code that identifies the
+            errorcode (int): The platform error code that identifies the
                 actual error.
 
             package (str): Name of the Python package that raised the
@@ -88,8 +122,9 @@ class FrameworkError(Exception):
 
             inspect_caller (bool): Whether or not the caller should be
                 inspected to retrieve the raising location of the exception.
-                Should only be 'True' in the topmost exception in the
-                inheritance tree, otherwise should be passed down as 'False'.
+                The caller is not inspected if file, line and function are
+                all provided. Derived exceptions should pass it down
+                unchanged.
 
         Authors:
             Attila Kovacs
@@ -98,7 +133,6 @@ class FrameworkError(Exception):
         super().__init__(message)
 
         self.errorcode = errorcode
-        self.errormessage = message
         self.package = package
         self.file = file
         self.line = line
@@ -107,28 +141,106 @@ class FrameworkError(Exception):
 
         # When inspect_caller is set to True, then the caller function will be
         # inspected to retrieve the correct location of where the exception
-        # was raised.
-        if inspect_caller:
-            self.file, self.function, self.line = self.inspect_exception()
-
-        # Log the exception
-        logger = logging.getLogger(MURASAME_EXCEPTIONS_LOG_CHANNEL)
-        logger.error(f'Framework exception was raised. '
-                     f'Type: {self.__class__.__name__}\n'
-                     f'Error Code: {self.errorcode}\n'
-                     f'Package: {self.package}\n'
-                     f'Location: {self.file} (line {self.line})\n'
-                     f'Function: {self.function}()\n'
-                     f'Message: {self.errormessage}')
+        # was raised, unless the location has been provided by the caller.
+        # The constructors of derived exceptions are skipped.
+        if inspect_caller and not (file and line and function):
+            # pylint: disable=protected-access
+            frame = sys._getframe(1)
+            while frame.f_code.co_name == '__init__' \
+                    and frame.f_locals.get('self') is self:
+                frame = frame.f_back
+            self.file, self.function, self.line = \
+                self.inspect_exception(frame=frame)
+
+        # Log the exception, formatting of the message is left to the logger
+        # and only happens if the message is actually written
+        if LOGGER.isEnabledFor(logging.ERROR):
+            errorcode_string = ERROR_CODE_STRINGS.get(self.errorcode)
+            if errorcode_string is None:
+                # Log unknown error codes as raw integers, so enum types
+                # provided by the caller don't go through their own formatting
+                errorcode = self.errorcode
+                if isinstance(errorcode, int):
+                    errorcode = int(errorcode)
+                errorcode_string = str(errorcode)
+
+            LOGGER.error(EXCEPTION_LOG_TEMPLATE,
+                         self.__class__.__name__,
+                         errorcode_string,
+                         self.package,
+                         self.file,
+                         self.line,
+                         self.function,
+                         self.errormessage)
+
+    def __reduce__(self) -> tuple:
+
+        """Provides the state of the exception for pickling and copying.
+
+        BaseException only preserves the arguments and the instance
+        dictionary of the exception, so the slot attributes are added to the
+        state.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        reduced = super().__reduce__()
+        state = dict(reduced[2]) if len(reduced) > 2 and reduced[2] else {}
+
+        for name in FrameworkError.__slots__:
+            if hasattr(self, name):
+                state[name] = getattr(self, name)
+
+        return reduced[0], reduced[1], state
+
+    @classmethod
+    def raise_at(cls, message: str = '', **kwargs) -> None:
+
+        """Raises a new exception of this type at the location of the caller.
+
+        The location of the caller is captured once here and passed to the
+        exception, so the constructor doesn't have to inspect the stack.
+
+        Args:
+            message (str): The user message that clarifies the exception.
+
+            kwargs: Additional arguments to pass to the constructor of the
+                exception, e.g. errorcode or wrapped_exception.
+
+        Raises:
+            FrameworkError: The created exception, an instance of the class
+                this function was called on.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        # pylint: disable=protected-access
+        frame = sys._getframe(1)
+        code = frame.f_code
+
+        raise cls(message=message,
+                  file=code.co_filename,
+                  line=frame.f_lineno,
+                  function=code.co_name,
+                  inspect_caller=False,
+                  **kwargs)
 
     @staticmethod
-    def inspect_exception() -> tuple:
+    def inspect_exception(frame: 'FrameType' = None) -> tuple:
 
         """Inspects the caller frame of the expcetion to determine the location
         in the code where it has been called.
 
-        This function should be called in the constructor of the top level
-        of the derived exception to generate the proper location info.
+        The constructor of FrameworkError calls this function with the frame
+        that created the exception, skipping the constructors of the derived
+        exceptions.
+
+        Args:
+            frame (FrameType): The frame to inspect. If not provided, the
+                caller of the function calling inspect_exception() is
+                inspected.
 
         Returns:
             The function returns three values, the first is the filename where
@@ -140,12 +252,16 @@ class FrameworkError(Exception):
             Attila Kovacs
         """
 
-        caller_frame_record = inspect.stack()[2]
-        frame = caller_frame_record[0]
-        info = inspect.getframeinfo(frame)
+        # Access the frame of the caller directly instead of building the full
+        # stack with source context through inspect.stack()
+        if frame is None:
+            # pylint: disable=protected-access
+            frame = sys._getframe(2)
+
+        code = frame.f_code
 
-        filename = info.filename
-        function = info.function
-        line = info.lineno
+        filename = code.co_filename
+        function = code.co_name
+        line = frame.f_lineno
 
         return filename, function, line
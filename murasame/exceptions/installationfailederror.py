@@ -36,9 +36,11 @@ class InstallationFailedError(FrameworkError):
         Attila Kovacs
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  message: str = '',
-                 errorcode: ErrorCodes = ErrorCodes.INSTALL_FAILED,
+                 errorcode: int = ErrorCodes.INSTALL_FAILED,
                  package: str = __package__,
                  file: str = '',
                  line: str = '',
@@ -52,7 +54,7 @@ class InstallationFailedError(FrameworkError):
         Args:
             message (str): The user message that clarifies the exception.
 
-            errorcode (ErrorCodes): The platform error code that identifies the
+            errorcode (int): The platform error code that identifies the
                 actual error.
 
             package (str): Name of the Python package that raised the
@@ -70,8 +72,8 @@ class InstallationFailedError(FrameworkError):
 
             inspect_caller (bool): Whether or not the caller should be
                 inspected to retrieve the raising location of the exception.
-                Should only be 'True' in the topmost exception in the
-                inheritance tree, otherwise should be passed down as 'False'.
+                The caller is not inspected if file, line and function are
+                all provided.
 
             requirement (str): Name of the requirement that has failed to
                 install.
@@ -80,10 +82,6 @@ class InstallationFailedError(FrameworkError):
             Attila Kovacs
         """
 
-        # Inspect the caller if requested
-        if inspect_caller:
-            file, function, line = self.inspect_exception()
-
         super().__init__(message=message,
                          errorcode=errorcode,
                          package=package,
@@ -91,6 +89,6 @@ class InstallationFailedError(FrameworkError):
                          line=line,
                          function=function,
                          wrapped_exception=wrapped_exception,
-                         inspect_caller=False)
+                         inspect_caller=inspect_caller)
 
         self.requirement = requirement
@@ -33,9 +33,11 @@ class UncaughtExceptionError(FrameworkError):
         Attila Kovacs
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  message: str = '',
-                 errorcode: ErrorCodes = ErrorCodes.UNCAUGHT_EXCEPTION,
+                 errorcode: int = ErrorCodes.UNCAUGHT_EXCEPTION,
                  package: str = __package__,
                  file: str = '',
                  line: str = '',
@@ -48,7 +50,7 @@ class UncaughtExceptionError(FrameworkError):
         Args:
             message (str): The user message that clarifies the exception.
 
-            errorcode (ErrorCodes): The platform erro rcode that identifies the
+            errorcode (int): The platform erro rcode that identifies the
                 actual error.
 
             package (str): Name of the Python package that raised the
@@ -66,17 +68,13 @@ class UncaughtExceptionError(FrameworkError):
 
             inspect_caller (bool): Whether or not the caller should be
                 inspected to retrieve the raising location of the exception.
-                Should only be 'True' in the topmost exception in the
-                inheritance tree, otherwise should be passed down as 'False'.
+                The caller is not inspected if file, line and function are
+                all provided.
 
         Authors:
             Attila Kovacs
         """
 
-        # Inspect the caller if requested
-        if inspect_caller:
-            file, function, line = self.inspect_exception()
-
         super().__init__(message=message,
                          errorcode=errorcode,
                          package=package,
@@ -84,4 +82,4 @@ class UncaughtExceptionError(FrameworkError):
                          line=line,
                          function=function,
                          wrapped_exception=wrapped_exception,
-                         inspect_caller=False)
+                         inspect_caller=inspect_caller)
@@ -24,5 +24,6 @@ Contains the licensing system implementation.
 from .licensetypes import LicenseTypes
 from .licensedescriptor import LicenseDescriptor
 from .licensefile import LicenseFile
+from .licensepool import LicensePool
 from .licensegenerator import LicenseGenerator
 from .licensevalidator import LicenseValidator
@@ -21,9 +21,53 @@
 Contains the implementation of the LicenseDescriptor class.
 """
 
+# Runtime Imports
+import json
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Union
+from uuid import UUID
+
 # Murasame Imports
 from murasame.licensing.licensetypes import LicenseTypes
 
+# Conversion map to use when serializing the type of a license.
+LICENSE_TYPE_SERIALIZATION_MAP = \
+{
+    LicenseTypes.PRODUCTION: 'production',
+    LicenseTypes.DEVELOPMENT: 'development'
+}
+
+# The maximum number of distinct feature metadata kept shared between the
+# features and licenses. Metadata evicted from the cache is still valid, it
+# is just no longer shared with newly added features.
+SHARED_METADATA_CACHE_SIZE = 1024
+
+# The maximum number of feature IDs in string format whose parsed UUID is
+# kept, so looking up the same features repeatedly doesn't parse them again.
+FEATURE_KEY_CACHE_SIZE = 1024
+
+def serialize_license_payload(license_content: dict) -> str:
+
+    """Returns the canonical JSON representation of a serialized license.
+
+    This is the representation that is signed by the license generator and
+    verified by the license validator. The keys are sorted and no whitespace
+    is used, so the result doesn't depend on the order of the keys.
+
+    Args:
+        license_content (dict): The license descriptor serialized to a
+            dictionary.
+
+    Returns:
+        str: The license in its canonical JSON format.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    return json.dumps(license_content, sort_keys=True, separators=(',', ':'))
+
 class LicenseDescriptor:
 
     """Represents a single license.
@@ -32,7 +76,10 @@ class LicenseDescriptor:
         _license_key (UUID): The unique license key.
         _owner_id (UUID): Unique ID of the owner of the license.
         _type (LicenseTypes): The type of the license.
-        _features (dict): List of features that are enabled by the license.
+        _features (dict): List of features that are enabled by the license,
+            keyed by the UUID of the feature. The metadata of the features is
+            stored as read-only mappings that are shared between features
+            with identical metadata.
 
     Authors:
         Attila Kovacs
@@ -86,7 +133,8 @@ class LicenseDescriptor:
             self,
             license_key: 'UUID',
             owner_id: 'UUID',
-            license_type: 'LicenseTypes') -> None:
+            license_type: 'LicenseTypes',
+            features: dict = None) -> None:
 
         """Creates a new LicenseDescriptor instance.
 
@@ -94,6 +142,11 @@ class LicenseDescriptor:
             license_key (UUID): The unique license key.
             owner_id (UUID): Unique ID of the owner of the license.
             license_type (LicenseTypes): The type of the license.
+            features (dict): Optional initial features of the license, mapping
+                the unique ID of each feature to its metadata.
+
+        Raises:
+            ValueError: Raised if a feature ID is not a valid UUID.
 
         Authors:
             Attila Kovacs
@@ -104,12 +157,19 @@ class LicenseDescriptor:
         self._type = license_type
         self._features = {}
 
+        if features:
+            make_feature_key = self._make_feature_key
+            share_metadata = self._share_metadata
+            self._features = {make_feature_key(feature_id):
+                              share_metadata(metadata)
+                              for feature_id, metadata in features.items()}
+
     def has_feature(self, feature_id: 'UUID') -> bool:
 
         """Returns whether or not a given feature is associated by the license.
 
         Args:
-            feature_id (UUIS): The feature id to check.
+            feature_id (UUID): The feature id to check.
 
         Returns:
             bool: 'True' if the given feature is covered by the license,
@@ -119,10 +179,7 @@ class LicenseDescriptor:
             Attila Kovacs
         """
 
-        if str(feature_id) in self._features:
-            return True
-
-        return False
+        return self._find_feature_key(feature_id) in self._features
 
     def add_feature(self, feature_id: 'UUID', metadata: dict) -> None:
 
@@ -137,10 +194,9 @@ class LicenseDescriptor:
             Attila Kovacs
         """
 
-        if self.has_feature(feature_id):
-            return
-
-        self._features[str(feature_id)] = metadata
+        # Features that are already added keep their existing metadata
+        self._features.setdefault(self._make_feature_key(feature_id),
+                                  self._share_metadata(metadata))
 
     def remove_feature(self, feature_id: 'UUID') -> None:
 
@@ -153,8 +209,7 @@ class LicenseDescriptor:
             Attila Kovacs
         """
 
-        if self.has_feature(feature_id):
-            del self._features[str(feature_id)]
+        self._features.pop(self._find_feature_key(feature_id), None)
 
     def serialize(self) -> dict:
 
@@ -167,25 +222,127 @@ class LicenseDescriptor:
             Attila Kovacs
         """
 
-        descriptor = \
+        # Keys loaded from a license file are already strings, those don't
+        # have to be converted again
+        license_key = self._license_key
+        owner_id = self._owner_id
+
+        return \
         {
-            'key': str(self._license_key),
-            'owner': str(self._owner_id),
-            'type': self._serialize_license_type(),
-            'features': self._features
+            'key': license_key if isinstance(license_key, str) \
+                else str(license_key),
+            'owner': owner_id if isinstance(owner_id, str) else str(owner_id),
+            'type': LICENSE_TYPE_SERIALIZATION_MAP.get(
+                self._type, 'development'),
+            'features': {str(key): dict(metadata)
+                         for key, metadata in self._features.items()}
         }
 
-        return descriptor
+    @staticmethod
+    def _make_feature_key(feature_id: 'UUID') -> UUID:
+
+        """Returns the key to use for a feature in the feature list.
+
+        Args:
+            feature_id (UUID): The unique ID of the feature, either as a UUID
+                or as its string representation.
+
+        Raises:
+            ValueError: Raised if the feature ID is not a valid UUID.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        if isinstance(feature_id, UUID):
+            return feature_id
+
+        return _parse_feature_id(feature_id)
+
+    @staticmethod
+    def _find_feature_key(feature_id: 'UUID') -> Union[UUID, None]:
+
+        """Returns the key to use when looking up a feature in the feature
+        list.
 
-    def _serialize_license_type(self) -> str:
+        Args:
+            feature_id (UUID): The unique ID of the feature, either as a UUID
+                or as its string representation.
+
+        Returns:
+            Union[UUID, None]: The key of the feature, or 'None' if the
+                feature ID is not a valid UUID, in which case no feature can
+                match it.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        if isinstance(feature_id, UUID):
+            return feature_id
 
-        """Returns the type of the license serialized as a string.
+        try:
+            return _parse_feature_id(str(feature_id))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _share_metadata(metadata: dict) -> MappingProxyType:
+
+        """Returns a read-only view of the given feature metadata.
+
+        Metadata that only contains hashable values is shared, so features
+        with identical metadata reference the same object.
+
+        Args:
+            metadata (dict): The metadata of the feature.
 
         Authors:
             Attila Kovacs
         """
 
-        if self._type == LicenseTypes.PRODUCTION:
-            return 'production'
+        metadata = dict(metadata) if metadata else {}
+
+        # The type of the values is part of the key, since equal values of
+        # different types, e.g. True and 1, have to stay distinct
+        try:
+            key = frozenset((name, type(value), value)
+                            for name, value in metadata.items())
+        except TypeError:
+            # Metadata with unhashable values cannot be shared
+            return MappingProxyType(metadata)
+
+        return _get_shared_metadata(key)
+
+@lru_cache(maxsize=FEATURE_KEY_CACHE_SIZE)
+def _parse_feature_id(feature_id: str) -> UUID:
+
+    """Returns the UUID of a feature ID in string format.
+
+    Args:
+        feature_id (str): The string representation of the feature ID.
+
+    Raises:
+        ValueError: Raised if the feature ID is not a valid UUID.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    return UUID(feature_id)
+
+@lru_cache(maxsize=SHARED_METADATA_CACHE_SIZE)
+def _get_shared_metadata(items: frozenset) -> MappingProxyType:
+
+    """Returns the read-only feature metadata shared between all features and
+    licenses that have the given metadata items.
+
+    Args:
+        items (frozenset): The items of the metadata, each a name, the type of
+            the value and the value.
+
+    Authors:
+        Attila Kovacs
+    """
 
-        return 'development'
+    return MappingProxyType({name: value for name, _, value in items})
@@ -102,39 +102,32 @@ class LicenseFile:
                 f'Failed to load license file from '
                 f'{license_file_path}.') from exception
 
+        content = license_file.Content
+
         # Retrieve the signature
-        try:
-            self._signature = license_file.Content['signature']
-        except KeyError as exception:
+        self._signature = content.get('signature')
+
+        if self._signature is None:
             raise InvalidLicenseKeyError(
                 f'No signature found in license file '
-                f'{license_file_path}.') from exception
+                f'{license_file_path}.')
 
         # Retrieve the license descriptor
-        descriptor = None
+        descriptor = content.get('license')
 
-        try:
-            descriptor = license_file.Content['license']
-        except KeyError as exception:
+        if descriptor is None:
             raise InvalidLicenseKeyError(
                 f'No license descriptor found in license '
-                f'file {license_file_path}.') from exception
+                f'file {license_file_path}.')
 
         # Build the descriptor
         try:
             self._license = LicenseDescriptor(
                 license_key=descriptor['key'],
                 owner_id=descriptor['owner'],
-                license_type=descriptor['type'])
-
-            features = descriptor['features']
-
-            for key, metadata in features.items():
-                self._license.add_feature(
-                    feature_id=key,
-                    metadata=metadata)
-
-        except KeyError as exception:
+                license_type=descriptor['type'],
+                features=descriptor['features'])
+        except (KeyError, ValueError) as exception:
             raise InvalidLicenseKeyError(
                 f'Malformed license descriptor in license '
                 f'file {license_file_path}.') from exception
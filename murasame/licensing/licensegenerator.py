@@ -22,10 +22,11 @@ Contains the implementation of the LicenseGenerator class.
 """
 
 # Runtime Imports
-import json
+import hashlib
 
 # Murasame Imports
 from murasame.utils import JsonFile, RSAPrivate
+from murasame.licensing.licensedescriptor import serialize_license_payload
 
 class LicenseGenerator:
 
@@ -51,7 +52,8 @@ class LicenseGenerator:
                 }
             }
         },
-        "signature": "base64 encoded license signature"
+        "signature": "base64 encoded license signature",
+        "digest": "SHA256 hash of the canonical license payload"
 
     }
 
@@ -119,14 +121,15 @@ class LicenseGenerator:
         """
 
         descriptor = license_descriptor.serialize()
-        signature = self._private_key.sign(
-            message=json.dumps(descriptor), encode=True)
+        payload = serialize_license_payload(descriptor)
+        signature = self._private_key.sign(message=payload, encode=True)
         signature = signature.decode('utf-8')
 
         license_content = \
         {
             'license': descriptor,
-            'signature': signature
+            'signature': signature,
+            'digest': hashlib.sha256(payload.encode('utf-8')).hexdigest()
         }
 
         license_file = JsonFile(
@@ -0,0 +1,182 @@
+## ============================================================================
+##             **** Murasame Application Development Framework ****
+##                Copyright (C) 2019-2021, Suisei Entertainment
+## ============================================================================
+##
+##  Licensed under the Apache License, Version 2.0 (the "License");
+##  you may not use this file except in compliance with the License.
+##  You may obtain a copy of the License at
+##
+##      http://www.apache.org/licenses/LICENSE-2.0
+##
+##  Unless required by applicable law or agreed to in writing, software
+##  distributed under the License is distributed on an "AS IS" BASIS,
+##  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+##  See the License for the specific language governing permissions and
+##  limitations under the License.
+##
+## ============================================================================
+
+"""
+Contains the implementation of the LicensePool class.
+"""
+
+# Murasame Imports
+from murasame.licensing.licensedescriptor import LicenseDescriptor
+
+class LicensePool:
+
+    """Indexes a set of licenses by the features they enable.
+
+    Checking which licenses enable a given feature is a single lookup,
+    regardless of the amount of licenses in the pool.
+
+    Attributes:
+        _licenses (dict): The licenses in the pool, keyed by the license key.
+
+        _feature_to_licenses (dict): The keys of the licenses that enable a
+            feature, keyed by the UUID of the feature.
+
+        _feature_metadata (dict): The metadata of the features, keyed by the
+            UUID of the feature and the license key.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    @property
+    def Licenses(self) -> dict:
+
+        """Provides access to the licenses in the pool, keyed by the license
+        key.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        return self._licenses
+
+    def __init__(self) -> None:
+
+        """Creates a new LicensePool instance.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        self._licenses = {}
+        self._feature_to_licenses = {}
+        self._feature_metadata = {}
+
+    def add_license(self, license_descriptor: 'LicenseDescriptor') -> None:
+
+        """Adds a license to the pool.
+
+        A license that is already in the pool with the same key is replaced.
+
+        Args:
+            license_descriptor (LicenseDescriptor): The license to add.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        license_key = license_descriptor.Key
+
+        if license_key in self._licenses:
+            self.remove_license(license_key=license_key)
+
+        self._licenses[license_key] = license_descriptor
+
+        feature_to_licenses = self._feature_to_licenses
+        for feature_id, metadata in license_descriptor.Features.items():
+            feature_to_licenses.setdefault(feature_id, set()).add(license_key)
+            self._feature_metadata[(feature_id, license_key)] = metadata
+
+    def remove_license(self, license_key: 'UUID') -> None:
+
+        """Removes a license from the pool.
+
+        Args:
+            license_key (UUID): The key of the license to remove.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        license_descriptor = self._licenses.pop(license_key, None)
+
+        if license_descriptor is None:
+            return
+
+        for feature_id in license_descriptor.Features:
+            license_keys = self._feature_to_licenses.get(feature_id)
+            if license_keys is not None:
+                license_keys.discard(license_key)
+                if not license_keys:
+                    del self._feature_to_licenses[feature_id]
+            self._feature_metadata.pop((feature_id, license_key), None)
+
+    def get_licenses_with_feature(self, feature_id: 'UUID') -> frozenset:
+
+        """Returns the keys of all licenses that enable a given feature.
+
+        Args:
+            feature_id (UUID): The unique ID of the feature, either as a UUID
+                or as its string representation.
+
+        Returns:
+            frozenset: The keys of the licenses that enable the feature.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        #pylint: disable=protected-access
+        feature_id = LicenseDescriptor._find_feature_key(feature_id)
+
+        return frozenset(self._feature_to_licenses.get(feature_id, ()))
+
+    def has_feature(self, feature_id: 'UUID') -> bool:
+
+        """Returns whether or not any license in the pool enables a given
+        feature.
+
+        Args:
+            feature_id (UUID): The unique ID of the feature, either as a UUID
+                or as its string representation.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        #pylint: disable=protected-access
+        feature_id = LicenseDescriptor._find_feature_key(feature_id)
+
+        return feature_id in self._feature_to_licenses
+
+    def get_feature_metadata(
+            self,
+            feature_id: 'UUID',
+            license_key: 'UUID') -> 'Mapping':
+
+        """Returns the metadata of a feature in a given license.
+
+        Args:
+            feature_id (UUID): The unique ID of the feature, either as a UUID
+                or as its string representation.
+
+            license_key (UUID): The key of the license.
+
+        Returns:
+            Mapping: The metadata of the feature, or None if the license
+                doesn't enable the feature.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        #pylint: disable=protected-access
+        feature_id = LicenseDescriptor._find_feature_key(feature_id)
+
+        return self._feature_metadata.get((feature_id, license_key))
@@ -22,10 +22,25 @@ Contains the implementation of the LicenseValidator class.
 """
 
 # Platform Import
+import base64
+import binascii
+import hashlib
 import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 # Murasame Imports
 from murasame.utils import RSAPublic, JsonFile
+from murasame.licensing.licensedescriptor import serialize_license_payload
+
+# The maximum amount of threads to use when validating multiple licenses.
+MAX_VALIDATOR_THREADS = 32
+
+# The maximum amount of license files whose validation result is kept.
+MAX_CACHED_VALIDATION_RESULTS = 256
 
 class LicenseValidator:
 
@@ -34,6 +49,14 @@ class LicenseValidator:
     Attributes:
         _public_key (RSAPublic): The public key to use for the validation.
 
+        _results (OrderedDict): The results of previous validations, keyed
+            by the path of the license file, together with the state of the
+            file when it was validated. The least recently used results are
+            dropped once MAX_CACHED_VALIDATION_RESULTS is reached.
+
+        _results_lock (Lock): Lock guarding the results, since licenses can
+            be validated on multiple threads.
+
     Authors:
         Attila Kovacs
     """
@@ -53,6 +76,8 @@ class LicenseValidator:
         """
 
         self._public_key = None
+        self._results = OrderedDict()
+        self._results_lock = threading.Lock()
 
         if public_key is not None:
             self._public_key = public_key
@@ -77,26 +102,153 @@ class LicenseValidator:
             Attila Kovacs
         """
 
+        # Licenses that haven't changed since they were last validated are not
+        # validated again. The change time and the inode are part of the state,
+        # since unlike the modification time they cannot be set by the user.
+        try:
+            stat = os.stat(license_path)
+            file_state = (stat.st_ino,
+                          stat.st_ctime_ns,
+                          stat.st_mtime_ns,
+                          stat.st_size)
+        except OSError:
+            file_state = None
+
+        if file_state is not None:
+            with self._results_lock:
+                result = self._results.get(license_path)
+                if result is not None and result[0] == file_state:
+                    self._results.move_to_end(license_path)
+                    return result[1]
+
+        result = self._validate_license_file(
+            license_path=license_path,
+            cb_retrieve_password=cb_retrieve_password)
+
+        if file_state is not None:
+            with self._results_lock:
+                self._results[license_path] = (file_state, result)
+                self._results.move_to_end(license_path)
+                if len(self._results) > MAX_CACHED_VALIDATION_RESULTS:
+                    self._results.popitem(last=False)
+
+        return result
+
+    def _validate_license_file(self,
+                               license_path: str,
+                               cb_retrieve_password: 'Callable') -> bool:
+
+        """Loads the given license file and validates it using the public key.
+
+        Args:
+            license_path (str): Path to the license file.
+            cb_retrieve_password (Callable): Callback function that is called
+                to retrieve the password required to decrypt the license file.
+
+        Returns:
+            bool: 'True' if the given license is valid, 'False' otherwise.
+
+        Authors:
+            Attila Kovacs
+        """
+
         # Load and decrypt the license file
         license_file = JsonFile(path=license_path,
                                 cb_retrieve_key=cb_retrieve_password)
         license_file.load()
 
-        # Get the string representation of the license
+        # Get the license and its signature, the signature is only decoded
+        # once even if it has to be verified in both formats
         try:
-            license_string = json.dumps(license_file.Content['license'])
-        except KeyError:
+            license_content = license_file.Content['license']
+            signature = base64.b64decode(license_file.Content['signature'])
+        except (KeyError, binascii.Error):
             return False
 
-        # Get the signature
-        try:
-            signature = license_file.Content['signature']
-            signature = bytes(signature, 'utf-8')
-        except KeyError:
-            return False
+        payload = serialize_license_payload(license_content)
 
-        if not self._public_key.verify(
-                message=license_string, signature=signature, encoded=True):
-            return False
+        # Licenses that carry the digest of their payload are always signed in
+        # the canonical format, a modified license can be rejected without
+        # verifying the signature
+        digest = license_file.Content.get('digest')
+        if digest is not None:
+            if digest != hashlib.sha256(payload.encode('utf-8')).hexdigest():
+                return False
+
+            return self._public_key.verify(message=payload, signature=signature)
+
+        if self._public_key.verify(message=payload, signature=signature):
+            return True
+
+        # Licenses generated before the canonical format was introduced were
+        # signed with the default JSON representation of the license
+        return self._public_key.verify(
+            message=json.dumps(license_content), signature=signature)
+
+    def validate_many(self,
+                      license_paths: list,
+                      cb_retrieve_password: 'Callable' = None) -> dict:
+
+        """Validates multiple license files using the public key.
+
+        The license files are loaded and validated in parallel, since reading
+        the files from disk is I/O bound.
+
+        The password callback doesn't have to be thread-safe. It is called at
+        most once, on one of the validating threads, and the password it
+        returns is used for all the license files.
+
+        Args:
+            license_paths (list): Paths to the license files.
+            cb_retrieve_password (Callable): Callback function that is called
+                to retrieve the password required to decrypt the license files.
+
+        Returns:
+            dict: 'True' for every license path that points to a valid
+                license, 'False' otherwise.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        if not license_paths:
+            return {}
+
+        if cb_retrieve_password is not None:
+            cb_retrieve_password = _retrieve_once(cb_retrieve_password)
+
+        validate = partial(self.validate,
+                           cb_retrieve_password=cb_retrieve_password)
+
+        max_workers = min(MAX_VALIDATOR_THREADS, len(license_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(validate, license_paths))
+
+        return dict(zip(license_paths, results))
+
+def _retrieve_once(cb_retrieve_password: 'Callable') -> 'Callable':
+
+    """Wraps a password callback, so it is only called once even if the
+    password is requested from multiple threads at the same time.
+
+    Args:
+        cb_retrieve_password (Callable): The callback to wrap.
+
+    Returns:
+        Callable: Callback that returns the password retrieved by the first
+            call.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    lock = threading.Lock()
+    password = []
+
+    def retrieve_password() -> str:
+        with lock:
+            if not password:
+                password.append(cb_retrieve_password())
+            return password[0]
 
-        return True
+    return retrieve_password
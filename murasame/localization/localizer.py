@@ -22,17 +22,17 @@ Contains the implementation of the Localizer class.
 """
 
 # Runtime Imports
+import sys
+from collections import OrderedDict
+from functools import lru_cache
 from string import Template
 
-# Dependency Imports
-import httpx
-from googletrans import Translator
-
 # Murasame Imports
 from murasame.constants import (
     MURASAME_LOCALIZER_LOG_CHANNEL,
     MURASAME_DEFAULT_LOCALIZATION_PATH)
 from murasame.log.logwriter import LogWriter
+from murasame.log.loglevels import LogLevels
 from murasame.api import VFSAPI
 from murasame.utils import SystemLocator
 
@@ -154,6 +154,52 @@ SUPPORTED_LANGUAGES = \
     'zu'    # Zulu
 ]
 
+# The supported languages as a set, used to validate language codes.
+_SUPPORTED_LANGUAGE_SET = frozenset(SUPPORTED_LANGUAGES)
+
+# The maximum amount of automatic translations kept by a localizer.
+MAX_CACHED_TRANSLATIONS = 1024
+
+@lru_cache(maxsize=2048)
+def _get_template(text: str) -> Template:
+
+    """Returns the template to use to substitute attributes in a localized
+    text, reusing the template of texts that have been substituted before.
+
+    Args:
+        text (str): The localized text.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    return Template(text)
+
+# The translator shared by all localizers, created when it's first needed.
+_TRANSLATOR = None
+
+def _get_translator() -> 'Translator':
+
+    """Returns the translator to use for automatic translations.
+
+    A single translator is used, so its connections are reused between
+    translation requests. Google Translate support is only imported when the
+    translator is first needed, since it's only used if automatic translation
+    is enabled.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    #pylint: disable=global-statement, import-outside-toplevel
+    global _TRANSLATOR
+
+    if _TRANSLATOR is None:
+        from googletrans import Translator
+        _TRANSLATOR = Translator()
+
+    return _TRANSLATOR
+
 class Localizer(LogWriter):
 
     """Utility class to translate strings and fill in optional variables inside
@@ -174,12 +220,23 @@ class Localizer(LogWriter):
             automatically translated through Google Translate.
 
         _cache_default (bool): Whether or not the default language file should
-            also be loaded into memory.
+            be loaded into memory when the localizer is created. Otherwise it
+            is loaded the first time a text is missing from the selected
+            language.
 
         _data (dict): The loaded language data.
 
         _default_data (dict): The loaded default language data.
 
+        _default_data_failed (bool): Whether or not loading the default
+            language file has failed. It is not loaded again until the
+            localizations are updated.
+
+        _translations (OrderedDict): Automatic translations to the selected
+            language that have already been received, keyed by the default
+            text. Only the MAX_CACHED_TRANSLATIONS most recently used
+            translations are kept.
+
         _localization_directory (str): The directory in the virtual file system
             that contains the localization files.
 
@@ -223,6 +280,8 @@ class Localizer(LogWriter):
         self._cache_default = cache_default
         self._data = None
         self._default_data = None
+        self._default_data_failed = False
+        self._translations = OrderedDict()
         self._localization_directory = localization_directory
 
         self._load_language()
@@ -239,32 +298,88 @@ class Localizer(LogWriter):
             attributes (dict): List of dynamic attributes to substitute.
         """
 
-        self.debug(f'Retrieving localized text for key {key}...')
+        # Only format the debug messages when they are actually written
+        debug_enabled = self.is_enabled_for(LogLevels.DEBUG)
+
+        if debug_enabled:
+            self.debug(f'Retrieving localized text for key {key}...')
 
         localized_text = None
 
         try:
             localized_text = self._data[key]
         except KeyError:
-            self.debug(f'Localization key {key} was not found in the current '
-                       f'language.')
+            if debug_enabled:
+                self.debug(f'Localization key {key} was not found in the '
+                           f'current language.')
             localized_text = self._load_default_text(key=key)
             if self._auto_translate:
-                self.debug(f'Attempting to translate {key}({localized_text}) '
-                           f'to language {self._language}.')
+                if debug_enabled:
+                    self.debug(f'Attempting to translate {key}'
+                               f'({localized_text}) to language '
+                               f'{self._language}.')
                 localized_text = self._translate_text(text=localized_text)
-                self.debug(f'Received translation for {key}: {localized_text}')
+                if debug_enabled:
+                    self.debug(f'Received translation for {key}: '
+                               f'{localized_text}')
 
-        if attributes:
-            self.debug(f'Substituting supplied attributes in localized text '
-                       f'for {key}.')
-            localized_text = Template(localized_text).safe_substitute(
-                mapping=attributes)
+        # Texts without placeholders are returned as they are
+        if attributes and '$' in localized_text:
+            if debug_enabled:
+                self.debug(f'Substituting supplied attributes in localized '
+                           f'text for {key}.')
+            localized_text = _get_template(localized_text).safe_substitute(
+                attributes)
 
-        self.debug(f'Final localized text for {key}: {localized_text}')
+        if debug_enabled:
+            self.debug(f'Final localized text for {key}: {localized_text}')
 
         return localized_text
 
+    def prefetch_translations(self, keys: list) -> None:
+
+        """Translates all given keys that are missing from the selected
+        language with a single Google Translate request.
+
+        Does nothing if automatic translation is disabled. The translations
+        are used by subsequent calls to get().
+
+        Args:
+            keys (list): The localization keys that are about to be used.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        if not self._auto_translate:
+            return
+
+        #pylint: disable=import-outside-toplevel
+        import httpx
+
+        data = self._data or {}
+        texts = [self._load_default_text(key=key)
+                 for key in keys if key not in data]
+        texts = [text for text in texts if text not in self._translations]
+
+        if not texts:
+            return
+
+        self.debug(f'Attempting to translate {len(texts)} texts to '
+                   f'{self._language}...')
+
+        try:
+            translations = _get_translator().translate(
+                texts,
+                src=self._default_language,
+                dest=self._language)
+        except httpx.HTTPError as error:
+            self.error(f'Failed to translate texts. Reason: {error}')
+            return
+
+        for text, translation in zip(texts, translations):
+            self._cache_translation(text=text, translation=translation.text)
+
     @staticmethod
     def is_valid_language(language: str) -> bool:
 
@@ -281,7 +396,7 @@ class Localizer(LogWriter):
             Attila Kovacs
         """
 
-        return language in SUPPORTED_LANGUAGES
+        return language in _SUPPORTED_LANGUAGE_SET
 
     def switch_language(self, new_language: str) -> None:
 
@@ -298,6 +413,7 @@ class Localizer(LogWriter):
                    f'to {new_language}.')
 
         self._language = new_language
+        self._translations = OrderedDict()
         self._load_language()
 
         self.debug(f'Localization language was set to {new_language}.')
@@ -311,9 +427,12 @@ class Localizer(LogWriter):
         """
 
         self._data = self._load_language_file(language=self._language)
+        self._default_data_failed = False
         if self._cache_default:
-            self._default_data = self._load_language_file(
-                language=self._default_language)
+            self._cache_default_language()
+        else:
+            # Reloaded the next time a default text is needed
+            self._default_data = None
 
     def _load_language_file(self, language: str) -> dict:
 
@@ -346,6 +465,10 @@ class Localizer(LogWriter):
             self.error(f'Failed to load language file for language '
                        f'{language}.')
         else:
+            # Intern the localization keys, so looking them up with the same
+            # key strings used by the application is an identity check
+            data = {sys.intern(key) if isinstance(key, str) else key: value
+                    for key, value in data.items()}
             self.debug(f'Language file for language {language} has been '
                        f'loaded.')
 
@@ -381,6 +504,13 @@ class Localizer(LogWriter):
                    f'{self._default_language} to memory.')
         self._default_data = self._load_language_file(
             language=self._default_language)
+
+        # Remember the failure, so a missing or invalid file is not loaded
+        # again for every missing text
+        if self._default_data is None:
+            self._default_data_failed = True
+            return
+
         self.debug('Default language file loaded to memory.')
 
     def _load_default_text(self, key: str) -> str:
@@ -400,15 +530,15 @@ class Localizer(LogWriter):
 
         self.debug(f'Loading default localization text for {key}.')
 
-        if self._cache_default:
-            return self._default_language[key]
-
-        data = self._load_language_file(language=self._default_language)
+        # The default language file is only loaded once, the first time a text
+        # is missing from the selected language
+        if self._default_data is None and not self._default_data_failed:
+            self._cache_default_language()
 
         text = None
         try:
-            text = data[key]
-        except KeyError:
+            text = self._default_data[key]
+        except (KeyError, TypeError):
             self.error(f'Localization key {key} is not found in the default '
                        f'language file.')
             text = 'KEY NOT FOUND'
@@ -429,11 +559,18 @@ class Localizer(LogWriter):
             Attila Kovacs
         """
 
+        translation = self._translations.get(text)
+        if translation is not None:
+            self._translations.move_to_end(text)
+            return translation
+
+        #pylint: disable=import-outside-toplevel
+        import httpx
+
         self.debug(f'Attempting to translate {text} to {self._language}...')
 
-        translator = Translator()
         try:
-            translation = translator.translate(
+            translation = _get_translator().translate(
                 text,
                 src=self._default_language,
                 dest=self._language)
@@ -444,4 +581,27 @@ class Localizer(LogWriter):
 
         self.debug(f'Received translation for {text}: {translation.text}.')
 
+        self._cache_translation(text=text, translation=translation.text)
+
         return translation.text
+
+    def _cache_translation(self, text: str, translation: str) -> None:
+
+        """Stores a received translation, dropping the least recently used
+        translation if too many are stored.
+
+        Args:
+            text (str): The text in the default language.
+
+            translation (str): The translated text.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        translations = self._translations
+        translations[text] = translation
+        translations.move_to_end(text)
+
+        if len(translations) > MAX_CACHED_TRANSLATIONS:
+            translations.popitem(last=False)
@@ -24,6 +24,7 @@ Contains the log system implementation.
 from murasame.log.loglevels import LogLevels
 from murasame.log.logentry import LogEntry
 from murasame.log.logchannel import LogChannel
-from murasame.log.logtarget import LogTarget
+from murasame.log.logformatter import LogFormatter, get_log_formatter
+from murasame.log.logtarget import LogTarget, register_target
 from murasame.log.loggingsystem import LoggingSystem
-from murasame.log.logwriter import LogWriter
+from murasame.log.logwriter import LogWriter, get_log_writer
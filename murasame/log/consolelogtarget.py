@@ -24,13 +24,62 @@ Contains the implementation of the ConsoleLogTarget class.
 
 # Runtime Imports
 import logging
+import sys
 
 # Dependency Imports
 import coloredlogs
 
 # Murasame Imports
-from murasame.log.logtarget import LogTarget
+from murasame.log.logformatter import get_log_formatter
+from murasame.log.logtarget import LogTarget, register_target
 
+# Console log handlers shared between the console log targets, keyed by their
+# stream, format and date format strings and whether they are colored.
+_CONSOLE_HANDLERS = {}
+
+class _ConsoleHandler(logging.StreamHandler):
+
+    """Stream handler shared between the console log targets with the same
+    configuration.
+
+    Attributes:
+        _key (tuple): The key of the handler among the shared handlers.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    def __init__(self, key: tuple, stream: 'TextIO') -> None:
+
+        """Creates a new _ConsoleHandler instance.
+
+        Args:
+            key (tuple): The key of the handler among the shared handlers.
+
+            stream (TextIO): The stream to write the log messages to.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        super().__init__(stream=stream)
+        self._key = key
+
+    def close(self) -> None:
+
+        """Closes the handler, and stops sharing it with new console log
+        targets.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        if _CONSOLE_HANDLERS.get(self._key) is self:
+            del _CONSOLE_HANDLERS[self._key]
+
+        super().close()
+
+@register_target('console')
 class ConsoleLogTarget(LogTarget):
 
     """Represents a log target that writes messages to the system console.
@@ -44,13 +93,23 @@ class ConsoleLogTarget(LogTarget):
         _date_format_string (str): Optional date format string to use for
             log to console.
 
-        _handler (object): The actual log handler object.
+        _handler (object): The actual log handler object. Targets with the
+            same format share the same handler.
 
     Authors:
         Attila Kovacs
     """
 
-    def __init__(self, logger: 'Logger', configuration: dict) -> None:
+    __slots__ = ('_colored_logs',
+                 '_format_string',
+                 '_date_format_string',
+                 '_handler')
+
+    def __init__(
+        self,
+        logger: 'Logger',
+        configuration: dict,
+        root_path: str = None) -> None:
 
         """Creates a new ConsoleLogTarget entry.
 
@@ -60,10 +119,15 @@ class ConsoleLogTarget(LogTarget):
             configuration (dict): The configuration of the target in serialized
                 format.
 
+            root_path (str): Root path of the log system. Not used by console
+                targets.
+
         Authors:
             Attila Kovacs
         """
 
+        del root_path
+
         super().__init__(logger=logger)
 
         self._colored_logs = False
@@ -89,29 +153,21 @@ class ConsoleLogTarget(LogTarget):
             Attila Kovacs
         """
 
-        # Load log coloring
-        colored_logs = None
-        try:
-            colored_logs = configuration['coloredlogs']
-        except KeyError:
-            colored_logs = 'False'
-
-        if colored_logs.lower() == 'true':
-            self._colored_logs = True
+        # Load log coloring, accepting both boolean and string values
+        colored_logs = configuration.get('coloredlogs', False)
+        if isinstance(colored_logs, bool):
+            self._colored_logs = colored_logs
         else:
-            self._colored_logs = False
+            self._colored_logs = \
+                str(colored_logs).strip().lower() in ('true', '1', 'yes', 'on')
 
         # Load console log format
-        try:
-            self._format_string = configuration['format']
-        except KeyError:
-            self._format_string = '[%(asctime)s][%(levelname)s]: %(message)s'
+        self._format_string = configuration.get(
+            'format', '[%(asctime)s][%(levelname)s]: %(message)s')
 
         # Load date format
-        try:
-            self._date_format_string = configuration['dateformat']
-        except KeyError:
-            self._date_format_string = '%Y-%m-%d %H:%M:%S'
+        self._date_format_string = configuration.get(
+            'dateformat', '%Y-%m-%d %H:%M:%S')
 
     def _apply_configuration(self) -> None:
 
@@ -121,17 +177,30 @@ class ConsoleLogTarget(LogTarget):
             Attila Kovacs
         """
 
-        # Create the handler
-        self._handler = logging.StreamHandler()
-
-        # Add the handler to the logger
-        self.Logger.addHandler(self._handler)
-
-        # Set formatter
-        self._handler.setFormatter(logging.Formatter(
-            fmt=self._format_string,
-            datefmt=self._date_format_string))
-
-        # Enable colored logs
-        if self._colored_logs:
-            coloredlogs.install(level=logging.DEBUG, logger=self.Logger)
+        # Retrieve the handler for the configuration of the target, or create
+        # it if this is the first target with this configuration
+        stream = sys.stderr
+        handler_key = (id(stream),
+                       self._format_string,
+                       self._date_format_string,
+                       self._colored_logs)
+        self._handler = _CONSOLE_HANDLERS.get(handler_key)
+
+        if self._handler is None:
+            self._handler = _ConsoleHandler(key=handler_key, stream=stream)
+            self._handler.setFormatter(get_log_formatter(
+                fmt=self._format_string,
+                datefmt=self._date_format_string))
+            _CONSOLE_HANDLERS[handler_key] = self._handler
+
+        # Add the handler to the logger, unless another target has already
+        # added it, so the same message is not formatted and written twice
+        logger = self.Logger
+        if self._handler not in logger.handlers:
+            logger.addHandler(self._handler)
+
+        # Enable colored logs, unless they are already enabled on the logger
+        if self._colored_logs and not any(
+                isinstance(handler, coloredlogs.StandardErrorHandler)
+                for handler in logger.handlers):
+            coloredlogs.install(level=logging.DEBUG, logger=logger)
@@ -21,130 +21,62 @@
 Contains the default configuration of the log system.
 """
 
-DEFAULT_LOG_CONFIG = \
+# Runtime Imports
+from types import MappingProxyType
+
+# Names of the framework components that have their own log channel.
+DEFAULT_LOG_CHANNELS = \
+(
+    'application',
+    'configuration',
+    'exceptions',
+    'localizer',
+    'pal',
+    'pal.networking.socket',
+    'pal.vfs',
+    'utils'
+)
+
+def _build_channel_config(component: str) -> MappingProxyType:
+
+    """Creates the default configuration of the log channel of a framework
+    component.
+
+    The configuration is read-only, since it's shared by every log system
+    instance.
+
+    Args:
+        component (str): Name of the framework component.
+
+    Returns:
+        MappingProxyType: The configuration of the log channel.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    return MappingProxyType(
+    {
+        'name': f'murasame.{component}',
+        'defaultloglevel': 'INFO',
+        'targets':
+        (
+            MappingProxyType(
+            {
+                'type': 'console',
+                'coloredlogs': 'true',
+            }),
+            MappingProxyType(
+            {
+                'type': 'file',
+                'filename': f'murasame.{component}.log'
+            })
+        )
+    })
+
+DEFAULT_LOG_CONFIG = MappingProxyType(
 {
-    "rootpath": '~/.murasame/logs',
-    "channels":
-    [
-        {
-            "name": "murasame.application",
-            "defaultloglevel": "INFO",
-            "targets":
-            [
-                {
-                    'type': 'console',
-                    'coloredlogs': 'true',
-                },
-                {
-                    'type': 'file',
-                    'filename': 'murasame.application.log'
-                }
-            ]
-        },
-        {
-            "name": "murasame.configuration",
-            "defaultloglevel": "INFO",
-            "targets":
-            [
-                {
-                    'type': 'console',
-                    'coloredlogs': 'true',
-                },
-                {
-                    'type': 'file',
-                    'filename': 'murasame.configuration.log'
-                }
-            ]
-        },
-        {
-            "name": "murasame.exceptions",
-            "defaultloglevel": "INFO",
-            "targets":
-            [
-                {
-                    'type': 'console',
-                    'coloredlogs': 'true',
-                },
-                {
-                    'type': 'file',
-                    'filename': 'murasame.exceptions.log'
-                }
-            ]
-        },
-        {
-            "name": "murasame.localizer",
-            "defaultloglevel": "INFO",
-            "targets":
-            [
-                {
-                    'type': 'console',
-                    'coloredlogs': 'true',
-                },
-                {
-                    'type': 'file',
-                    'filename': 'murasame.localizer.log'
-                }
-            ]
-        },
-        {
-            "name": "murasame.pal",
-            "defaultloglevel": "INFO",
-            "targets":
-            [
-                {
-                    'type': 'console',
-                    'coloredlogs': 'true',
-                },
-                {
-                    'type': 'file',
-                    'filename': 'murasame.pal.log'
-                }
-            ]
-        },
-        {
-            "name": "murasame.pal.networking.socket",
-            "defaultloglevel": "INFO",
-            "targets":
-            [
-                {
-                    'type': 'console',
-                    'coloredlogs': 'true',
-                },
-                {
-                    'type': 'file',
-                    'filename': 'murasame.pal.networking.socket.log'
-                }
-            ]
-        },
-        {
-            "name": "murasame.pal.vfs",
-            "defaultloglevel": "INFO",
-            "targets":
-            [
-                {
-                    'type': 'console',
-                    'coloredlogs': 'true',
-                },
-                {
-                    'type': 'file',
-                    'filename': 'murasame.pal.vfs.log'
-                }
-            ]
-        },
-        {
-            "name": "murasame.utils",
-            "defaultloglevel": "INFO",
-            "targets":
-            [
-                {
-                    'type': 'console',
-                    'coloredlogs': 'true',
-                },
-                {
-                    'type': 'file',
-                    'filename': 'murasame.utils.log'
-                }
-            ]
-        }
-    ]
-}
+    'rootpath': '~/.murasame/logs',
+    'channels': tuple(_build_channel_config(component)
+                      for component in DEFAULT_LOG_CHANNELS)
+})
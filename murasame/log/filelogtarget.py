@@ -22,14 +22,249 @@ Contains the implementation of the FileLogTarget class.
 """
 
 # Runtime Imports
-import os
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+from logging.handlers import MemoryHandler
 
 # Murasame Imports
 from murasame.exceptions import InvalidInputError
-from murasame.log.logtarget import LogTarget
+from murasame.log.logformatter import get_log_formatter
+from murasame.log.loglevels import (
+    LOG_LEVEL_CONVERSION_MAP,
+    PYTHON_LOG_LEVEL_MAP,
+    LogLevels)
+from murasame.log.logtarget import LogTarget, register_target
+
+# The log file is not inherited by child processes on platforms that support
+# it.
+_O_CLOEXEC = getattr(os, 'O_CLOEXEC', 0)
+
+class _RotatingFileHandler(logging.Handler):
+
+    """Log handler that writes log records to a file and rolls the file over
+    when it reaches its maximum size.
+
+    Unlike the standard rotating file handler it writes the encoded records
+    directly to a file descriptor opened in append mode, and tracks the size
+    of the file itself instead of querying the stream for every record. A
+    batch of records can be written with a single system call.
+
+    Attributes:
+        baseFilename (str): Path of the log file.
+
+        maxBytes (int): The maximum size of the log file in bytes. The file is
+            never rolled over if it's zero.
+
+        backupCount (int): The amount of backup files to keep. The file is
+            never rolled over if it's zero.
+
+        _fd (int): The file descriptor of the open log file.
+
+        _size (int): The current size of the log file in bytes.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    #pylint: disable=invalid-name
+
+    def __init__(self, filename: str, maxBytes: int, backupCount: int) -> None:
+
+        """Creates a new _RotatingFileHandler instance and opens the log file.
+
+        Args:
+            filename (str): Path of the log file.
+
+            maxBytes (int): The maximum size of the log file in bytes.
+
+            backupCount (int): The amount of backup files to keep.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        super().__init__()
+
+        self.baseFilename = filename
+        self.maxBytes = maxBytes
+        self.backupCount = backupCount
+
+        self._fd = None
+        self._size = 0
+
+        self._open()
+
+    def emit(self, record: 'LogRecord') -> None:
+
+        """Writes a single log record to the file.
+
+        Args:
+            record (LogRecord): The record to write.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        self.write_records(records=(record,))
+
+    def write_records(self, records: list) -> None:
+
+        """Writes a batch of log records to the file.
+
+        The records are collected in a single buffer, which is written to the
+        file at once, or right before the file has to be rolled over.
+
+        Args:
+            records (list): The records to write.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        buffer = bytearray()
+        record = None
+
+        try:
+            for record in records:
+
+                data = f'{self.format(record)}\n'.encode('utf-8')
+
+                if self._should_rollover(len(buffer) + len(data)):
+                    self._write(buffer)
+                    buffer.clear()
+                    self._do_rollover()
+
+                buffer += data
+
+            self._write(buffer)
+        except Exception: #pylint: disable=broad-except
+            self.handleError(record)
+
+    def close(self) -> None:
+
+        """Closes the log file.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        self.acquire()
+        try:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        finally:
+            self.release()
+            super().close()
+
+    def _open(self) -> None:
+
+        """Opens the log file in append mode and reads its current size.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        self._fd = os.open(
+            self.baseFilename,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT | _O_CLOEXEC,
+            0o644)
+        self._size = os.fstat(self._fd).st_size
 
+    def _write(self, data: bytearray) -> None:
+
+        """Writes raw data to the log file.
+
+        Args:
+            data (bytearray): The data to write.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        if self._fd is None:
+            self._open()
+
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            self._size += written
+            view = view[written:]
+
+    def _should_rollover(self, length: int) -> bool:
+
+        """Returns whether or not the log file should be rolled over before
+        writing the given amount of data.
+
+        Args:
+            length (int): The amount of data to write in bytes.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        if self.maxBytes <= 0 or self.backupCount <= 0:
+            return False
+
+        if self._size + length < self.maxBytes:
+            return False
+
+        # Never roll over anything other than regular files
+        return not os.path.exists(self.baseFilename) \
+            or os.path.isfile(self.baseFilename)
+
+    def _do_rollover(self) -> None:
+
+        """Moves the log file to the first backup file, shifting the existing
+        backups, and opens a new empty log file.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        os.close(self._fd)
+        self._fd = None
+
+        for index in range(self.backupCount - 1, 0, -1):
+            source = f'{self.baseFilename}.{index}'
+            if os.path.exists(source):
+                os.replace(source, f'{self.baseFilename}.{index + 1}')
+
+        if os.path.exists(self.baseFilename):
+            os.replace(self.baseFilename, f'{self.baseFilename}.1')
+
+        self._open()
+
+class _BufferingHandler(MemoryHandler):
+
+    """Memory handler that passes its buffered records to the file handler
+    as a single batch when it's flushed.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    def flush(self) -> None:
+
+        """Writes the buffered records to the file handler.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        self.acquire()
+        try:
+            if self.target and self.buffer:
+                self.target.acquire()
+                try:
+                    self.target.write_records(records=self.buffer)
+                finally:
+                    self.target.release()
+                self.buffer.clear()
+        finally:
+            self.release()
+
+@register_target('file')
 class FileLogTarget(LogTarget):
 
     """Represents a log target that writes messages to a local file.
@@ -47,12 +282,34 @@ class FileLogTarget(LogTarget):
         _date_format_string (str): Optional date format string to use for
             log to console.
 
+        _buffer_capacity (int): The amount of log records to buffer in memory
+            before they are written to the file. Buffering is disabled if
+            it's zero.
+
+        _flush_level (LogLevels): Log records with this level or above are
+            written to the file immediately, together with the buffered
+            records.
+
         _handler (object): The actual log handler object.
 
+        _file_handler (_RotatingFileHandler): The handler that writes the log
+            file. It's the same as the actual log handler when buffering is
+            disabled.
+
     Authors:
         Attila Kovacs
     """
 
+    __slots__ = ('_filename',
+                 '_max_size',
+                 '_backup_count',
+                 '_format_string',
+                 '_date_format_string',
+                 '_buffer_capacity',
+                 '_flush_level',
+                 '_handler',
+                 '_file_handler')
+
     def __init__(
         self,
         logger: 'Logger',
@@ -80,7 +337,10 @@ class FileLogTarget(LogTarget):
         self._backup_count = None
         self._format_string = None
         self._date_format_string = None
+        self._buffer_capacity = None
+        self._flush_level = None
         self._handler = None
+        self._file_handler = None
 
         # Parse the configuration
         self._load_configuration(configuration=configuration,
@@ -106,40 +366,40 @@ class FileLogTarget(LogTarget):
             Attila Kovacs
         """
 
-        filename = configuration['filename']
-
-        # Load filename
+        # Load filename. The root path is already absolute when it comes from
+        # the log system, so only the home directory has to be expanded.
         try:
-            self._filename = os.path.abspath(
-                os.path.expanduser(f'{root_path}/{filename}'))
+            filename = os.path.join(root_path, configuration['filename'])
         except KeyError as exception:
             raise InvalidInputError(
                 'Filename is not found in the configuration when trying to '
                 'configure logger.') from exception
 
+        if filename.startswith('~'):
+            filename = os.path.expanduser(filename)
+
+        self._filename = os.path.normpath(filename)
+
         # Load max size
-        try:
-            self._max_size = int(configuration['maxsize']) * 1024 * 1024
-        except KeyError:
-            self._max_size = 1 * 1024 * 1024
+        self._max_size = int(configuration.get('maxsize', 1)) * 1024 * 1024
 
         # Load backup count
-        try:
-            self._backup_count = int(configuration['backupcount'])
-        except KeyError:
-            self._backup_count = 2
+        self._backup_count = int(configuration.get('backupcount', 2))
 
         # Load log format
-        try:
-            self._format_string = configuration['format']
-        except KeyError:
-            self._format_string = '[%(asctime)s][%(levelname)s]: %(message)s'
+        self._format_string = configuration.get(
+            'format', '[%(asctime)s][%(levelname)s]: %(message)s')
 
         # Load date format
-        try:
-            self._date_format_string = configuration['dateformat']
-        except KeyError:
-            self._date_format_string = '%Y-%m-%d %H:%M:%S'
+        self._date_format_string = configuration.get(
+            'dateformat', '%Y-%m-%d %H:%M:%S')
+
+        # Load buffer capacity
+        self._buffer_capacity = int(configuration.get('buffercapacity', 512))
+
+        # Load flush level
+        self._flush_level = LOG_LEVEL_CONVERSION_MAP.get(
+            configuration.get('flushlevel', 'ERROR').upper(), LogLevels.ERROR)
 
     def _apply_configuration(self) -> None:
 
@@ -150,16 +410,36 @@ class FileLogTarget(LogTarget):
         """
 
         # Create the handler
-        self._handler = RotatingFileHandler(
+        self._file_handler = _RotatingFileHandler(
             filename=self._filename,
-            mode='a',
             maxBytes=self._max_size,
             backupCount=self._backup_count)
 
-        # Add the handler to the logger
-        self.Logger.addHandler(self._handler)
-
         # Set formatter
-        self._handler.setFormatter(logging.Formatter(
+        self._file_handler.setFormatter(get_log_formatter(
             fmt=self._format_string,
             datefmt=self._date_format_string))
+
+        # Buffer the log records in memory, so they are written to the file
+        # in batches instead of one by one. The buffer is also flushed when
+        # the Python log system is shut down at exit.
+        self._handler = self._file_handler
+        if self._buffer_capacity > 0:
+            self._handler = _BufferingHandler(
+                capacity=self._buffer_capacity,
+                flushLevel=PYTHON_LOG_LEVEL_MAP[self._flush_level],
+                target=self._file_handler,
+                flushOnClose=True)
+
+        # Add the handler to the logger
+        self.Logger.addHandler(self._handler)
+
+    def flush(self) -> None:
+
+        """Writes the log records buffered in memory to the log file.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        self._handler.flush()
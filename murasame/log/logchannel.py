@@ -23,13 +23,16 @@ Contains implementation of the LogChannel class.
 
 # Runtime Imports
 import logging
+from typing import Iterable
 
 # Murasame Imports
 from murasame.exceptions import InvalidInputError
-from murasame.log.loglevels import LogLevels, LOG_LEVEL_CONVERSION_MAP
+from murasame.log.loglevels import (
+    LogLevels,
+    LOG_LEVEL_CONVERSION_MAP,
+    PYTHON_LOG_LEVEL_MAP)
 from murasame.log.logentry import LogEntry
-from murasame.log.consolelogtarget import ConsoleLogTarget
-from murasame.log.filelogtarget import FileLogTarget
+from murasame.log.logtarget import LogTarget, get_target_type
 
 class LogChannel:
 
@@ -41,14 +44,28 @@ class LogChannel:
 
         _default_log_level (LogLevels): The default log level for the channel.
 
-        _targets (list): List of log targets this channel is writing to.
+        _targets (tuple): List of log targets this channel is writing to.
+
+        _target_writes (tuple): The write functions of the targets that write
+            log entries on their own, outside the Python logger.
 
         _logger (Logger)
 
+        _dispatcher (_AsyncDispatcher): The dispatcher that writes the log
+            entries of the channel on a background thread. Log entries are
+            written synchronously if there is none.
+
     Authors:
         Attila Kovacs
     """
 
+    __slots__ = ('_name',
+                 '_default_log_level',
+                 '_targets',
+                 '_target_writes',
+                 '_dispatcher',
+                 '_logger')
+
     @property
     def Name(self) -> str:
 
@@ -71,20 +88,32 @@ class LogChannel:
 
         return self._default_log_level
 
-    def __init__(self, configuration: dict) -> None:
+    def __init__(
+        self,
+        configuration: dict,
+        root_path: str = None,
+        dispatcher: '_AsyncDispatcher' = None) -> None:
 
         """Creates a new log channel instance.
 
         Args:
             configuration (dict): The configuration of the channel.
 
+            root_path (str): Root path of the log system, where the file log
+                targets of the channel write their log files.
+
+            dispatcher (_AsyncDispatcher): Optional dispatcher to write the
+                log entries of the channel on a background thread.
+
         Authors:
             Attila Kovacs
         """
 
         self._name = None
         self._default_log_level = None
-        self._targets = []
+        self._targets = ()
+        self._target_writes = ()
+        self._dispatcher = dispatcher
 
         self._load_configuration(configuration)
 
@@ -96,36 +125,106 @@ class LogChannel:
         # writers.
         self._logger.setLevel(logging.DEBUG)
 
-        self._load_targets(configuration)
+        # The log system owns the handlers of its channels, so the messages
+        # are not passed to the handlers of the parent loggers. This also
+        # spares walking the logger hierarchy for every message.
+        self._logger.propagate = False
+        self._logger.disabled = False
+
+        self._load_targets(configuration=configuration, root_path=root_path)
 
     def write(self, entry: LogEntry) -> None:
 
         """Writes a new log entry to the channel.
 
+        If the channel has a dispatcher, the entry is only queued and written
+        on the background thread of the dispatcher. Errors and more severe
+        entries are written immediately, after all the queued entries.
+
+        Args:
+            entry (LogEntry): The log entry to write.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        if self._dispatcher is None:
+            self.emit(entry=entry)
+            return
+
+        if entry.LogLevel >= LogLevels.ERROR:
+            self._dispatcher.flush()
+            self.emit(entry=entry)
+            return
+
+        # Format the message before it's queued, since the arguments can
+        # change by the time the entry is written.
+        entry.format_message()
+
+        # Create the record of the logger here, so it carries the time and
+        # the thread of the entry instead of those of the dispatcher
+        record = None
+        level = PYTHON_LOG_LEVEL_MAP[entry.LogLevel]
+        if self._logger.isEnabledFor(level):
+            record = self._logger.makeRecord(
+                self._logger.name, level, '(unknown file)', 0,
+                entry.Message, None, None)
+
+        self._dispatcher.dispatch(channel=self, entry=entry, record=record)
+
+    def write_many(self, entries: Iterable[LogEntry]) -> None:
+
+        """Writes multiple log entries to the channel in order, the same way
+        as write() does.
+
+        Args:
+            entries (Iterable[LogEntry]): The log entries to write.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        write = self.write
+
+        for entry in entries:
+            write(entry=entry)
+
+    def emit(self, entry: LogEntry, record: logging.LogRecord = None) -> None:
+
+        """Writes a log entry to the logger and the targets of the channel
+        on the calling thread.
+
         Args:
             entry (LogEntry): The log entry to write.
 
+            record (LogRecord): The record of the entry for the logger, if it
+                has been created already when the entry was written.
+
         Authors:
             Attila Kovacs
         """
 
         # Send the message to the central logger
-        if entry.LogLevel in (LogLevels.TRACE, LogLevels.DEBUG):
-            self._logger.debug(entry.Message)
-        elif entry.LogLevel in (LogLevels.INFO, LogLevels.NOTICE):
-            self._logger.info(entry.Message)
-        elif entry.LogLevel == LogLevels.NOTICE:
-            self._logger.info(entry.Message)
-        elif entry.LogLevel == LogLevels.WARNING:
-            self._logger.warning(entry.Message)
-        elif entry.LogLevel == LogLevels.ERROR:
-            self._logger.error(entry.Message)
-        elif entry.LogLevel in (LogLevels.CRITICAL, LogLevels.ALERT, LogLevels.EMERGENCY):
-            self._logger.fatal(entry.Message)
-
-        # Send the message to all targets
+        if record is None:
+            self._logger.log(PYTHON_LOG_LEVEL_MAP[entry.LogLevel],
+                             entry.Message)
+        else:
+            self._logger.handle(record)
+
+        # Send the message to all targets that write messages on their own
+        for target_write in self._target_writes:
+            target_write(entry=entry)
+
+    def flush(self) -> None:
+
+        """Writes the log messages buffered by the targets of the channel.
+
+        Authors:
+            Attila Kovacs
+        """
+
         for target in self._targets:
-            target.write(entry=entry)
+            target.flush()
 
     def _load_configuration(self, configuration: dict) -> None:
 
@@ -159,13 +258,15 @@ class LogChannel:
             # configuraiton.
             self._default_log_level = LogLevels.INFO
 
-    def _load_targets(self, configuration: dict) -> None:
+    def _load_targets(self, configuration: dict, root_path: str) -> None:
 
         """Loads the log targets of the channel from its serialized version.
 
         Args:
             configuration (dict): The configuration of the channel.
 
+            root_path (str): Root path of the log system.
+
         Authors:
             Attila Kovacs
         """
@@ -183,6 +284,8 @@ class LogChannel:
                 f'No log targets were found for channel '
                 f'{self._name}') from exception
 
+        log_targets = []
+
         for target in targets:
 
             # Determine target type
@@ -194,22 +297,28 @@ class LogChannel:
                 # the current one.
                 continue
 
-            log_target = None
+            # Skip the target if its type is not supported
+            target_class = get_target_type(target_type)
+            if target_class is None:
+                continue
 
             # Load the target based on type
             try:
-                if target_type == 'console':
-                    log_target = ConsoleLogTarget(logger=self._logger,
-                                                  configuration=target)
-                elif target_type == 'file':
-                    log_target = FileLogTarget(
-                        logger=self._logger,
-                        configuration=target,
-                        root_path=configuration['__log_root_path__'])
-
+                log_target = target_class(
+                    logger=self._logger,
+                    configuration=target,
+                    root_path=root_path)
             except InvalidInputError:
                 # Don't fail if the configuration of a target is wrong.
                 continue
 
-            if log_target is not None:
-                self._targets.append(log_target)
+            log_targets.append(log_target)
+
+        self._targets = tuple(log_targets)
+
+        # Only keep the write functions of the targets that actually implement
+        # it, the targets writing through the Python logger don't have to be
+        # called for every log entry
+        self._target_writes = tuple(
+            log_target.write for log_target in self._targets
+            if type(log_target).write is not LogTarget.write)
@@ -21,6 +21,10 @@
 Contains the implementation of the LogEntry class.
 """
 
+# Runtime Imports
+from datetime import datetime
+from typing import Union
+
 class LogEntry:
 
     """Representation of a single log entry.
@@ -28,9 +32,17 @@ class LogEntry:
     Attributes:
         _level (LogLevels): The log level of the entry.
 
-        _timestamp (datetime): The time when the entry has been created.
+        _timestamp (Union[datetime, float]): The time when the entry has been
+            created, either as a datetime or as a POSIX timestamp that is
+            converted when it is first accessed.
+
+        _message (str): The actual log message, optionally with %-style
+            placeholders for the arguments.
+
+        _args (tuple): Arguments to substitute in the log message.
 
-        _message (str): The actual log message.
+        _formatted_message (str): The log message with the arguments
+            substituted, created when the message is first accessed.
 
         _classname (str): Name of the class that sent the message.
 
@@ -38,6 +50,13 @@ class LogEntry:
         Attila Kovacs
     """
 
+    __slots__ = ('_level',
+                 '_timestamp',
+                 '_message',
+                 '_args',
+                 '_formatted_message',
+                 '_classname')
+
     @property
     def LogLevel(self) -> 'LogLevels':
 
@@ -54,22 +73,39 @@ class LogEntry:
 
         """The time when the entry has been created.
 
+        Entries created with a POSIX timestamp return it as a naive UTC
+        datetime.
+
         Authors:
             Attila Kovacs
         """
 
-        return self._timestamp
+        timestamp = self._timestamp
+
+        if not isinstance(timestamp, datetime):
+            timestamp = datetime.utcfromtimestamp(timestamp)
+            self._timestamp = timestamp
+
+        return timestamp
 
     @property
     def Message(self) -> str:
 
         """The actual log message.
 
+        The arguments of the entry are only substituted in the message when it
+        is first accessed.
+
         Authors:
             Attila Kovacs
         """
 
-        return self._message
+        message = self._formatted_message
+
+        if message is None:
+            message = self.format_message()
+
+        return message
 
     @property
     def Classname(self) -> str:
@@ -84,21 +120,28 @@ class LogEntry:
 
     def __init__(self,
                  level: 'LogLevels',
-                 timestamp: 'datetime',
+                 timestamp: Union[datetime, float],
                  message: str,
-                 classname: str) -> None:
+                 classname: str,
+                 args: tuple = ()) -> None:
 
         """Creates a new LogEntry instance.
 
         Args:
             level (LogLevels): The log level of the entry.
 
-            timestamp (datetime): The time when the entry has been created.
+            timestamp (Union[datetime, float]): The time when the entry has
+                been created. It can be a POSIX timestamp, so the datetime
+                object is only created if the time of the entry is actually
+                used.
 
             message (str): The actual log message.
 
             classname (str): Name of the class that created the log entry.
 
+            args (tuple): Optional arguments to substitute in the message using
+                %-style formatting.
+
         Authors:
             Attila Kovacs
         """
@@ -106,4 +149,27 @@ class LogEntry:
         self._level = level
         self._timestamp = timestamp
         self._message = message
+        self._args = args
+        self._formatted_message = None
         self._classname = classname
+
+    def format_message(self) -> str:
+
+        """Substitutes the arguments of the entry in its message, unless it
+        has been done already.
+
+        Returns:
+            str: The formatted log message.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        message = self._formatted_message
+
+        if message is None:
+            message = self._message % self._args if self._args \
+                else self._message
+            self._formatted_message = message
+
+        return message
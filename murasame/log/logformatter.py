@@ -0,0 +1,115 @@
+## ============================================================================
+##             **** Murasame Application Development Framework ****
+##                Copyright (C) 2019-2021, Suisei Entertainment
+## ============================================================================
+##
+##  Licensed under the Apache License, Version 2.0 (the "License");
+##  you may not use this file except in compliance with the License.
+##  You may obtain a copy of the License at
+##
+##      http://www.apache.org/licenses/LICENSE-2.0
+##
+##  Unless required by applicable law or agreed to in writing, software
+##  distributed under the License is distributed on an "AS IS" BASIS,
+##  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+##  See the License for the specific language governing permissions and
+##  limitations under the License.
+##
+## ============================================================================
+
+"""
+Contains the implementation of the LogFormatter class.
+"""
+
+# Runtime Imports
+import logging
+import time
+from functools import lru_cache
+
+class LogFormatter(logging.Formatter):
+
+    """Log formatter used by the log targets of the framework.
+
+    Formatting the time of a log record is relatively expensive, so the
+    formatted time is cached and reused for all records created within the
+    same second.
+
+    Attributes:
+        _time_cache (tuple): The second, the date format and the formatted
+            time of the last formatted record.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    def __init__(self, fmt: str = None, datefmt: str = None) -> None:
+
+        """Creates a new LogFormatter instance.
+
+        Args:
+            fmt (str): The format string of the log messages.
+
+            datefmt (str): The format string of the time of the log messages.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        super().__init__(fmt=fmt, datefmt=datefmt)
+
+        self._time_cache = (None, None, None)
+
+    def formatTime(self,
+                   record: logging.LogRecord,
+                   datefmt: str = None) -> str:
+
+        """Returns the creation time of the given log record as a string.
+
+        Args:
+            record (LogRecord): The log record to format the time of.
+
+            datefmt (str): The format string of the time.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        #pylint: disable=invalid-name
+
+        second = int(record.created)
+        cached_second, cached_datefmt, formatted_time = self._time_cache
+
+        if second != cached_second or datefmt != cached_datefmt:
+            formatted_time = time.strftime(
+                datefmt or self.default_time_format,
+                self.converter(second))
+
+            # Stored as a single tuple, so concurrent handlers never see a
+            # partially updated cache
+            self._time_cache = (second, datefmt, formatted_time)
+
+        if datefmt:
+            return formatted_time
+
+        return self.default_msec_format % (formatted_time, record.msecs)
+
+@lru_cache(maxsize=32)
+def get_log_formatter(fmt: str = None, datefmt: str = None) -> LogFormatter:
+
+    """Returns a shared log formatter for the given format strings.
+
+    Log targets with the same format share the same formatter instance, and
+    with it the cached formatted time.
+
+    Args:
+        fmt (str): The format string of the log messages.
+        datefmt (str): The format string of the time of the log messages.
+
+    Returns:
+        LogFormatter: The log formatter of the given format.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    return LogFormatter(fmt=fmt, datefmt=datefmt)
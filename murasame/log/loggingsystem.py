@@ -22,16 +22,316 @@ Contains the implementation of the LoggingSystem class.
 """
 
 # Runtime Imports
+import atexit
+import json
 import os
+import sys
+import threading
+import time
+from queue import Empty, SimpleQueue
 from typing import Union
+from weakref import WeakSet
 
 # Murasame Imports
 from murasame.constants import MURASAME_LOGGING_CONFIG
 from murasame.exceptions import InvalidInputError
-from murasame.utils import JsonFile
 from murasame.log.logchannel import LogChannel
 from murasame.log.defaultlogconfig import DEFAULT_LOG_CONFIG
 
+# The time in seconds after which the log messages buffered by the log
+# targets are written, even if their buffers are not full.
+LOG_FLUSH_INTERVAL = 30
+
+# The time in seconds between two checks whether the dispatcher thread is
+# still alive while waiting for it to write the queued log entries.
+LOG_FLUSH_TIMEOUT = 1
+
+# The dispatcher shared by all log systems.
+_DISPATCHER = None
+_DISPATCHER_LOCK = threading.Lock()
+
+class _AsyncDispatcher:
+
+    """Writes log entries to their log channels on a background thread, so
+    the threads creating the entries don't have to wait for the handlers.
+
+    The dispatcher also periodically flushes the log systems registered in
+    it, so log messages buffered by the targets are not kept in memory
+    indefinitely. The log systems are only referenced weakly, so they can be
+    released while the dispatcher is running.
+
+    Attributes:
+        _queue (SimpleQueue): The queue of log entries waiting to be written,
+            together with their channels.
+
+        _log_systems (WeakSet): The log systems to flush periodically.
+
+        _flush_interval (float): The time between two flushes in seconds.
+
+        _lock (Lock): Lock that makes queueing an entry and shutting down the
+            dispatcher mutually exclusive, so no entry is queued after the
+            shutdown request.
+
+        _running (bool): Whether or not the background thread is running.
+
+        _thread (Thread): The background thread writing the log entries.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    def __init__(self, flush_interval: float = LOG_FLUSH_INTERVAL) -> None:
+
+        """Creates a new _AsyncDispatcher instance and starts its background
+        thread.
+
+        Args:
+            flush_interval (float): The time between two flushes in seconds.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        self._queue = SimpleQueue()
+        self._log_systems = WeakSet()
+        self._flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._running = True
+        self._thread = threading.Thread(target=self._run,
+                                        name='murasame.log',
+                                        daemon=True)
+        self._thread.start()
+
+    def register(self, log_system: 'LoggingSystem') -> None:
+
+        """Registers a log system to be flushed periodically.
+
+        Args:
+            log_system (LoggingSystem): The log system to register.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        self._log_systems.add(log_system)
+
+    def unregister(self, log_system: 'LoggingSystem') -> None:
+
+        """Stops flushing a log system periodically.
+
+        Args:
+            log_system (LoggingSystem): The log system to unregister.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        self._log_systems.discard(log_system)
+
+    def dispatch(self,
+                 channel: 'LogChannel',
+                 entry: 'LogEntry',
+                 record: 'LogRecord' = None) -> None:
+
+        """Queues a log entry to be written to the given channel.
+
+        The entry is written immediately if the dispatcher has already been
+        shut down.
+
+        Args:
+            channel (LogChannel): The channel to write the entry to.
+
+            entry (LogEntry): The entry to write.
+
+            record (LogRecord): The record of the entry for the logger of the
+                channel, created on the thread that wrote the entry.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        with self._lock:
+            if self._running:
+                self._queue.put_nowait((channel, entry, record))
+                return
+
+        channel.emit(entry=entry, record=record)
+
+    def flush(self) -> None:
+
+        """Waits until all the entries queued so far have been written.
+
+        If the background thread has stopped unexpectedly, the queued entries
+        are written on the calling thread instead.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        # Log entries written by the handlers themselves would wait for
+        # themselves.
+        if threading.current_thread() is self._thread:
+            return
+
+        with self._lock:
+            if not self._running:
+                return
+
+            written = threading.Event()
+            self._queue.put_nowait((None, written, None))
+
+        while not written.wait(timeout=LOG_FLUSH_TIMEOUT):
+            if not self._thread.is_alive():
+                self._drain()
+                return
+
+    def shutdown(self) -> None:
+
+        """Writes all queued entries and stops the background thread.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        with self._lock:
+            if not self._running:
+                return
+
+            self._running = False
+            self._queue.put_nowait((None, None, None))
+
+        self._thread.join()
+
+        # Write whatever the background thread didn't get to, in case it has
+        # stopped unexpectedly.
+        self._drain()
+
+    def _run(self) -> None:
+
+        """Writes the queued log entries until the dispatcher is shut down.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        next_flush = time.monotonic() + self._flush_interval
+
+        while True:
+
+            # Wait for the next entry until the next flush is due
+            timeout = next_flush - time.monotonic()
+            if timeout <= 0:
+                self._flush_log_systems()
+                timeout = self._flush_interval
+                next_flush = time.monotonic() + timeout
+
+            try:
+                batch = [self._queue.get(timeout=timeout)]
+            except Empty:
+                continue
+
+            # Take everything else queued in the meantime as well, so a burst
+            # of entries is written in one go
+            try:
+                while True:
+                    batch.append(self._queue.get_nowait())
+            except Empty:
+                pass
+
+            if not self._write_batch(batch=batch):
+                return
+
+    def _drain(self) -> None:
+
+        """Writes all queued log entries on the calling thread.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        batch = []
+
+        try:
+            while True:
+                batch.append(self._queue.get_nowait())
+        except Empty:
+            pass
+
+        self._write_batch(batch=batch)
+
+    @staticmethod
+    def _write_batch(batch: list) -> bool:
+
+        """Writes a batch of queued log entries to their channels.
+
+        Args:
+            batch (list): The queued items, each a channel, an entry and
+                the record of the entry.
+
+        Returns:
+            bool: 'False' if the batch contained a shutdown request, 'True'
+                otherwise.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        for channel, entry, record in batch:
+
+            if channel is None:
+
+                # Shutdown request
+                if entry is None:
+                    return False
+
+                # Flush request
+                entry.set()
+                continue
+
+            try:
+                channel.emit(entry=entry, record=record)
+            except Exception: #pylint: disable=broad-except
+                # A failing target must not stop the log system.
+                continue
+
+        return True
+
+    def _flush_log_systems(self) -> None:
+
+        """Flushes the buffered log messages of the registered log systems.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        for log_system in list(self._log_systems):
+            try:
+                log_system.flush()
+            except Exception: #pylint: disable=broad-except
+                # A failing target must not stop the log system.
+                continue
+
+def _get_dispatcher() -> _AsyncDispatcher:
+
+    """Returns the dispatcher shared by all log systems.
+
+    The dispatcher and its background thread are created with the first log
+    system, and are shut down when the application exits.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    #pylint: disable=global-statement
+    global _DISPATCHER
+
+    with _DISPATCHER_LOCK:
+        if _DISPATCHER is None:
+            _DISPATCHER = _AsyncDispatcher()
+            atexit.register(_DISPATCHER.shutdown)
+
+    return _DISPATCHER
+
 class LoggingSystem:
 
     """Default log system implementation.
@@ -42,6 +342,10 @@ class LoggingSystem:
         _root_path (str): The root path in the file system where log files are
             written.
 
+        _dispatcher (_AsyncDispatcher): The dispatcher that writes the log
+            entries of all channels on a background thread. It is shared by
+            all log systems.
+
     Authors:
         Attila Kovacs
     """
@@ -70,12 +374,17 @@ class LoggingSystem:
         If no log configuration is found, it will start with a default
         log configuration for the framework.
 
+        Log entries below the error level are written on a background thread.
+        The queued entries are written when the application exits.
+
         Authors:
             Attila Kovacs
         """
 
         self._channels = {}
         self._root_path = None
+        self._dispatcher = _get_dispatcher()
+        self._dispatcher.register(self)
 
         if not self._load_configuration():
             self._load_default_configuration()
@@ -105,14 +414,42 @@ class LoggingSystem:
         Args:
             name (str): Name of the channel to retrieve.
 
+        Returns:
+            Union[LogChannel, None]: The log channel, or 'None' if the channel
+                is not registered.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        return self._channels.get(name)
+
+    def flush(self) -> None:
+
+        """Writes the log messages buffered by the log channels.
+
         Authors:
             Attila Kovacs
         """
 
-        if self.has_channel(name):
-            return self._channels[name]
+        for channel in list(self._channels.values()):
+            channel.flush()
 
-        return None
+    def shutdown(self) -> None:
+
+        """Writes all queued log entries and stops flushing the log system
+        periodically.
+
+        The background thread is shared by all log systems, so it keeps
+        running until the application exits.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        self._dispatcher.flush()
+        self._dispatcher.unregister(self)
+        self.flush()
 
     def _load_configuration(self) -> bool:
 
@@ -122,21 +459,31 @@ class LoggingSystem:
             bool: 'True' if the configuration was loaded successfully 'False'
                 otherwise.
 
+        Raises:
+            InvalidInputError: Raised if the configuration file cannot be read
+                or parsed.
+
         Authors:
             Attila Kovacs
         """
 
         config_path = MURASAME_LOGGING_CONFIG
 
-        # Check whether or not there is a log configuration file in the
-        # config directory of the application
-        if not os.path.isfile(config_path):
+        # Load the configuration file from the config directory of the
+        # application if there is one
+        try:
+            with open(config_path, 'rb') as config_file:
+                config = json.loads(config_file.read())
+        except FileNotFoundError:
             return False
-
-        # Load the configuration file
-        config_file = JsonFile(path=config_path)
-        config_file.load()
-        config = config_file.Content
+        except OSError as exception:
+            raise InvalidInputError(
+                f'Failed to read the log configuration file '
+                f'{config_path}.') from exception
+        except ValueError as exception:
+            raise InvalidInputError(
+                f'Failed to parse the log configuration file '
+                f'{config_path}.') from exception
 
         # Get the root log path from the configuration
         if not 'rootpath' in config:
@@ -145,12 +492,11 @@ class LoggingSystem:
         self._root_path = os.path.abspath(os.path.expanduser(config['rootpath']))
 
         # Create the root log directory if it doesn't exist
-        if not os.path.isdir(self._root_path):
-            try:
-                os.makedirs(self._root_path, exist_ok=True)
-            except OSError:
-                # Failed to create the root path
-                return False
+        try:
+            os.makedirs(self._root_path, exist_ok=True)
+        except OSError:
+            # Failed to create the root path
+            return False
 
         # Check for log channel configuration
         if not 'channels' in config:
@@ -160,13 +506,11 @@ class LoggingSystem:
 
         for channel in channels:
 
-            # Append the root path to the configuration to the channel for
-            # file log targets
-            channel['__log_root_path__'] = self._root_path
-
             try:
-                log_channel = LogChannel(configuration=channel)
-                self._channels[log_channel.Name] = log_channel
+                log_channel = LogChannel(configuration=channel,
+                                         root_path=self._root_path,
+                                         dispatcher=self._dispatcher)
+                self._channels[sys.intern(log_channel.Name)] = log_channel
             except InvalidInputError:
                 # Don't fail if the configuration of a channel is wrong
                 continue
@@ -190,22 +534,19 @@ class LoggingSystem:
 
         self._root_path = os.path.abspath(os.path.expanduser(DEFAULT_LOG_CONFIG['rootpath']))
 
-        if not os.path.isdir(self._root_path):
-            try:
-                os.makedirs(self._root_path, exist_ok=True)
-            except OSError as error:
-                raise RuntimeError(f'Failed to create the root log '
-                                   f'directory: {self._root_path}') from error
+        try:
+            os.makedirs(self._root_path, exist_ok=True)
+        except OSError as error:
+            raise RuntimeError(f'Failed to create the root log '
+                               f'directory: {self._root_path}') from error
 
         for channel in DEFAULT_LOG_CONFIG['channels']:
 
-            # Append the root path to the configuration to the channel for
-            # file log targets
-            channel['__log_root_path__'] = self._root_path
-
             try:
-                log_channel = LogChannel(configuration=channel)
-                self._channels[log_channel.Name] = log_channel
+                log_channel = LogChannel(configuration=channel,
+                                         root_path=self._root_path,
+                                         dispatcher=self._dispatcher)
+                self._channels[sys.intern(log_channel.Name)] = log_channel
             except InvalidInputError as error:
                 raise InvalidInputError(
                     'Invalid default log configuration.') from error
@@ -22,7 +22,9 @@ Contains the implementation of the LogLevels class.
 """
 
 # Runtime Imports
+import logging
 from enum import IntEnum, auto
+from types import MappingProxyType
 
 class LogLevels(IntEnum):
 
@@ -58,8 +60,9 @@ class LogLevels(IntEnum):
     ALERT = auto()
     EMERGENCY = auto()
 
-# Conversion map to use when reading the log level from a string.
-LOG_LEVEL_CONVERSION_MAP = \
+# Conversion map to use when reading the log level from a string. The map is
+# read-only since it is shared by every log channel and log target.
+LOG_LEVEL_CONVERSION_MAP = MappingProxyType(
 {
     'TRACE': LogLevels.TRACE,
     'DEBUG': LogLevels.DEBUG,
@@ -70,4 +73,18 @@ LOG_LEVEL_CONVERSION_MAP = \
     'CRITICAL': LogLevels.CRITICAL,
     'ALERT': LogLevels.ALERT,
     'EMERGENCY': LogLevels.EMERGENCY
+})
+
+# Conversion map to use when passing a log level to the Python log system.
+PYTHON_LOG_LEVEL_MAP = \
+{
+    LogLevels.TRACE: logging.DEBUG,
+    LogLevels.DEBUG: logging.DEBUG,
+    LogLevels.INFO: logging.INFO,
+    LogLevels.NOTICE: logging.INFO,
+    LogLevels.WARNING: logging.WARNING,
+    LogLevels.ERROR: logging.ERROR,
+    LogLevels.CRITICAL: logging.FATAL,
+    LogLevels.ALERT: logging.FATAL,
+    LogLevels.EMERGENCY: logging.FATAL
 }
@@ -20,6 +20,71 @@
 Contains the implementation of the LogTarget class.
 """
 
+# Runtime Imports
+import importlib
+from typing import Callable, Union
+
+# Log target implementations, keyed by the target type name used in the log
+# configuration.
+_TARGET_TYPES = {}
+
+# Modules of the built-in log targets, keyed by their target type name. They
+# are only imported when a log configuration uses them.
+_BUILTIN_TARGET_MODULES = \
+{
+    'console': 'murasame.log.consolelogtarget',
+    'file': 'murasame.log.filelogtarget'
+}
+
+def register_target(name: str) -> Callable:
+
+    """Class decorator that registers a log target implementation for the
+    given target type, so log channels can create it from their
+    configuration.
+
+    The target class is created with the logger, the configuration of the
+    target and the root path of the log system as keyword arguments.
+
+    Args:
+        name (str): The type name of the target in the log configuration.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    def decorator(target_class: type) -> type:
+        _TARGET_TYPES[name] = target_class
+        return target_class
+
+    return decorator
+
+def get_target_type(name: str) -> Union[type, None]:
+
+    """Returns the log target implementation registered for a given target
+    type.
+
+    The module of a built-in target is imported on its first lookup, which
+    registers the target.
+
+    Args:
+        name (str): The type name of the target in the log configuration.
+
+    Returns:
+        Union[type, None]: The log target class, or 'None' if no target is
+            registered with the given name.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    target_type = _TARGET_TYPES.get(name)
+
+    if target_type is None and name in _BUILTIN_TARGET_MODULES:
+        importlib.import_module(_BUILTIN_TARGET_MODULES[name])
+        target_type = _TARGET_TYPES.get(name)
+
+    return target_type
+
 class LogTarget:
 
     """Common base class for log target implementations.
@@ -31,6 +96,8 @@ class LogTarget:
         Attila Kovacs
     """
 
+    __slots__ = ('_logger',)
+
     @property
     def Logger(self) -> 'Logger':
 
@@ -74,3 +141,15 @@ class LogTarget:
         #pylint: disable=no-self-use
 
         del entry
+
+    def flush(self) -> None:
+
+        """Writes the log messages buffered by the target.
+
+        This function does not do anything by default. It is here to provide a
+        way for log target implementations that buffer their log messages to
+        write them periodically.
+
+        Authors:
+            Attila Kovacs
+        """
@@ -22,13 +22,39 @@ Contains the implementation of the LogWriter class.
 """
 
 # Runtime Imports
-from datetime import datetime
+import os
+import time
+from collections import deque
+from functools import lru_cache
 
 # Murasame Imports
+from murasame.constants import MURASAME_MIN_LOG_LEVEL_VARIABLE
+from murasame.utils import systemlocator
 from murasame.utils.systemlocator import SystemLocator
-from murasame.log.loglevels import LogLevels
+from murasame.log.loglevels import LOG_LEVEL_CONVERSION_MAP, LogLevels
 from murasame.log.logentry import LogEntry
 
+# Numeric values of the log levels. The level guards of the writer compare
+# against these, so disabled log calls don't have to look up the enum members.
+_TRACE = int(LogLevels.TRACE)
+_DEBUG = int(LogLevels.DEBUG)
+_INFO = int(LogLevels.INFO)
+_NOTICE = int(LogLevels.NOTICE)
+_WARNING = int(LogLevels.WARNING)
+_ERROR = int(LogLevels.ERROR)
+_CRITICAL = int(LogLevels.CRITICAL)
+_ALERT = int(LogLevels.ALERT)
+
+# The lowest log level that can be written in this process, read from the
+# environment when the module is imported.
+_MIN_LOG_LEVEL = LOG_LEVEL_CONVERSION_MAP.get(
+    os.environ.get(MURASAME_MIN_LOG_LEVEL_VARIABLE, '').upper(),
+    LogLevels.TRACE)
+
+# The maximum amount of log entries a writer caches while the log service is
+# unavailable. The oldest entries are dropped when the cache is full.
+LOG_WRITER_CACHE_SIZE = 1024
+
 class LogWriter:
 
     """Utility class that represents an object that wants to write into the log.
@@ -37,8 +63,9 @@ class LogWriter:
         _cache_entries (bool): Whether or not log entries should be cached if
             the log service is unavailable.
 
-        _cache (list): Stores cached log entries until they are sent to the log
-            channel after attach.
+        _cache (deque): Stores cached log entries until they are sent to the
+            log channel after attach. It holds at most LOG_WRITER_CACHE_SIZE
+            entries, the oldest entries are dropped when it's full.
 
         _channel_name (str): Name of the channel this writer logs to.
 
@@ -52,10 +79,27 @@ class LogWriter:
         _log_writer_suspended (bool): Whether or not the log writer has been
             suspended.
 
+        _classname (str): Name of the class of the writer, sent with the log
+            entries.
+
+        _attach_generation (int): The generation of the system locator at the
+            last attempt to attach to the log channel. Attaching is only
+            retried once the registered systems have changed.
+
     Authors:
         Attila Kovacs
     """
 
+    __slots__ = ('_cache_entries',
+                 '_cache',
+                 '_channel_name',
+                 '_log_level',
+                 '_log_level_overwritten',
+                 '_channel',
+                 '_log_writer_suspended',
+                 '_classname',
+                 '_attach_generation')
+
     @property
     def LogLevel(self) -> LogLevels:
 
@@ -99,7 +143,7 @@ class LogWriter:
             Attila Kovacs
         """
 
-        return self._cache
+        return list(self._cache)
 
     def __init__(self, channel_name: str, cache_entries: bool = False) -> None:
 
@@ -115,10 +159,12 @@ class LogWriter:
         """
 
         self._cache_entries = cache_entries
-        self._cache = []
+        self._cache = deque(maxlen=LOG_WRITER_CACHE_SIZE)
         self._channel_name = channel_name
         self._log_level = None
         self._log_level_overwritten = False
+        self._classname = type(self).__name__
+        self._attach_generation = None
         self._channel = self._attach()
         self._log_writer_suspended = False
 
@@ -173,7 +219,32 @@ class LogWriter:
 
         self._log_writer_suspended = False
 
-    def trace(self, message: str) -> None:
+    def is_enabled_for(self, level: LogLevels) -> bool:
+
+        """Returns whether or not a message with the given log level would be
+        written by this writer.
+
+        Args:
+            level (LogLevels): The log level to check.
+
+        Returns:
+            bool: 'True' if a message with the given log level would be
+                written, 'False' otherwise.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        if self._log_writer_suspended or level < _MIN_LOG_LEVEL:
+            return False
+
+        # Attach to the current log channel, so its default log level is used
+        if not self._log_level_overwritten:
+            self._try_attach()
+
+        return self._log_level <= level
+
+    def trace(self, message: str, *args) -> None:
 
         """Writes a new trace level log message to the log channel, if the
         configured log level allows it.
@@ -181,18 +252,22 @@ class LogWriter:
         Args:
             message (str): The log message to write.
 
+            args: Optional arguments to substitute in the message using
+                %-style formatting. The message is only formatted if it is
+                actually written.
+
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
+        if self._log_writer_suspended or self._log_level > _TRACE:
             return
 
-        if self._log_level == LogLevels.TRACE:
-            entry = self._make_entry(level=LogLevels.TRACE, message=message)
-            self._log(entry=entry)
+        entry = self._make_entry(
+            level=LogLevels.TRACE, message=message, args=args)
+        self._log(entry=entry)
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
 
         """Writes a new debug level log message to the log channel, if the
         configured log level allows it.
@@ -200,18 +275,22 @@ class LogWriter:
         Args:
             message (str): The log message to write.
 
+            args: Optional arguments to substitute in the message using
+                %-style formatting. The message is only formatted if it is
+                actually written.
+
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
+        if self._log_writer_suspended or self._log_level > _DEBUG:
             return
 
-        if self._log_level <= LogLevels.DEBUG:
-            entry = self._make_entry(level=LogLevels.DEBUG, message=message)
-            self._log(entry=entry)
+        entry = self._make_entry(
+            level=LogLevels.DEBUG, message=message, args=args)
+        self._log(entry=entry)
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args) -> None:
 
         """Writes a new info level log message to the log channel, if the
         configured log level allows it.
@@ -219,18 +298,22 @@ class LogWriter:
         Args:
             message (str): The log message to write.
 
+            args: Optional arguments to substitute in the message using
+                %-style formatting. The message is only formatted if it is
+                actually written.
+
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
+        if self._log_writer_suspended or self._log_level > _INFO:
             return
 
-        if self._log_level <= LogLevels.INFO:
-            entry = self._make_entry(level=LogLevels.INFO, message=message)
-            self._log(entry=entry)
+        entry = self._make_entry(
+            level=LogLevels.INFO, message=message, args=args)
+        self._log(entry=entry)
 
-    def notice(self, message: str) -> None:
+    def notice(self, message: str, *args) -> None:
 
         """Writes a new notice level log message to the log channel, if the
         configured log level allows it.
@@ -238,18 +321,22 @@ class LogWriter:
         Args:
             message (str): The log message to write.
 
+            args: Optional arguments to substitute in the message using
+                %-style formatting. The message is only formatted if it is
+                actually written.
+
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
+        if self._log_writer_suspended or self._log_level > _NOTICE:
             return
 
-        if self._log_level <= LogLevels.NOTICE:
-            entry = self._make_entry(level=LogLevels.NOTICE, message=message)
-            self._log(entry=entry)
+        entry = self._make_entry(
+            level=LogLevels.NOTICE, message=message, args=args)
+        self._log(entry=entry)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
 
         """Writes a new warning level log message to the log channel, if the
         configured log level allows it.
@@ -257,18 +344,22 @@ class LogWriter:
         Args:
             message (str): The log message to write.
 
+            args: Optional arguments to substitute in the message using
+                %-style formatting. The message is only formatted if it is
+                actually written.
+
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
+        if self._log_writer_suspended or self._log_level > _WARNING:
             return
 
-        if self._log_level <= LogLevels.WARNING:
-            entry = self._make_entry(level=LogLevels.WARNING, message=message)
-            self._log(entry=entry)
+        entry = self._make_entry(
+            level=LogLevels.WARNING, message=message, args=args)
+        self._log(entry=entry)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
 
         """Writes a new error level log message to the log channel, if the
         configured log level allows it.
@@ -276,18 +367,22 @@ class LogWriter:
         Args:
             message (str): The log message to write.
 
+            args: Optional arguments to substitute in the message using
+                %-style formatting. The message is only formatted if it is
+                actually written.
+
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
+        if self._log_writer_suspended or self._log_level > _ERROR:
             return
 
-        if self._log_level <= LogLevels.ERROR:
-            entry = self._make_entry(level=LogLevels.ERROR, message=message)
-            self._log(entry=entry)
+        entry = self._make_entry(
+            level=LogLevels.ERROR, message=message, args=args)
+        self._log(entry=entry)
 
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args) -> None:
 
         """Writes a new critical level log message to the log channel, if the
         configured log level allows it.
@@ -295,18 +390,22 @@ class LogWriter:
         Args:
             message (str): The log message to write.
 
+            args: Optional arguments to substitute in the message using
+                %-style formatting. The message is only formatted if it is
+                actually written.
+
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
+        if self._log_writer_suspended or self._log_level > _CRITICAL:
             return
 
-        if self._log_level <= LogLevels.CRITICAL:
-            entry = self._make_entry(level=LogLevels.CRITICAL, message=message)
-            self._log(entry=entry)
+        entry = self._make_entry(
+            level=LogLevels.CRITICAL, message=message, args=args)
+        self._log(entry=entry)
 
-    def alert(self, message: str) -> None:
+    def alert(self, message: str, *args) -> None:
 
         """Writes a new alert level log message to the log channel, if the
         configured log level allows it.
@@ -314,18 +413,22 @@ class LogWriter:
         Args:
             message (str): The log message to write.
 
+            args: Optional arguments to substitute in the message using
+                %-style formatting. The message is only formatted if it is
+                actually written.
+
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
+        if self._log_writer_suspended or self._log_level > _ALERT:
             return
 
-        if self._log_level <= LogLevels.ALERT:
-            entry = self._make_entry(level=LogLevels.ALERT, message=message)
-            self._log(entry=entry)
+        entry = self._make_entry(
+            level=LogLevels.ALERT, message=message, args=args)
+        self._log(entry=entry)
 
-    def emergency(self, message: str) -> None:
+    def emergency(self, message: str, *args) -> None:
 
         """Writes a new emergency level log message to the log channel, if the
         configured log level allows it.
@@ -333,14 +436,19 @@ class LogWriter:
         Args:
             message (str): The log message to write.
 
+            args: Optional arguments to substitute in the message using
+                %-style formatting. The message is only formatted if it is
+                actually written.
+
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
+        if self._log_writer_suspended:
             return
 
-        entry = self._make_entry(level=LogLevels.EMERGENCY, message=message)
+        entry = self._make_entry(
+            level=LogLevels.EMERGENCY, message=message, args=args)
         self._log(entry=entry)
 
     def _log(self, entry: LogEntry) -> None:
@@ -354,16 +462,34 @@ class LogWriter:
             Attila Kovacs
         """
 
-        # Try to attach to the log channel if not already attached
-        if not self._channel:
+        # Attach again if the registered systems have changed since the last
+        # attempt, e.g. the log system has been replaced. Reading the counter
+        # doesn't look up the system locator or the provider.
+        if systemlocator.PROVIDER_GENERATION != self._attach_generation:
             self._channel = self._attach()
 
         if self._channel:
             # Empty the cache if there if there are cached entries
-            self._flush_cache()
+            if self._cache:
+                self._flush_cache()
             self._channel.write(entry=entry)
         elif self._cache_entries:
-            self._cache_entry(entry=entry)
+            self._cache.append(entry)
+
+    def _try_attach(self) -> None:
+
+        """Attaches this log writer to its log channel again, unless the
+        registered systems haven't changed since the last attempt.
+
+        This also detaches the writer from the channel of a log system that
+        is no longer registered.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        if systemlocator.PROVIDER_GENERATION != self._attach_generation:
+            self._channel = self._attach()
 
     def _attach(self) -> 'LogChannel':
 
@@ -387,22 +513,24 @@ class LogWriter:
 
         # Get the channel based on its name
         from murasame.api import LoggingAPI
-        log_system= SystemLocator.instance().get_provider(LoggingAPI)
+        locator = SystemLocator.instance()
+        self._attach_generation = systemlocator.PROVIDER_GENERATION
+        log_system = locator.get_provider(LoggingAPI)
 
         if log_system:
             channel = log_system.get_channel(self._channel_name)
 
-            if not channel:
-                self._log_level = LogLevels.INFO
-                return None
-
-            self._log_level = channel.DefaultLogLevel
-        else:
-            self._log_level = LogLevels.INFO
+        # Keep the log level set explicitly on the writer
+        if not self._log_level_overwritten:
+            self._log_level = channel.DefaultLogLevel if channel \
+                else LogLevels.INFO
 
         return channel
 
-    def _make_entry(self, level: LogLevels, message: str) -> LogEntry:
+    def _make_entry(self,
+                    level: LogLevels,
+                    message: str,
+                    args: tuple = ()) -> LogEntry:
 
         """Creates a new log entry.
 
@@ -411,36 +539,70 @@ class LogWriter:
 
             message (str): The log message.
 
+            args (tuple): Arguments to substitute in the log message.
+
         Authors:
             Attila Kovacs
         """
 
         return LogEntry(level=level,
-                        timestamp=datetime.utcnow(),
+                        timestamp=time.time(),
                         message=message,
-                        classname=self.__class__.__name__)
+                        classname=self._classname,
+                        args=args)
 
-    def _cache_entry(self, entry: LogEntry) -> None:
-
-        """Adds a new entry to the log cache.
+    def _flush_cache(self) -> None:
 
-        Args:
-            entry (LogEntry): The log entry to cache.
+        """Sends all cached log entries to the channel.
 
         Authors:
             Attila Kovacs
         """
 
-        self._cache.append(entry)
+        self._channel.write_many(entries=self._cache)
+        self._cache.clear()
 
-    def _flush_cache(self) -> None:
+def _disabled_log_method(self: LogWriter, message: str, *args) -> None:
 
-        """Sends all cached log entries to the channel.
+    """Replaces the log methods of the levels disabled by the
+    MURASAME_MIN_LOG_LEVEL environment variable.
 
-        Authors:
-            Attila Kovacs
-        """
+    Args:
+        message (str): The log message, which is ignored.
 
-        for entry in self._cache:
-            self._channel.write(entry)
-        self._cache.clear()
+        args: Arguments of the log message, which are ignored.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    del self, message, args
+
+# Replace the log methods below the minimum log level, so calling them costs
+# nothing beyond the call itself
+for _level in LogLevels:
+    if _level < _MIN_LOG_LEVEL:
+        setattr(LogWriter, _level.name.lower(), _disabled_log_method)
+del _level
+
+@lru_cache(maxsize=None)
+def get_log_writer(channel_name: str, cache_entries: bool = False) -> LogWriter:
+
+    """Returns a shared log writer for the given log channel.
+
+    The log writer is only created on the first call for a given channel and
+    cache setting, subsequent calls return the same instance.
+
+    Args:
+        channel_name (str): Name of the channel the writer logs to.
+        cache_entries (bool): Whether or not log entries should be cached
+            if the log service is not available.
+
+    Returns:
+        LogWriter: The log writer of the given channel.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    return LogWriter(channel_name=channel_name, cache_entries=cache_entries)
@@ -271,7 +271,8 @@ class VFS(LogWriter):
             self,
             node_name: str,
             recursive: bool = False,
-            filename_filter: str = None) -> list:
+            filename_filter: str = None,
+            suffix: str = None) -> list:
 
         """Returns a list of all VFS file nodes under a given directory node.
 
@@ -285,6 +286,10 @@ class VFS(LogWriter):
             filename_filter (str): Optional filter string to only include files
                 in the result list that match the given filter.
 
+            suffix (str): Optional suffix to only include files in the result
+                list whose name ends with it. Takes precedence over
+                filename_filter.
+
         Returns:
             list: A list of VFS file nodes.
 
@@ -317,7 +322,8 @@ class VFS(LogWriter):
             return  []
 
         return node.get_all_files(recursive=recursive,
-                                  filename_filter=filename_filter)
+                                  filename_filter=filename_filter,
+                                  suffix=suffix)
 
     def _register_directory(self, path: str) -> None:
 
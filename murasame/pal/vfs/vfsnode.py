@@ -781,7 +781,8 @@ class VFSNode(LogWriter):
     def get_all_files(
             self,
             recursive: bool = False,
-            filename_filter: str = None) -> list:
+            filename_filter: str = None,
+            suffix: str = None) -> list:
 
         """Returns a list of all VFS file nodes under this node.
 
@@ -792,22 +793,29 @@ class VFSNode(LogWriter):
             filename_filter (str): Optional filter string to only include files
                 in the result list that match the given filter.
 
+            suffix (str): Optional suffix to only include files in the result
+                list whose name ends with it. Takes precedence over
+                filename_filter.
+
         Returns:
             A list of VFS file nodes.
         """
 
-        result = []
+        files = self.Files.values()
 
-        for dummy, file in self.Files:
-            if filename_filter is not None:
-                if filename_filter in file.Name:
-                    result.append(file)
-            else:
-                result.append(file)
+        if suffix is not None:
+            result = [file for file in files if file.Name.endswith(suffix)]
+        elif filename_filter is not None:
+            result = [file for file in files if filename_filter in file.Name]
+        else:
+            result = list(files)
 
         if recursive:
-            for dummy, subdirectory in self.Subdirectories.items():
-                result.extend(subdirectory.get_all_files())
+            for subdirectory in self.Subdirectories.values():
+                result.extend(subdirectory.get_all_files(
+                    recursive=True,
+                    filename_filter=filename_filter,
+                    suffix=suffix))
 
         return  result
 
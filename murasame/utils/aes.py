@@ -136,17 +136,18 @@ class AESCipher:
             raise InvalidInputError('The input file is not properly encoded.') \
                 from error
 
-        # Retrieve the initialization vector
-        initialization_vector = content[:IV_SIZE]
+        # Slice the decoded data through a memoryview, so the encrypted
+        # payload is not copied when the header is removed
+        content = memoryview(content)
 
-        # Remove the initialization vector from the content
-        content = content[IV_SIZE:]
+        # Retrieve the initialization vector
+        initialization_vector = bytes(content[:IV_SIZE])
 
         # Retrieve the tag
-        tag = content[:TAG_SIZE]
+        tag = bytes(content[IV_SIZE:IV_SIZE + TAG_SIZE])
 
-        # Remove the tag from the content
-        content = content[TAG_SIZE:]
+        # Remove the initialization vector and the tag from the content
+        content = content[IV_SIZE + TAG_SIZE:]
 
         # Decrypt the data
         cipher = Cipher(
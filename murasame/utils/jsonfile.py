@@ -101,15 +101,16 @@ class JsonFile(ContentFile):
         """
 
         try:
-            with open(self._path, 'r+') as json_file:
-                # Parse the file and load the content to memory.
-                self._content = json.load(json_file)
+            with open(self._path, 'rb') as json_file:
+                # Parse the raw bytes directly, the JSON parser detects the
+                # encoding itself so no intermediate text stream is needed.
+                self._content = json.loads(json_file.read())
         except OSError as exception:
             self._content = None
             raise InvalidInputError(
                 'Failed to read the contents of JSON file {}.'.format(
                     self._path)) from exception
-        except json.JSONDecodeError as exception:
+        except ValueError as exception:
             self._content = None
             raise InvalidInputError(
                 'Failed to parse the content of JSON file {}.'.format(
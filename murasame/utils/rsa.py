@@ -26,6 +26,7 @@ import os
 import base64
 
 from enum import IntEnum
+from functools import lru_cache
 from typing import Callable
 
 # Dependency Imports
@@ -37,6 +38,29 @@ from cryptography.exceptions import InvalidSignature
 # Murasame Imports
 from murasame.exceptions import InvalidInputError
 
+@lru_cache(maxsize=None)
+def _get_signature_parameters(hashing_algorithm: Callable) -> tuple:
+
+    """Returns the padding and the hash to use when signing or verifying a
+    message with the given hashing algorithm.
+
+    Both objects are immutable, so they are only created once per hashing
+    algorithm and shared by all keys.
+
+    Args:
+        hashing_algorithm (Callable): The hashing algorithm to use.
+
+    Returns:
+        tuple: The PSS padding and the hash algorithm instance.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    return (padding.PSS(mgf=padding.MGF1(hashing_algorithm()),
+                        salt_length=padding.PSS.MAX_LENGTH),
+            hashing_algorithm())
+
 class RSAKeyLengths(IntEnum):
 
     """List of supported RSA key lengths.
@@ -132,13 +156,14 @@ class RSAPublic:
             signature = base64.b64decode(signature)
 
         # Verify the message
+        signature_padding, algorithm = \
+            _get_signature_parameters(hashing_algorithm)
         try:
             self._public_key.verify(
                 signature,
                 bytes(message, encoding='utf-8'),
-                padding.PSS(mgf=padding.MGF1(hashing_algorithm()),
-                            salt_length=padding.PSS.MAX_LENGTH),
-                hashing_algorithm())
+                signature_padding,
+                algorithm)
         except InvalidSignature:
             return False
 
@@ -259,11 +284,12 @@ class RSAPrivate:
         signature = ''
 
         # Generate the signature
+        signature_padding, algorithm = \
+            _get_signature_parameters(hashing_algorithm)
         signature = self._private_key.sign(
             bytes(message, encoding='utf-8'),
-            padding.PSS(mgf=padding.MGF1(hashing_algorithm()),
-                        salt_length=padding.PSS.MAX_LENGTH),
-            hashing_algorithm())
+            signature_padding,
+            algorithm)
 
         if encode:
             signature = base64.b64encode(signature)
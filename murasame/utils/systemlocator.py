@@ -30,6 +30,23 @@ from typing import Callable, Union
 # Murasame Imports
 from .singleton import Singleton
 
+# Counter that is increased every time the registered providers change. It is
+# kept at module level, so it can be read without retrieving the system
+# locator instance.
+PROVIDER_GENERATION = 0
+
+def _increase_provider_generation() -> None:
+
+    """Increases the counter of provider changes.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    #pylint: disable=global-statement
+    global PROVIDER_GENERATION
+    PROVIDER_GENERATION += 1
+
 class SystemPath:
 
     """Represents a directory that contains the systems to be registered in the
@@ -108,6 +125,21 @@ class SystemLocator:
         Attila Kovacs
     """
 
+    @property
+    def Generation(self) -> int:
+
+        """Counter that is increased every time the registered providers
+        change.
+
+        Callers can compare it to a previously seen value to find out whether
+        a failed provider lookup is worth repeating.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        return PROVIDER_GENERATION
+
     def __init__(self) -> None:
 
         """Creates a new SystemLocator instance.
@@ -140,6 +172,7 @@ class SystemLocator:
             self._systems[system] = providers
 
         providers.append(instance)
+        _increase_provider_generation()
 
     def unregister_provider(self, system: object, instance: object) -> None:
 
@@ -158,6 +191,7 @@ class SystemLocator:
 
         if providers is not None:
             providers.remove(instance)
+            _increase_provider_generation()
 
             if len(providers) == 0:
                 system_object = self._systems.get(system)
@@ -178,6 +212,7 @@ class SystemLocator:
         system_object = self._systems.get(system)
         if system_object:
             self._systems.pop(system)
+            _increase_provider_generation()
 
     def reset(self) -> None:
 
@@ -189,6 +224,7 @@ class SystemLocator:
 
         self._systems = {}
         self._system_paths = []
+        _increase_provider_generation()
 
         # Also invalidate the module caches so modules can be imported again
         # if required.
@@ -27,6 +27,13 @@ from typing import Callable
 # Dependency Imports
 import yaml
 
+# Use the loader of libyaml when PyYAML was built with it, it's considerably
+# faster than the pure Python implementation
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Murasame Imports
 from murasame.exceptions import InvalidInputError
 from murasame.utils.aes import AESCipher
@@ -99,7 +106,7 @@ class YamlFile(ContentFile):
         try:
             with open(self._path, 'r+') as yaml_file:
                 # Parse the file and load the content to memory.
-                self._content = yaml.load(yaml_file, Loader=yaml.SafeLoader)
+                self._content = yaml.load(yaml_file, Loader=SafeLoader)
         except OSError as exception:
             self._content = None
             raise InvalidInputError(
@@ -170,7 +177,7 @@ class YamlFile(ContentFile):
                 cipher = AESCipher(self._cb_retrieve_key())
                 self._content = yaml.load(
                     cipher.decrypt(raw_content),
-                    Loader=yaml.SafeLoader)
+                    Loader=SafeLoader)
             except yaml.YAMLError as exception:
                 raise InvalidInputError(
                     f'Failed to parse the content of YAML file {self._path}. '
@@ -36,7 +36,8 @@ LOCALIZATIONS_PATH = f'{LANGUAGE_FILES_PATH}/localization'
 EN = \
 {
     'test_key': 'test_data_en',
-    'autotranslate_key': 'ship'
+    'autotranslate_key': 'ship',
+    'template_key': 'Hello $name!'
 }
 
 DE = \
@@ -122,6 +122,20 @@ class TestEventSystem:
         sut.unsubscribe('testevent', cb_handler2)
         assert sut.get_num_handlers_for_event('testevent') == 0
 
+    def test_unsubscribing_non_registered_handler(self):
+
+        """Tests that unsubscribing a handler that was never registered to an
+        existing event is handled.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = EventSystem()
+        sut.subscribe('testevent', cb_handler)
+        sut.unsubscribe('testevent', cb_handler2)
+        assert sut.get_num_handlers_for_event('testevent') == 1
+
     def test_unsubscribing_from_non_existing_event(self):
 
         """Tests that unsubscribing from a non-existing event is handled.
@@ -157,4 +171,23 @@ class TestEventSystem:
         sut.subscribe('testevent', cb_handler3)
 
         with pytest.raises(RuntimeError):
-            sut.send_event('testevent')
\ No newline at end of file
+            sut.send_event('testevent')
+
+    def test_sending_event_with_arguments(self):
+
+        """Tests that the arguments of an event are passed to the handlers.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        received = []
+
+        def cb_recorder(*args, **kwargs):
+            received.append((args, kwargs))
+
+        sut = EventSystem()
+        sut.subscribe('testevent', cb_recorder)
+        sut.send_event('testevent', 1, 2)
+        sut.send_event('testevent', 3, key='value')
+        assert received == [((1, 2), {}), ((3,), {'key': 'value'})]
@@ -22,8 +22,11 @@ Contains the unit tests of the exception classes.
 """
 
 # Runtime Imports
+import copy
 import os
+import pickle
 import sys
+from enum import IntEnum
 
 # Dependency Imports
 import pytest
@@ -37,6 +40,7 @@ from murasame.exceptions import (
     AlreadyExistsError,
     AlreadyRegisteredError,
     ErrorCodes,
+    ErrorCodesEnum,
     FrameworkError,
     InstallationFailedError,
     InvalidInputError,
@@ -45,6 +49,10 @@ from murasame.exceptions import (
     UncaughtExceptionError,
     InvalidLicenseKeyError,
     DatabaseOperationError)
+from murasame.exceptions import errorcodes
+
+class CustomErrorCodes(IntEnum):
+    CUSTOM = 1001
 
 class TestExceptions:
 
@@ -67,6 +75,30 @@ class TestExceptions:
             assert error.errorcode == ErrorCodes.NOT_SET
             assert error.errormessage == 'test'
 
+    def test_exception_logging(self, caplog):
+
+        """
+        Tests that raising FrameworkError logs the error code.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        try:
+            raise FrameworkError('test', errorcode=ErrorCodes.LICENSE_ERROR)
+        except FrameworkError:
+            assert 'Error Code: ErrorCodes.LICENSE_ERROR' in caplog.text
+
+        try:
+            raise FrameworkError('test', errorcode=1000)
+        except FrameworkError:
+            assert 'Error Code: 1000' in caplog.text
+
+        try:
+            raise FrameworkError('test', errorcode=CustomErrorCodes.CUSTOM)
+        except FrameworkError:
+            assert 'Error Code: 1001' in caplog.text
+
     def test_exception_without_caller_inspection(self):
 
         """
@@ -83,6 +115,128 @@ class TestExceptions:
             assert error.errorcode == ErrorCodes.NOT_SET
             assert error.errormessage == 'test'
 
+    def test_exception_pickling(self):
+
+        """
+        Tests that the attributes of an exception are kept when it is pickled
+        or copied.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        error = InvalidInputError('test',
+                                  file='test.py',
+                                  line=42,
+                                  function='test_function',
+                                  wrapped_exception=ValueError('wrapped'))
+
+        for restored in (pickle.loads(pickle.dumps(error)), copy.copy(error)):
+            assert type(restored) is InvalidInputError
+            assert restored.errormessage == 'test'
+            assert restored.errorcode == ErrorCodes.INPUT_ERROR
+            assert restored.file == 'test.py'
+            assert restored.line == 42
+            assert restored.function == 'test_function'
+            assert str(restored.wrapped_exception) == 'wrapped'
+
+    def test_exception_caller_inspection(self):
+
+        """
+        Tests that the location where FrameworkError was raised is retrieved
+        through caller inspection.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        try:
+            raise AccessViolationError('test')
+        except AccessViolationError as error:
+            assert error.file == __file__
+            assert error.function == 'test_exception_caller_inspection'
+            assert isinstance(error.line, int)
+
+    def test_derived_exception_caller_inspection(self):
+
+        """
+        Tests that the constructors of derived exceptions are skipped when
+        the caller is inspected.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        class CustomError(InvalidInputError):
+            def __init__(self, message: str) -> None:
+                super().__init__(message=message)
+
+        try:
+            raise CustomError('test')
+        except CustomError as error:
+            assert error.file == __file__
+            assert error.function == 'test_derived_exception_caller_inspection'
+
+    def test_static_exception_inspection(self):
+
+        """
+        Tests that inspect_exception() can be called on the exception class
+        to retrieve the location of the caller of a function.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        def get_location():
+            return FrameworkError.inspect_exception()
+
+        filename, function, line = get_location()
+
+        assert filename == __file__
+        assert function == 'test_static_exception_inspection'
+        assert isinstance(line, int)
+
+    def test_exception_with_explicit_location(self):
+
+        """
+        Tests that the location provided when raising an exception is kept.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        try:
+            raise InvalidInputError('test',
+                                    file='test.py',
+                                    line=42,
+                                    function='test_function')
+        except InvalidInputError as error:
+            assert error.file == 'test.py'
+            assert error.line == 42
+            assert error.function == 'test_function'
+
+    def test_raising_exception_at_caller(self):
+
+        """
+        Tests that an exception raised through raise_at() records the location
+        of its caller.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        wrapped = ValueError('wrapped')
+
+        with pytest.raises(InvalidLicenseKeyError) as error:
+            InvalidLicenseKeyError.raise_at('test', wrapped_exception=wrapped)
+
+        assert error.value.errormessage == 'test'
+        assert error.value.errorcode == ErrorCodes.LICENSE_ERROR
+        assert error.value.wrapped_exception is wrapped
+        assert error.value.file == __file__
+        assert error.value.function == 'test_raising_exception_at_caller'
+        assert error.value.line > 0
+
     def test_access_violation_error(self):
 
         """
@@ -423,3 +577,54 @@ class TestExceptions:
         except DatabaseOperationError as error:
             assert error.errorcode == ErrorCodes.DATABASE_ERROR
             assert error.errormessage == 'test'
+
+    def test_error_codes_enum(self):
+
+        """
+        Tests that the error codes can be iterated and looked up by value.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        assert issubclass(ErrorCodesEnum, IntEnum)
+        assert len(ErrorCodesEnum) == 12
+        assert ErrorCodesEnum.LICENSE_ERROR == ErrorCodes.LICENSE_ERROR
+        assert ErrorCodesEnum(ErrorCodes.INPUT_ERROR).name == 'INPUT_ERROR'
+        assert [int(code) for code in ErrorCodes] == list(range(1, 13))
+
+        with pytest.raises(ValueError):
+            ErrorCodes(0)
+
+    def test_error_code_attributes(self):
+
+        """
+        Tests that the error codes are integers that know their name.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        assert isinstance(ErrorCodes.DATABASE_ERROR, int)
+        assert ErrorCodes.DATABASE_ERROR == 12
+        assert ErrorCodes.DATABASE_ERROR.name == 'DATABASE_ERROR'
+        assert ErrorCodes.DATABASE_ERROR.value == 12
+        assert f'{ErrorCodes.DATABASE_ERROR}' == '12'
+
+    def test_error_code_module_constants(self):
+
+        """
+        Tests that the error codes are also available as module level integer
+        constants.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        for code in ErrorCodes:
+            constant = getattr(errorcodes, code.name)
+            assert type(constant) is int
+            assert constant == code
+
+        sut = FrameworkError(errorcode=ErrorCodes.LICENSE_ERROR)
+        assert sut.errorcode == errorcodes.LICENSE_ERROR
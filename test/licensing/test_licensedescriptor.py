@@ -34,6 +34,9 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 # Murasame Imports
 from murasame.licensing import LicenseDescriptor, LicenseTypes
+from murasame.licensing.licensedescriptor import (
+    SHARED_METADATA_CACHE_SIZE,
+    _get_shared_metadata)
 
 class TestLicenseDescriptor:
 
@@ -67,6 +70,28 @@ class TestLicenseDescriptor:
         assert sut.Type == license_type
         assert sut.Features == {}
 
+    def test_creation_with_features(self):
+
+        """
+        Tests that a license descriptor can be created with initial features.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        feature = uuid.uuid4()
+        feature2 = uuid.uuid4()
+
+        sut = LicenseDescriptor(
+            license_key=uuid.uuid4(),
+            owner_id=uuid.uuid4(),
+            license_type=LicenseTypes.DEVELOPMENT,
+            features={feature: {'test': 'testvalue'}, str(feature2): {}})
+
+        assert sut.has_feature(feature_id=feature)
+        assert sut.has_feature(feature_id=feature2)
+        assert len(sut.Features) == 2
+
     def test_adding_feature(self):
 
         """
@@ -91,6 +116,122 @@ class TestLicenseDescriptor:
         assert sut.has_feature(feature_id=feature)
         assert not sut.has_feature(feature_id=uuid.uuid4())
 
+    def test_adding_feature_as_string(self):
+
+        """
+        Tests that features can be added and checked using the string
+        representation of their ID.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        key = uuid.uuid4()
+        owner = uuid.uuid4()
+        license_type = LicenseTypes.DEVELOPMENT
+        feature = uuid.uuid4()
+
+        sut = LicenseDescriptor(
+            license_key=key,
+            owner_id=owner,
+            license_type=license_type)
+
+        sut.add_feature(feature_id=str(feature), metadata={'test': 'testvalue'})
+
+        assert sut.has_feature(feature_id=feature)
+        assert sut.has_feature(feature_id=str(feature))
+
+        with pytest.raises(ValueError):
+            sut.add_feature(feature_id='invalid', metadata={})
+
+        # Invalid feature IDs are only rejected when adding a feature
+        assert not sut.has_feature(feature_id='invalid')
+        sut.remove_feature(feature_id='invalid')
+        assert sut.has_feature(feature_id=feature)
+
+    def test_feature_metadata_is_shared(self):
+
+        """
+        Tests that features with identical metadata share a read-only copy
+        of the metadata.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        feature = uuid.uuid4()
+        feature2 = uuid.uuid4()
+        feature3 = uuid.uuid4()
+        metadata = {'capacity': 1}
+
+        sut = LicenseDescriptor(
+            license_key=uuid.uuid4(),
+            owner_id=uuid.uuid4(),
+            license_type=LicenseTypes.DEVELOPMENT)
+
+        sut.add_feature(feature_id=feature, metadata=metadata)
+        sut.add_feature(feature_id=feature2, metadata={'capacity': 1})
+        sut.add_feature(feature_id=feature3, metadata={'limits': [1, 2]})
+
+        assert sut.Features[feature] is sut.Features[feature2]
+        assert sut.Features[feature] == metadata
+        assert sut.Features[feature3] == {'limits': [1, 2]}
+
+        with pytest.raises(TypeError):
+            sut.Features[feature]['capacity'] = 2
+
+        # Changing the original dictionary doesn't affect the license
+        metadata['capacity'] = 2
+        assert sut.Features[feature2]['capacity'] == 1
+
+    def test_shared_feature_metadata_keeps_value_types(self):
+
+        """
+        Tests that metadata with equal values of different types, e.g. True
+        and 1, is not shared.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        feature = uuid.uuid4()
+        feature2 = uuid.uuid4()
+
+        sut = LicenseDescriptor(
+            license_key=uuid.uuid4(),
+            owner_id=uuid.uuid4(),
+            license_type=LicenseTypes.DEVELOPMENT)
+
+        sut.add_feature(feature_id=feature, metadata={'seats': 1})
+        sut.add_feature(feature_id=feature2, metadata={'seats': True})
+
+        assert sut.Features[feature2]['seats'] is True
+        assert sut.serialize()['features'][str(feature2)] == {'seats': True}
+        assert isinstance(sut.Features[feature]['seats'], int)
+        assert sut.Features[feature]['seats'] is not True
+
+    def test_shared_feature_metadata_is_limited(self):
+
+        """
+        Tests that the number of shared feature metadata kept in memory is
+        limited.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = LicenseDescriptor(
+            license_key=uuid.uuid4(),
+            owner_id=uuid.uuid4(),
+            license_type=LicenseTypes.DEVELOPMENT)
+
+        for capacity in range(SHARED_METADATA_CACHE_SIZE + 1):
+            sut.add_feature(feature_id=uuid.uuid4(),
+                            metadata={'capacity': capacity})
+
+        assert _get_shared_metadata.cache_info().currsize \
+            <= SHARED_METADATA_CACHE_SIZE
+
     def test_removing_feature(self):
 
         """
@@ -152,3 +293,19 @@ class TestLicenseDescriptor:
         }
 
         assert sut.serialize() == serialized
+
+    def test_serialization_of_production_license(self):
+
+        """
+        Tests that the type of a production license is serialized correctly.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = LicenseDescriptor(
+            license_key=uuid.uuid4(),
+            owner_id=uuid.uuid4(),
+            license_type=LicenseTypes.PRODUCTION)
+
+        assert sut.serialize()['type'] == 'production'
@@ -33,6 +33,7 @@ import pytest
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 # Murasame Imports
+from murasame.exceptions import InvalidLicenseKeyError
 from murasame.licensing import (
     LicenseGenerator,
     LicenseDescriptor,
@@ -42,7 +43,8 @@ from murasame.utils import (
     RSAKeyGenerator,
     RSAKeyLengths,
     RSAPrivate,
-    RSAPublic)
+    RSAPublic,
+    JsonFile)
 
 # Test Imports
 from test.constants import TEST_FILES_DIRECTORY
@@ -145,3 +147,39 @@ class TestLicenseFile:
 
         assert sut.Signature is not None
         assert isinstance(sut.License, LicenseDescriptor)
+
+    def test_creation_without_signature(self):
+
+        """
+        Tests that a license file without a signature is rejected.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        license_path = f'{TEST_FILES_DIRECTORY}/license_no_signature.lic'
+
+        license_file = JsonFile(path=license_path)
+        license_file.overwrite_content(content={'license': {}})
+        license_file.save()
+
+        with pytest.raises(InvalidLicenseKeyError):
+            sut = LicenseFile(license_file_path=license_path)
+
+    def test_creation_without_license_descriptor(self):
+
+        """
+        Tests that a license file without a license descriptor is rejected.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        license_path = f'{TEST_FILES_DIRECTORY}/license_no_descriptor.lic'
+
+        license_file = JsonFile(path=license_path)
+        license_file.overwrite_content(content={'signature': 'signature'})
+        license_file.save()
+
+        with pytest.raises(InvalidLicenseKeyError):
+            sut = LicenseFile(license_file_path=license_path)
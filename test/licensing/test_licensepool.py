@@ -0,0 +1,134 @@
+## ============================================================================
+##             **** Murasame Application Development Framework ****
+##                Copyright (C) 2019-2021, Suisei Entertainment
+## ============================================================================
+##
+##  Licensed under the Apache License, Version 2.0 (the "License");
+##  you may not use this file except in compliance with the License.
+##  You may obtain a copy of the License at
+##
+##      http://www.apache.org/licenses/LICENSE-2.0
+##
+##  Unless required by applicable law or agreed to in writing, software
+##  distributed under the License is distributed on an "AS IS" BASIS,
+##  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+##  See the License for the specific language governing permissions and
+##  limitations under the License.
+##
+## ============================================================================
+
+"""
+Contains the unit tests of LicensePool class.
+"""
+
+# Runtime Imports
+import os
+import sys
+import uuid
+
+# Dependency Imports
+import pytest
+
+# Fix paths to make framework modules accessible
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Murasame Imports
+from murasame.licensing import LicenseDescriptor, LicensePool, LicenseTypes
+
+def create_license(features: dict) -> LicenseDescriptor:
+
+    return LicenseDescriptor(
+        license_key=uuid.uuid4(),
+        owner_id=uuid.uuid4(),
+        license_type=LicenseTypes.PRODUCTION,
+        features=features)
+
+class TestLicensePool:
+
+    """
+    Contains the unit tests of the LicensePool class.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    def test_creation(self):
+
+        """
+        Tests that a license pool can be created.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = LicensePool()
+
+        assert sut.Licenses == {}
+        assert not sut.has_feature(feature_id=uuid.uuid4())
+
+    def test_feature_lookup(self):
+
+        """
+        Tests that the licenses enabling a feature can be retrieved.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        feature = uuid.uuid4()
+        feature2 = uuid.uuid4()
+
+        license1 = create_license({feature: {'capacity': 1}})
+        license2 = create_license({feature: {'capacity': 2}, feature2: {}})
+
+        sut = LicensePool()
+        sut.add_license(license_descriptor=license1)
+        sut.add_license(license_descriptor=license2)
+
+        assert len(sut.Licenses) == 2
+        assert sut.has_feature(feature_id=feature)
+        assert sut.has_feature(feature_id=str(feature2))
+        assert not sut.has_feature(feature_id=uuid.uuid4())
+        assert sut.get_licenses_with_feature(feature_id=feature) == \
+            {license1.Key, license2.Key}
+        assert sut.get_licenses_with_feature(feature_id=feature2) == \
+            {license2.Key}
+        assert sut.get_feature_metadata(
+            feature_id=feature, license_key=license2.Key) == {'capacity': 2}
+        assert sut.get_feature_metadata(
+            feature_id=feature2, license_key=license1.Key) is None
+
+        # Invalid feature IDs don't match any feature
+        assert not sut.has_feature(feature_id='invalid')
+        assert sut.get_licenses_with_feature(feature_id='invalid') == \
+            frozenset()
+        assert sut.get_feature_metadata(
+            feature_id='invalid', license_key=license1.Key) is None
+
+    def test_removing_license(self):
+
+        """
+        Tests that licenses can be removed from the pool.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        feature = uuid.uuid4()
+        feature2 = uuid.uuid4()
+
+        license1 = create_license({feature: {}})
+        license2 = create_license({feature: {}, feature2: {}})
+
+        sut = LicensePool()
+        sut.add_license(license_descriptor=license1)
+        sut.add_license(license_descriptor=license2)
+
+        sut.remove_license(license_key=license2.Key)
+        sut.remove_license(license_key=uuid.uuid4())
+
+        assert sut.get_licenses_with_feature(feature_id=feature) == \
+            {license1.Key}
+        assert not sut.has_feature(feature_id=feature2)
+        assert sut.get_feature_metadata(
+            feature_id=feature, license_key=license2.Key) is None
@@ -22,8 +22,10 @@ Contains the unit tests of LicenseValidator class.
 """
 
 # Runtime Imports
+import json
 import os
 import sys
+import time
 import uuid
 
 # Dependency Imports
@@ -34,11 +36,13 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 # Murasame Imports
 from murasame.licensing import (
+    licensevalidator,
     LicenseValidator,
     LicenseGenerator,
     LicenseDescriptor,
     LicenseTypes)
 from murasame.utils import (
+    JsonFile,
     RSAKeyGenerator,
     RSAKeyLengths,
     RSAPrivate,
@@ -138,3 +142,240 @@ class TestLicenseValidator:
         assert sut.validate(
             license_path=f'{TEST_FILES_DIRECTORY}/license.lic',
             cb_retrieve_password=get_encryption_key)
+
+    def test_validation_of_legacy_license(self):
+
+        """
+        Tests that licenses signed with the default JSON representation of the
+        license are still accepted, and that modified licenses are rejected.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        private_key = RSAPrivate(
+            key_path=f'{TEST_FILES_DIRECTORY}/license_private.pem',
+            cb_retrieve_password=get_password)
+
+        public_key = RSAPublic(
+            key_path=f'{TEST_FILES_DIRECTORY}/license_public.pem')
+
+        license_path = f'{TEST_FILES_DIRECTORY}/legacy_license.lic'
+
+        descriptor = LicenseDescriptor(
+            license_key=uuid.uuid4(),
+            owner_id=uuid.uuid4(),
+            license_type=LicenseTypes.PRODUCTION)
+        descriptor.add_feature(
+            feature_id=uuid.uuid4(),
+            metadata={'test': 'testvalue'})
+        content = descriptor.serialize()
+
+        signature = private_key.sign(message=json.dumps(content), encode=True)
+
+        license_file = JsonFile(path=license_path)
+        license_file.overwrite_content(
+            content={'license': content, 'signature': signature.decode('utf-8')})
+        license_file.save()
+
+        sut = LicenseValidator(public_key=public_key)
+
+        assert sut.validate(license_path=license_path)
+
+        content['type'] = 'development'
+        license_file.save()
+
+        assert not sut.validate(license_path=license_path)
+
+    def test_validation_of_modified_license(self):
+
+        """
+        Tests that a license that doesn't match its digest is rejected.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        generator = LicenseGenerator(
+            private_key_path=f'{TEST_FILES_DIRECTORY}/license_private.pem',
+            cb_retrieve_key_password=get_password)
+
+        license_path = f'{TEST_FILES_DIRECTORY}/modified_license.lic'
+
+        descriptor = LicenseDescriptor(
+            license_key=uuid.uuid4(),
+            owner_id=uuid.uuid4(),
+            license_type=LicenseTypes.DEVELOPMENT)
+
+        generator.generate(output_path=license_path,
+                           license_descriptor=descriptor)
+
+        sut = LicenseValidator(
+            public_key_path=f'{TEST_FILES_DIRECTORY}/license_public.pem')
+
+        assert sut.validate(license_path=license_path)
+
+        license_file = JsonFile(path=license_path)
+        license_file.load()
+        assert 'digest' in license_file.Content
+
+        license_file.Content['license']['type'] = 'production'
+        license_file.save()
+
+        assert not sut.validate(license_path=license_path)
+
+        # Removing the digest doesn't make the license valid either
+        del license_file.Content['digest']
+        license_file.save()
+
+        assert not sut.validate(license_path=license_path)
+
+    def test_validating_multiple_licenses(self):
+
+        """
+        Tests that multiple licenses can be validated at once.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        generator = LicenseGenerator(
+            private_key_path=f'{TEST_FILES_DIRECTORY}/license_private.pem',
+            cb_retrieve_key_password=get_password)
+
+        license_paths = []
+        for index in range(3):
+            license_path = f'{TEST_FILES_DIRECTORY}/multiple_license_{index}.lic'
+            descriptor = LicenseDescriptor(
+                license_key=uuid.uuid4(),
+                owner_id=uuid.uuid4(),
+                license_type=LicenseTypes.DEVELOPMENT)
+            generator.generate(output_path=license_path,
+                               license_descriptor=descriptor)
+            license_paths.append(license_path)
+
+        # Invalidate the last license
+        license_file = JsonFile(path=license_paths[-1])
+        license_file.load()
+        license_file.Content['license']['type'] = 'production'
+        license_file.save()
+
+        sut = LicenseValidator(
+            public_key_path=f'{TEST_FILES_DIRECTORY}/license_public.pem')
+
+        results = sut.validate_many(license_paths=license_paths)
+
+        assert results == {
+            license_paths[0]: True,
+            license_paths[1]: True,
+            license_paths[2]: False
+        }
+        assert sut.validate_many(license_paths=[]) == {}
+
+    def test_validating_multiple_encrypted_licenses(self):
+
+        """
+        Tests that the password callback is only called once when multiple
+        encrypted licenses are validated at once.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        generator = LicenseGenerator(
+            private_key_path=f'{TEST_FILES_DIRECTORY}/license_private.pem',
+            cb_retrieve_key_password=get_password,
+            cb_retrieve_encryption_password=get_encryption_key)
+
+        license_paths = []
+        for index in range(4):
+            license_path = \
+                f'{TEST_FILES_DIRECTORY}/encrypted_license_{index}.lic'
+            descriptor = LicenseDescriptor(
+                license_key=uuid.uuid4(),
+                owner_id=uuid.uuid4(),
+                license_type=LicenseTypes.DEVELOPMENT)
+            generator.generate(output_path=license_path,
+                               license_descriptor=descriptor)
+            license_paths.append(license_path)
+
+        calls = []
+
+        def retrieve_password():
+            calls.append(None)
+            return get_encryption_key()
+
+        sut = LicenseValidator(
+            public_key_path=f'{TEST_FILES_DIRECTORY}/license_public.pem')
+
+        results = sut.validate_many(license_paths=license_paths,
+                                    cb_retrieve_password=retrieve_password)
+
+        assert all(results.values())
+        assert len(calls) == 1
+
+    def test_validation_result_caching(self):
+
+        """
+        Tests that a license file is only validated again if it changes, even
+        if its size and modification time are restored.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        generator = LicenseGenerator(
+            private_key_path=f'{TEST_FILES_DIRECTORY}/license_private.pem',
+            cb_retrieve_key_password=get_password)
+
+        license_path = f'{TEST_FILES_DIRECTORY}/cached_license.lic'
+
+        descriptor = LicenseDescriptor(
+            license_key=uuid.uuid4(),
+            owner_id=uuid.uuid4(),
+            license_type=LicenseTypes.DEVELOPMENT)
+
+        generator.generate(output_path=license_path,
+                           license_descriptor=descriptor)
+
+        sut = LicenseValidator(
+            public_key_path=f'{TEST_FILES_DIRECTORY}/license_public.pem')
+
+        assert sut.validate(license_path=license_path)
+        assert sut.validate(license_path=license_path)
+
+        # Overwrite the file with content of the same size while keeping its
+        # modification time, the change time still invalidates the result.
+        # Wait first, so the change time moves even on coarse clocks.
+        stat = os.stat(license_path)
+        time.sleep(0.05)
+        with open(license_path, 'w') as license_file:
+            license_file.write('{}'.ljust(stat.st_size))
+        os.utime(license_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert not sut.validate(license_path=license_path)
+
+    def test_validation_result_cache_is_limited(self, monkeypatch):
+
+        """
+        Tests that the amount of cached validation results is limited.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        monkeypatch.setattr(licensevalidator, 'MAX_CACHED_VALIDATION_RESULTS', 2)
+
+        sut = LicenseValidator(
+            public_key_path=f'{TEST_FILES_DIRECTORY}/license_public.pem')
+        monkeypatch.setattr(sut, '_validate_license_file',
+                            lambda license_path, cb_retrieve_password: True)
+
+        license_paths = [f'{TEST_FILES_DIRECTORY}/license_public.pem',
+                         f'{TEST_FILES_DIRECTORY}/license_private.pem',
+                         __file__]
+        for license_path in license_paths:
+            assert sut.validate(license_path=license_path)
+
+        # pylint: disable=protected-access
+        assert list(sut._results) == license_paths[1:]
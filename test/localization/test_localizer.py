@@ -32,7 +32,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 from murasame.utils import SystemLocator, YamlFile
 from murasame.api import VFSAPI
 from murasame.pal.vfs import VFS
-from murasame.localization import Localizer
+from murasame.localization import Localizer, localizer
 
 # Test Imports
 from test.constants import TEST_FILES_DIRECTORY
@@ -112,6 +112,24 @@ class TestLocalizer:
         sut = Localizer()
         assert sut.get(key='test_key') == 'test_data_en'
 
+    def test_substituting_attributes(self):
+
+        """
+        Tests that attributes are substituted in the localized texts.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = Localizer()
+        assert sut.get(key='template_key', attributes={'name': 'Murasame'}) \
+            == 'Hello Murasame!'
+        assert sut.get(key='template_key', attributes={'name': 'World'}) \
+            == 'Hello World!'
+        assert sut.get(key='template_key', attributes={}) == 'Hello $name!'
+        assert sut.get(key='test_key', attributes={'name': 'Murasame'}) \
+            == 'test_data_en'
+
     def test_switching_language(self):
 
         """
@@ -126,6 +144,54 @@ class TestLocalizer:
         sut.switch_language(new_language='de')
         assert sut.get(key='test_key') == 'test_data_de'
 
+    def test_retrieving_default_entries(self):
+
+        """
+        Tests that texts missing from the selected language are retrieved from
+        the default language.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = Localizer(language='de', default_language='en')
+        assert sut.get(key='autotranslate_key') == 'ship'
+        assert sut.get(key='missing_key') == 'KEY NOT FOUND'
+
+        sut = Localizer(language='de', default_language='en',
+                        cache_default=True)
+        assert sut.get(key='autotranslate_key') == 'ship'
+        assert sut.get(key='missing_key') == 'KEY NOT FOUND'
+
+    def test_missing_default_language_is_not_reloaded(self, monkeypatch):
+
+        """
+        Tests that a default language file that failed to load is only loaded
+        again when the localizations are updated.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = Localizer(language='de', default_language='xx')
+
+        loads = []
+        load_language_file = Localizer._load_language_file
+
+        def counting_load(self, language):
+            loads.append(language)
+            return load_language_file(self, language)
+
+        monkeypatch.setattr(Localizer, '_load_language_file', counting_load)
+
+        assert sut.get(key='missing_key') == 'KEY NOT FOUND'
+        assert sut.get(key='other_missing_key') == 'KEY NOT FOUND'
+        assert loads == ['xx']
+
+        sut.update_localizations()
+        assert sut.get(key='missing_key') == 'KEY NOT FOUND'
+        assert loads == ['xx', 'de', 'xx']
+
     def test_autotranslate(self):
 
         """
@@ -139,6 +205,40 @@ class TestLocalizer:
         sut = Localizer(language='de', auto_translate=True)
         assert sut.get(key='autotranslate_key') == 'Schiff'
 
+    def test_translation_cache_is_limited(self, monkeypatch):
+
+        """
+        Tests that only a limited amount of automatic translations is kept.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        monkeypatch.setattr(localizer, 'MAX_CACHED_TRANSLATIONS', 2)
+
+        sut = Localizer(language='de')
+        for index in range(3):
+            sut._cache_translation(text=f'text{index}',
+                                   translation=f'translation{index}')
+
+        # pylint: disable=protected-access
+        assert list(sut._translations) == ['text1', 'text2']
+
+    def test_prefetch_without_autotranslate(self):
+
+        """
+        Tests that prefetching translations doesn't change the retrieved texts
+        when automatic translation is disabled.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = Localizer(language='de', default_language='en')
+        sut.prefetch_translations(keys=['test_key', 'autotranslate_key'])
+        assert sut.get(key='test_key') == 'test_data_de'
+        assert sut.get(key='autotranslate_key') == 'ship'
+
     def test_update_with_reloading_default_language(self):
 
         """
@@ -22,19 +22,55 @@ Contains the unit tests of the LogChannel class.
 """
 
 # Runtime Imports
+import datetime
+import io
+import logging
 import os
+import subprocess
 import sys
 
 # Dependency Imports
+import coloredlogs
 import pytest
 
 # Fix paths to make framework modules accessible
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 # Murasame Imports
-from murasame.log import LogChannel, LogLevels
+from murasame.log import (
+    LogChannel,
+    LogEntry,
+    LogLevels,
+    LogTarget,
+    register_target)
+
+@register_target('test')
+class _TestLogTarget(LogTarget):
+
+    """Log target that collects the log entries written to it.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    def __init__(
+        self,
+        logger: 'Logger',
+        configuration: dict,
+        root_path: str = None) -> None:
+
+        super().__init__(logger=logger)
+
+        self.configuration = configuration
+        self.root_path = root_path
+        self.entries = []
+
+    def write(self, entry: 'LogEntry') -> None:
+        self.entries.append(entry)
 
 # Test data
+TEST_ROOT_PATH = '~/.murasame/testfiles'
+
 BASIC_TEST_CONFIGURATION = \
 {
     'name': 'testchannel',
@@ -58,6 +94,51 @@ TEST_CONFIGURATION_WITH_CONSOLE_TARGET = \
     ]
 }
 
+TEST_CONFIGURATION_WITH_DUPLICATE_CONSOLE_TARGETS = \
+{
+    'name': 'testchannel_duplicate_console',
+    'defaultloglevel': 'INFO',
+    'targets':
+    [
+        {
+            'type': 'console',
+            'format': '[%(levelname)s]: %(message)s'
+        },
+        {
+            'type': 'console',
+            'format': '[%(levelname)s]: %(message)s'
+        }
+    ]
+}
+
+TEST_CONFIGURATION_WITH_BOOLEAN_COLORED_LOGS = \
+{
+    'name': 'testchannel_boolean_colored_logs',
+    'defaultloglevel': 'INFO',
+    'targets':
+    [
+        {
+            'type': 'console',
+            'coloredlogs': True
+        }
+    ]
+}
+
+TEST_CONFIGURATION_WITH_CUSTOM_TARGET = \
+{
+    'name': 'testchannel_custom',
+    'defaultloglevel': 'INFO',
+    'targets':
+    [
+        {
+            'type': 'test'
+        },
+        {
+            'type': 'unknown'
+        }
+    ]
+}
+
 TEST_CONFIGURATION_WITH_FILE_TARGET = \
 {
     'name': 'testchannel',
@@ -72,8 +153,57 @@ TEST_CONFIGURATION_WITH_FILE_TARGET = \
             'maxsize': '5',
             'backupcount': '2'
         }
-    ],
-    '__log_root_path__': '~/.murasame/testfiles'
+    ]
+}
+
+TEST_CONFIGURATION_WITH_BUFFERED_FILE_TARGET = \
+{
+    'name': 'testchannel_buffered_file',
+    'defaultloglevel': 'INFO',
+    'targets':
+    [
+        {
+            'type': 'file',
+            'format': '%(message)s',
+            'filename': 'buffered_file_log_target.log',
+            'buffercapacity': '3',
+            'flushlevel': 'error'
+        }
+    ]
+}
+
+TEST_CONFIGURATION_WITH_ROTATING_FILE_TARGET = \
+{
+    'name': 'testchannel_rotating_file',
+    'defaultloglevel': 'INFO',
+    'targets':
+    [
+        {
+            'type': 'file',
+            'format': '%(message)s',
+            'filename': 'rotating_file_log_target.log',
+            'maxsize': '1',
+            'backupcount': '1',
+            'buffercapacity': '0'
+        }
+    ]
+}
+
+TEST_CONFIGURATION_WITH_BUFFERED_ROTATING_FILE_TARGET = \
+{
+    'name': 'testchannel_buffered_rotating_file',
+    'defaultloglevel': 'INFO',
+    'targets':
+    [
+        {
+            'type': 'file',
+            'format': '%(message)s',
+            'filename': 'buffered_rotating_file_log_target.log',
+            'maxsize': '1',
+            'backupcount': '2',
+            'buffercapacity': '3'
+        }
+    ]
 }
 
 class TestLogChannel:
@@ -97,6 +227,23 @@ class TestLogChannel:
         sut = LogChannel(configuration=BASIC_TEST_CONFIGURATION)
         assert sut.Name == 'testchannel'
         assert sut.DefaultLogLevel == LogLevels.INFO
+        assert not hasattr(sut, '__dict__')
+
+    def test_no_propagation(self):
+
+        """
+        Tests that log channels don't pass their messages to the parent
+        loggers.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        LogChannel(configuration=BASIC_TEST_CONFIGURATION)
+
+        logger = logging.getLogger('testchannel')
+        assert not logger.propagate
+        assert not logger.disabled
 
     def test_console_target_loading(self):
 
@@ -111,6 +258,92 @@ class TestLogChannel:
         assert sut.Name == 'testchannel'
         assert sut.DefaultLogLevel == LogLevels.INFO
 
+    def test_duplicate_console_target_loading(self):
+
+        """
+        Tests that console targets with the same format share a single log
+        handler.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        LogChannel(configuration=TEST_CONFIGURATION_WITH_DUPLICATE_CONSOLE_TARGETS)
+
+        logger = logging.getLogger('testchannel_duplicate_console')
+        assert len(logger.handlers) == 1
+
+    def test_builtin_targets_are_loaded_lazily(self):
+
+        """
+        Tests that the built-in log targets are only imported when they are
+        looked up.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        script = \
+            'import sys\n' \
+            'from murasame.log.logtarget import get_target_type\n' \
+            'assert "murasame.log.consolelogtarget" not in sys.modules\n' \
+            'assert get_target_type("console").__name__ == "ConsoleLogTarget"\n' \
+            'assert get_target_type("file").__name__ == "FileLogTarget"\n' \
+            'assert get_target_type("unknown") is None\n'
+
+        result = subprocess.run(
+            [sys.executable, '-c', script],
+            cwd=os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')),
+            capture_output=True,
+            check=False)
+
+        assert result.returncode == 0, result.stderr.decode()
+
+    def test_console_handler_follows_stream(self, monkeypatch):
+
+        """
+        Tests that console targets don't share a handler bound to a replaced
+        standard error stream, and that closed handlers are no longer shared.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        first = LogChannel(
+            configuration=TEST_CONFIGURATION_WITH_DUPLICATE_CONSOLE_TARGETS)
+        first_handler = first._targets[0]._handler
+
+        stream = io.StringIO()
+        monkeypatch.setattr(sys, 'stderr', stream)
+        second = LogChannel(
+            configuration=TEST_CONFIGURATION_WITH_DUPLICATE_CONSOLE_TARGETS)
+        second_handler = second._targets[0]._handler
+
+        assert second_handler is not first_handler
+        assert second_handler.stream is stream
+
+        second_handler.close()
+        third = LogChannel(
+            configuration=TEST_CONFIGURATION_WITH_DUPLICATE_CONSOLE_TARGETS)
+        assert third._targets[0]._handler is not second_handler
+
+    def test_console_target_with_boolean_colored_logs(self):
+
+        """
+        Tests that colored logs can be enabled with a boolean value.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = LogChannel(
+            configuration=TEST_CONFIGURATION_WITH_BOOLEAN_COLORED_LOGS)
+        assert sut.Name == 'testchannel_boolean_colored_logs'
+
+        logger = logging.getLogger('testchannel_boolean_colored_logs')
+        assert any(isinstance(handler, coloredlogs.StandardErrorHandler)
+                   for handler in logger.handlers)
+
     def test_file_target_loading(self):
 
         """
@@ -120,10 +353,222 @@ class TestLogChannel:
             Attila Kovacs
         """
 
-        sut = LogChannel(configuration=TEST_CONFIGURATION_WITH_FILE_TARGET)
+        sut = LogChannel(configuration=TEST_CONFIGURATION_WITH_FILE_TARGET,
+                         root_path=TEST_ROOT_PATH)
         assert sut.Name == 'testchannel'
         assert sut.DefaultLogLevel == LogLevels.INFO
 
+        # pylint: disable=protected-access
+        assert not hasattr(sut._targets[0], '__dict__')
+
+    def test_buffered_file_target(self):
+
+        """
+        Tests that a file log target buffers the log messages until the buffer
+        is full or a message with the flush level is written.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        log_path = os.path.expanduser(
+            '~/.murasame/testfiles/buffered_file_log_target.log')
+        if os.path.exists(log_path):
+            os.remove(log_path)
+
+        sut = LogChannel(
+            configuration=TEST_CONFIGURATION_WITH_BUFFERED_FILE_TARGET,
+            root_path=TEST_ROOT_PATH)
+
+        def write(level, message):
+            sut.write(LogEntry(level=level,
+                               timestamp=datetime.datetime.now(),
+                               message=message,
+                               classname='TestLogChannel'))
+
+        def read_log():
+            with open(log_path, 'r') as log_file:
+                return log_file.read().splitlines()
+
+        write(LogLevels.INFO, 'first')
+        assert read_log() == []
+
+        write(LogLevels.ERROR, 'second')
+        assert read_log() == ['first', 'second']
+
+        write(LogLevels.INFO, 'third')
+        write(LogLevels.INFO, 'fourth')
+        write(LogLevels.INFO, 'fifth')
+        assert read_log() == ['first', 'second', 'third', 'fourth', 'fifth']
+
+        write(LogLevels.INFO, 'sixth')
+        assert read_log() == ['first', 'second', 'third', 'fourth', 'fifth']
+
+        sut.flush()
+        assert read_log() == ['first', 'second', 'third', 'fourth', 'fifth',
+                              'sixth']
+
+    def test_rotating_file_target(self):
+
+        """
+        Tests that the log file is rolled over when it reaches its maximum
+        size.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        log_path = os.path.expanduser(
+            '~/.murasame/testfiles/rotating_file_log_target.log')
+        for path in (log_path, f'{log_path}.1'):
+            if os.path.exists(path):
+                os.remove(path)
+
+        sut = LogChannel(
+            configuration=TEST_CONFIGURATION_WITH_ROTATING_FILE_TARGET,
+            root_path=TEST_ROOT_PATH)
+
+        for message in ('a' * 600000, 'b' * 600000):
+            sut.write(LogEntry(level=LogLevels.INFO,
+                               timestamp=datetime.datetime.now(),
+                               message=message,
+                               classname='TestLogChannel'))
+
+        with open(log_path, 'r') as log_file:
+            assert log_file.read() == 'b' * 600000 + '\n'
+
+        with open(f'{log_path}.1', 'r') as log_file:
+            assert log_file.read() == 'a' * 600000 + '\n'
+
+    def test_custom_target_loading(self):
+
+        """
+        Tests that registered custom log targets are created by the log
+        channel and receive the log entries written to the channel.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = LogChannel(configuration=TEST_CONFIGURATION_WITH_CUSTOM_TARGET,
+                         root_path=TEST_ROOT_PATH)
+
+        # pylint: disable=protected-access
+        assert len(sut._targets) == 1
+        target = sut._targets[0]
+        assert isinstance(target, _TestLogTarget)
+        assert target.root_path == TEST_ROOT_PATH
+
+        entry = LogEntry(level=LogLevels.INFO,
+                         timestamp=datetime.datetime.now(),
+                         message='custom',
+                         classname='TestLogChannel')
+        sut.write(entry)
+        assert target.entries == [entry]
+
+    def test_buffered_rotating_file_target(self):
+
+        """
+        Tests that the log file is rolled over in the middle of a batch of
+        buffered log messages and the backup files are shifted.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        log_path = os.path.expanduser(
+            '~/.murasame/testfiles/buffered_rotating_file_log_target.log')
+        for path in (log_path, f'{log_path}.1', f'{log_path}.2'):
+            if os.path.exists(path):
+                os.remove(path)
+
+        sut = LogChannel(
+            configuration=TEST_CONFIGURATION_WITH_BUFFERED_ROTATING_FILE_TARGET,
+            root_path=TEST_ROOT_PATH)
+
+        for message in ('a' * 600000, 'b' * 600000, 'c' * 600000):
+            sut.write(LogEntry(level=LogLevels.INFO,
+                               timestamp=datetime.datetime.now(),
+                               message=message,
+                               classname='TestLogChannel'))
+
+        with open(log_path, 'r') as log_file:
+            assert log_file.read() == 'c' * 600000 + '\n'
+
+        with open(f'{log_path}.1', 'r') as log_file:
+            assert log_file.read() == 'b' * 600000 + '\n'
+
+        with open(f'{log_path}.2', 'r') as log_file:
+            assert log_file.read() == 'a' * 600000 + '\n'
+
+    def test_writing_multiple_entries(self):
+
+        """
+        Tests that multiple log entries can be written to a channel at once,
+        in order.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = LogChannel(configuration=TEST_CONFIGURATION_WITH_CUSTOM_TARGET,
+                         root_path=TEST_ROOT_PATH)
+
+        # pylint: disable=protected-access
+        target = sut._targets[0]
+
+        entries = [LogEntry(level=LogLevels.INFO,
+                            timestamp=datetime.datetime.now(),
+                            message=f'message {index}',
+                            classname='TestLogChannel')
+                   for index in range(3)]
+        sut.write_many(entries=entries)
+        assert target.entries == entries
+
+    def test_log_level_conversion(self, caplog):
+
+        """
+        Tests that log entries are written to the Python logger with the
+        matching Python log level.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        expected_levels = \
+        {
+            LogLevels.TRACE: logging.DEBUG,
+            LogLevels.DEBUG: logging.DEBUG,
+            LogLevels.INFO: logging.INFO,
+            LogLevels.NOTICE: logging.INFO,
+            LogLevels.WARNING: logging.WARNING,
+            LogLevels.ERROR: logging.ERROR,
+            LogLevels.CRITICAL: logging.CRITICAL,
+            LogLevels.ALERT: logging.CRITICAL,
+            LogLevels.EMERGENCY: logging.CRITICAL
+        }
+
+        sut = LogChannel(configuration=BASIC_TEST_CONFIGURATION)
+
+        # Log channels don't propagate to the root logger, so the capture
+        # handler has to be attached to the channel directly
+        logger = logging.getLogger('testchannel')
+        logger.addHandler(caplog.handler)
+
+        try:
+            for level in LogLevels:
+                sut.write(LogEntry(level=level,
+                                   timestamp=datetime.datetime.now(),
+                                   message=level.name,
+                                   classname='TestLogChannel'))
+        finally:
+            logger.removeHandler(caplog.handler)
+
+        records = [record for record in caplog.records
+                   if record.name == 'testchannel']
+        assert [(record.getMessage(), record.levelno) for record in records] \
+            == [(level.name, expected_levels[level]) for level in LogLevels]
+
     def test_syslog_target_loading(self):
 
         """
@@ -25,6 +25,7 @@ Contains the unit tests of the LogEntry class.
 import os
 import sys
 import datetime
+import time
 
 # Dependency Imports
 import pytest
@@ -64,3 +65,50 @@ class TestLogEntry:
         assert sut.Timestamp == timestamp
         assert sut.Message == 'test'
         assert sut.Classname == self.__class__.__name__
+        assert not hasattr(sut, '__dict__')
+
+    def test_creation_with_posix_timestamp(self):
+
+        """
+        Tests that a log entry created with a POSIX timestamp returns it as a
+        UTC datetime.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        timestamp = time.time()
+
+        sut = LogEntry(level=LogLevels.DEBUG,
+                       timestamp=timestamp,
+                       message='test',
+                       classname=self.__class__.__name__)
+
+        assert sut.Timestamp == datetime.datetime.utcfromtimestamp(timestamp)
+        assert sut.Timestamp is sut.Timestamp
+
+    def test_message_with_arguments(self):
+
+        """
+        Tests that the arguments of a log entry are substituted in its message
+        when the message is accessed.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = LogEntry(level=LogLevels.DEBUG,
+                       timestamp=datetime.datetime.now(),
+                       message='test %s %d%%',
+                       classname=self.__class__.__name__,
+                       args=('message', 100))
+
+        assert sut.Message == 'test message 100%'
+        assert sut.Message == 'test message 100%'
+
+        sut = LogEntry(level=LogLevels.DEBUG,
+                       timestamp=datetime.datetime.now(),
+                       message='test 100%',
+                       classname=self.__class__.__name__)
+
+        assert sut.Message == 'test 100%'
@@ -0,0 +1,107 @@
+## ============================================================================
+##             **** Murasame Application Development Framework ****
+##                Copyright (C) 2019-2021, Suisei Entertainment
+## ============================================================================
+##
+##  Licensed under the Apache License, Version 2.0 (the "License");
+##  you may not use this file except in compliance with the License.
+##  You may obtain a copy of the License at
+##
+##      http://www.apache.org/licenses/LICENSE-2.0
+##
+##  Unless required by applicable law or agreed to in writing, software
+##  distributed under the License is distributed on an "AS IS" BASIS,
+##  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+##  See the License for the specific language governing permissions and
+##  limitations under the License.
+##
+## ============================================================================
+
+"""
+Contains the unit tests of the LogFormatter class.
+"""
+
+# Runtime Imports
+import os
+import sys
+import logging
+import time
+
+# Dependency Imports
+import pytest
+
+# Fix paths to make framework modules accessible
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Murasame Imports
+from murasame.log import LogFormatter, get_log_formatter
+
+def create_record(created: float) -> logging.LogRecord:
+
+    record = logging.LogRecord(
+        'test', logging.INFO, __file__, 1, 'test', None, None)
+    record.created = created
+    record.msecs = (created - int(created)) * 1000
+
+    return record
+
+class TestLogFormatter:
+
+    """
+    Contains the unit tests of the LogFormatter class.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    def test_formatting_time(self):
+
+        """
+        Tests that the time of the log records is formatted the same way as by
+        the standard formatter.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = LogFormatter(fmt='%(asctime)s', datefmt='%Y-%m-%d %H:%M:%S')
+        reference = logging.Formatter(fmt='%(asctime)s',
+                                      datefmt='%Y-%m-%d %H:%M:%S')
+
+        now = time.time()
+        for created in (now, now + 0.5, now + 1.0, now + 61.0):
+            record = create_record(created)
+            assert sut.format(record) == reference.format(record)
+
+    def test_formatting_time_without_date_format(self):
+
+        """
+        Tests that the milliseconds are added to the time when no date format
+        is specified.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = LogFormatter(fmt='%(asctime)s')
+        reference = logging.Formatter(fmt='%(asctime)s')
+
+        now = int(time.time())
+        for created in (now + 0.1, now + 0.9, now + 1.2):
+            record = create_record(created)
+            assert sut.format(record) == reference.format(record)
+
+    def test_shared_formatter(self):
+
+        """
+        Tests that the same formatter is returned for the same format strings.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = get_log_formatter(fmt='%(message)s', datefmt='%H:%M:%S')
+
+        assert isinstance(sut, LogFormatter)
+        assert get_log_formatter(fmt='%(message)s', datefmt='%H:%M:%S') is sut
+        assert get_log_formatter(fmt='%(message)s') is not sut
@@ -0,0 +1,327 @@
+## ============================================================================
+##             **** Murasame Application Development Framework ****
+##                Copyright (C) 2019-2021, Suisei Entertainment
+## ============================================================================
+##
+##  Licensed under the Apache License, Version 2.0 (the "License");
+##  you may not use this file except in compliance with the License.
+##  You may obtain a copy of the License at
+##
+##      http://www.apache.org/licenses/LICENSE-2.0
+##
+##  Unless required by applicable law or agreed to in writing, software
+##  distributed under the License is distributed on an "AS IS" BASIS,
+##  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+##  See the License for the specific language governing permissions and
+##  limitations under the License.
+##
+## ============================================================================
+
+
+"""
+Contains the unit tests of the log dispatcher of the LoggingSystem class.
+"""
+
+# Runtime Imports
+import datetime
+import gc
+import logging
+import os
+import sys
+import threading
+import time
+import weakref
+
+# Dependency Imports
+import pytest
+
+# Fix paths to make framework modules accessible
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Murasame Imports
+from murasame.log import (
+    LogChannel,
+    LogEntry,
+    LogLevels,
+    LogTarget,
+    register_target)
+from murasame.log.loggingsystem import LoggingSystem, _AsyncDispatcher
+
+@register_target('dispatchertest')
+class _DispatcherTestLogTarget(LogTarget):
+
+    """Log target that collects the log entries written to it, together with
+    the thread they were written on.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    def __init__(
+        self,
+        logger: 'Logger',
+        configuration: dict,
+        root_path: str = None) -> None:
+
+        super().__init__(logger=logger)
+
+        self.entries = []
+
+    def write(self, entry: 'LogEntry') -> None:
+        self.entries.append((entry.Message, threading.current_thread()))
+
+class _FlushTester:
+
+    """Log system replacement that records whether it has been flushed.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    def __init__(self) -> None:
+        self.flushed = threading.Event()
+
+    def flush(self) -> None:
+        self.flushed.set()
+
+TEST_CONFIGURATION = \
+{
+    'name': 'testchannel_dispatcher',
+    'defaultloglevel': 'INFO',
+    'targets':
+    [
+        {
+            'type': 'dispatchertest'
+        }
+    ]
+}
+
+class TestAsyncDispatcher:
+
+    """
+    Contains all unit tests of the log dispatcher.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    @staticmethod
+    def _write(channel: LogChannel, level: LogLevels, message: str,
+               args: tuple = ()) -> None:
+
+        channel.write(LogEntry(level=level,
+                               timestamp=datetime.datetime.now(),
+                               message=message,
+                               classname='TestAsyncDispatcher',
+                               args=args))
+
+    def test_background_write(self):
+
+        """
+        Tests that log entries are written on the background thread in the
+        order they were created.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        dispatcher = _AsyncDispatcher()
+        sut = LogChannel(configuration=TEST_CONFIGURATION,
+                         dispatcher=dispatcher)
+
+        # pylint: disable=protected-access
+        target = sut._targets[0]
+
+        for index in range(100):
+            self._write(sut, LogLevels.INFO, 'message %d', (index,))
+
+        dispatcher.flush()
+
+        assert [message for message, _ in target.entries] \
+            == [f'message {index}' for index in range(100)]
+        assert all(thread is not threading.current_thread()
+                   for _, thread in target.entries)
+
+        dispatcher.shutdown()
+
+    def test_error_write(self):
+
+        """
+        Tests that errors are written immediately, after the queued log
+        entries.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        dispatcher = _AsyncDispatcher()
+        sut = LogChannel(configuration=TEST_CONFIGURATION,
+                         dispatcher=dispatcher)
+
+        # pylint: disable=protected-access
+        target = sut._targets[0]
+
+        self._write(sut, LogLevels.INFO, 'first')
+        self._write(sut, LogLevels.ERROR, 'second')
+
+        assert [message for message, _ in target.entries] \
+            == ['first', 'second']
+        assert target.entries[1][1] is threading.current_thread()
+
+        dispatcher.shutdown()
+
+    def test_arguments_are_formatted_when_queued(self):
+
+        """
+        Tests that the message of a queued log entry is formatted with the
+        values its arguments had when the entry was written.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        dispatcher = _AsyncDispatcher()
+        sut = LogChannel(configuration=TEST_CONFIGURATION,
+                         dispatcher=dispatcher)
+
+        # pylint: disable=protected-access
+        target = sut._targets[0]
+
+        values = ['before']
+        self._write(sut, LogLevels.INFO, '%s', (values,))
+        values[0] = 'after'
+
+        dispatcher.flush()
+
+        assert target.entries[0][0] == "['before']"
+
+        dispatcher.shutdown()
+
+    def test_write_after_shutdown(self):
+
+        """
+        Tests that log entries are written synchronously after the dispatcher
+        has been shut down.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        dispatcher = _AsyncDispatcher()
+        sut = LogChannel(configuration=TEST_CONFIGURATION,
+                         dispatcher=dispatcher)
+
+        # pylint: disable=protected-access
+        target = sut._targets[0]
+
+        self._write(sut, LogLevels.INFO, 'queued')
+        dispatcher.shutdown()
+        self._write(sut, LogLevels.INFO, 'synchronous')
+
+        assert [message for message, _ in target.entries] \
+            == ['queued', 'synchronous']
+        assert target.entries[1][1] is threading.current_thread()
+
+    def test_record_of_queued_entry(self):
+
+        """
+        Tests that the logger records of queued log entries carry the time
+        and the thread of the writer, not those of the background thread.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+
+        dispatcher = _AsyncDispatcher()
+        sut = LogChannel(configuration=TEST_CONFIGURATION,
+                         dispatcher=dispatcher)
+        logger = logging.getLogger(sut.Name)
+        logger.addHandler(handler)
+
+        try:
+            before = time.time()
+            self._write(sut, LogLevels.INFO, 'queued')
+            after = time.time()
+            time.sleep(0.05)
+            dispatcher.flush()
+        finally:
+            logger.removeHandler(handler)
+            dispatcher.shutdown()
+
+        assert len(records) == 1
+        assert records[0].getMessage() == 'queued'
+        assert records[0].thread == threading.get_ident()
+        assert before <= records[0].created <= after
+
+    def test_periodic_flush(self):
+
+        """
+        Tests that the flush function of the dispatcher is called
+        periodically, even if no log entries are written.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        log_system = _FlushTester()
+
+        dispatcher = _AsyncDispatcher(flush_interval=0.01)
+        dispatcher.register(log_system)
+
+        assert log_system.flushed.wait(timeout=5)
+
+        dispatcher.shutdown()
+
+    def test_flush_without_thread(self):
+
+        """
+        Tests that flushing the dispatcher writes the queued log entries on
+        the calling thread if the background thread is no longer running.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        dispatcher = _AsyncDispatcher()
+        dispatcher.shutdown()
+
+        # Simulate a background thread that stopped unexpectedly
+        dispatcher._running = True
+        sut = LogChannel(configuration=TEST_CONFIGURATION,
+                         dispatcher=dispatcher)
+        target = sut._targets[0]
+
+        self._write(sut, LogLevels.INFO, 'queued')
+        dispatcher.flush()
+
+        assert target.entries == [('queued', threading.current_thread())]
+
+    def test_shared_dispatcher(self):
+
+        """
+        Tests that all log systems share the same background thread, and that
+        the dispatcher doesn't keep the log systems alive.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        log_systems = [LoggingSystem() for _ in range(3)]
+        references = [weakref.ref(log_system) for log_system in log_systems]
+
+        threads = [thread for thread in threading.enumerate()
+                   if thread.name == 'murasame.log']
+        assert len(threads) == 1
+
+        for log_system in log_systems:
+            log_system.shutdown()
+
+        del log_systems
+        del log_system
+        gc.collect()
+
+        assert all(reference() is None for reference in references)
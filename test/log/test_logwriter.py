@@ -23,6 +23,7 @@ Contains the unit tests of the LogWriter class.
 
 # Runtime Imports
 import os
+import subprocess
 import sys
 
 # Dependency Imports
@@ -33,7 +34,8 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 # Murasame Imports
 from murasame.utils import SystemLocator
-from murasame.log import LogLevels, LogWriter
+from murasame.log import LogLevels, LogWriter, get_log_writer
+from murasame.log.logwriter import LOG_WRITER_CACHE_SIZE
 from murasame.api import LoggingAPI
 
 class LoggingSystemTester:
@@ -46,6 +48,8 @@ class LoggingSystemTester:
         return LogLevels.INFO
     def write(self, entry):
         return
+    def write_many(self, entries):
+        return
 
 class TestLogWriter:
 
@@ -96,6 +100,118 @@ class TestLogWriter:
         assert sut.LogLevel == LogLevels.INFO
         SystemLocator.instance().reset()
 
+    def test_attaching_after_logging_service_registration(self):
+
+        """
+        Tests that a log writer attaches to its channel once the log service
+        is registered, and sends the cached entries to it.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        SystemLocator.instance().reset()
+
+        sut = LogWriter(channel_name='test', cache_entries=True)
+        sut.info('cached')
+        assert len(sut.CachedLogEntries) == 1
+
+        system = LoggingSystemTester()
+        sut.info('written')
+        assert not sut.CachedLogEntries
+        SystemLocator.instance().reset()
+
+    def test_attaching_is_not_retried_without_changes(self, monkeypatch):
+
+        """
+        Tests that a detached log writer only tries to attach again once the
+        registered systems have changed.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        SystemLocator.instance().reset()
+
+        sut = LogWriter(channel_name='test', cache_entries=True)
+
+        attempts = []
+        attach = LogWriter._attach
+
+        def counting_attach(self):
+            attempts.append(self)
+            return attach(self)
+
+        monkeypatch.setattr(LogWriter, '_attach', counting_attach)
+
+        sut.info('first')
+        sut.info('second')
+        assert not attempts
+
+        system = LoggingSystemTester()
+        sut.info('third')
+        assert len(attempts) == 1
+        SystemLocator.instance().reset()
+
+    def test_attached_writer_does_not_look_up_systems(self, monkeypatch):
+
+        """
+        Tests that an attached log writer doesn't look up the system locator
+        again while the registered systems don't change.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        SystemLocator.instance().reset()
+
+        system = LoggingSystemTester()
+        sut = LogWriter(channel_name='test')
+
+        lookups = []
+        instance = SystemLocator.instance
+
+        def counting_instance(*args, **kwargs):
+            lookups.append(args)
+            return instance(*args, **kwargs)
+
+        monkeypatch.setattr(SystemLocator, 'instance', counting_instance)
+
+        sut.info('first')
+        sut.info('second')
+        assert not lookups
+
+        monkeypatch.undo()
+        SystemLocator.instance().reset()
+
+    def test_reattaching_after_logging_service_reset(self):
+
+        """
+        Tests that a shared log writer attaches to the channel of the new log
+        service after the registered systems have been reset, and keeps an
+        overwritten log level.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        SystemLocator.instance().reset()
+
+        sut = get_log_writer(channel_name='test_reattach')
+        first_system = LoggingSystemTester()
+        sut.overwrite_log_level(LogLevels.DEBUG)
+        sut.info('first')
+        assert sut._channel is first_system
+
+        SystemLocator.instance().reset()
+        second_system = LoggingSystemTester()
+        sut.info('second')
+
+        assert sut._channel is second_system
+        assert get_log_writer(channel_name='test_reattach') is sut
+        assert sut.LogLevel == LogLevels.DEBUG
+        SystemLocator.instance().reset()
+
     def test_log_level_overwrite(self):
 
         """
@@ -205,6 +321,29 @@ class TestLogWriter:
         sut.debug(message='test')
         assert sut.CachedLogEntries[0].Message == 'test'
 
+    def test_debug_message_with_arguments(self):
+
+        """
+        Tests that arguments passed with a log message are substituted in the
+        message, and that filtered messages are not formatted.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        class Unformattable:
+            def __str__(self):
+                raise AssertionError('Filtered messages must not be formatted')
+
+        sut = LogWriter(channel_name='test', cache_entries=True)
+        sut.overwrite_log_level(new_log_level=LogLevels.INFO)
+        sut.debug('test %s', Unformattable())
+        assert sut.CachedLogEntries == []
+
+        sut.overwrite_log_level(new_log_level=LogLevels.DEBUG)
+        sut.debug('test %s', 'message')
+        assert sut.CachedLogEntries[0].Message == 'test message'
+
     def test_debug_message_with_log_level_below_debug(self):
 
         """
@@ -688,3 +827,118 @@ class TestLogWriter:
         sut = LogWriter(channel_name='test', cache_entries=True)
         sut.resume_logging()
         assert not sut.IsLoggingSuspended
+
+    def test_is_enabled_for_with_log_level_overwritten(self):
+
+        """
+        Tests that a log level is reported as enabled when it's not below the
+        log level of the writer.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = LogWriter(channel_name='test', cache_entries=True)
+        sut.overwrite_log_level(new_log_level=LogLevels.DEBUG)
+        assert sut.is_enabled_for(LogLevels.DEBUG)
+        assert sut.is_enabled_for(LogLevels.ERROR)
+        assert not sut.is_enabled_for(LogLevels.TRACE)
+
+    def test_is_enabled_for_with_logging_suspended(self):
+
+        """
+        Tests that no log level is reported as enabled when logging is
+        suspended.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = LogWriter(channel_name='test', cache_entries=True)
+        sut.overwrite_log_level(new_log_level=LogLevels.DEBUG)
+        sut.suspend_logging()
+        assert not sut.is_enabled_for(LogLevels.EMERGENCY)
+
+    def test_shared_log_writer(self):
+
+        """
+        Tests that the same log writer is returned for the same channel.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = get_log_writer(channel_name='test', cache_entries=True)
+        assert sut is get_log_writer(channel_name='test', cache_entries=True)
+        assert sut is not get_log_writer(channel_name='test2',
+                                         cache_entries=True)
+
+    def test_cache_size_limit(self):
+
+        """
+        Tests that the oldest cached log entries are dropped when the cache
+        is full.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = LogWriter(channel_name='test', cache_entries=True)
+        sut.overwrite_log_level(new_log_level=LogLevels.INFO)
+
+        for index in range(LOG_WRITER_CACHE_SIZE + 10):
+            sut.info('message %d', index)
+
+        entries = sut.CachedLogEntries
+        assert len(entries) == LOG_WRITER_CACHE_SIZE
+        assert entries[0].Message == 'message 10'
+        assert entries[-1].Message == f'message {LOG_WRITER_CACHE_SIZE + 9}'
+
+    def test_minimum_log_level_from_environment(self):
+
+        """
+        Tests that the log methods below the minimum log level set in the
+        environment are disabled.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        script = \
+            'from murasame.log import LogLevels, LogWriter\n' \
+            'sut = LogWriter(channel_name="test", cache_entries=True)\n' \
+            'sut.overwrite_log_level(new_log_level=LogLevels.TRACE)\n' \
+            'sut.trace("trace")\n' \
+            'sut.debug("debug")\n' \
+            'sut.info("info")\n' \
+            'assert [entry.Message for entry in sut.CachedLogEntries] \\\n' \
+            '    == ["info"]\n' \
+            'assert not sut.is_enabled_for(LogLevels.DEBUG)\n' \
+            'assert sut.is_enabled_for(LogLevels.INFO)\n'
+
+        environment = dict(os.environ, MURASAME_MIN_LOG_LEVEL='info')
+        result = subprocess.run(
+            [sys.executable, '-c', script],
+            cwd=os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')),
+            env=environment,
+            capture_output=True,
+            check=False)
+
+        assert result.returncode == 0, result.stderr.decode()
+
+    def test_class_name_of_entries(self):
+
+        """
+        Tests that log entries are sent with the class name of the writer.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        class DerivedLogWriter(LogWriter):
+            pass
+
+        sut = DerivedLogWriter(channel_name='test', cache_entries=True)
+        sut.overwrite_log_level(new_log_level=LogLevels.INFO)
+        sut.info('test')
+        assert sut.CachedLogEntries[0].Classname == 'DerivedLogWriter'
@@ -359,6 +359,35 @@ class TestVFSNode:
 
         assert data == SERIALIZED_NODE_DATA
 
+    def test_get_all_files(self):
+
+        """
+        Tests that file nodes can be retrieved from a VFS node and its
+        subdirectories.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = VFSNode(node_name='test1')
+        node2 = VFSNode(node_name='test2')
+        node3 = VFSNode(node_name='test3.conf', node_type=VFSNodeTypes.FILE)
+        node4 = VFSNode(node_name='test4.conf.bak', node_type=VFSNodeTypes.FILE)
+        node5 = VFSNode(node_name='test5.conf', node_type=VFSNodeTypes.FILE)
+
+        node2.add_node(node4)
+        node2.add_node(node5)
+
+        sut.add_node(node2)
+        sut.add_node(node3)
+
+        assert sut.get_all_files() == [node3]
+        assert len(sut.get_all_files(recursive=True)) == 3
+        assert len(sut.get_all_files(recursive=True,
+                                     filename_filter='.conf')) == 3
+        assert sut.get_all_files(recursive=True,
+                                 suffix='.conf') == [node3, node5]
+
     def test_deserialization(self):
 
         """
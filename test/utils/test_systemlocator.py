@@ -223,3 +223,32 @@ class TestSystemLocator:
         provider = SystemLocator.instance().get_provider(AbstractSystem)
 
         assert provider is None
+
+    def test_generation(self):
+
+        """
+        Tests that the generation of the system locator changes every time the
+        registered providers change.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        from systems.testsystem import AbstractSystem, ConcreteSystem
+        locator = SystemLocator.instance()
+        provider = ConcreteSystem()
+
+        generation = locator.Generation
+        locator.get_provider(AbstractSystem)
+        assert locator.Generation == generation
+
+        locator.register_provider(AbstractSystem, provider)
+        assert locator.Generation > generation
+
+        generation = locator.Generation
+        locator.unregister_provider(AbstractSystem, provider)
+        assert locator.Generation > generation
+
+        generation = locator.Generation
+        locator.reset()
+        assert locator.Generation > generation